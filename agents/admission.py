@@ -0,0 +1,418 @@
+"""
+ACS-Mentor V3.0 - Admission Control
+
+Gatekeeper in front of ACSCoordinator for bursty load:
+1. Bounded priority queue (e.g. error detection ahead of writing polish)
+2. Global and per-user concurrency caps
+3. Load shedding with a fast "busy" answer (queue full, queue timeout,
+   lower-priority requests evicted by higher-priority arrivals)
+4. Monthly budget guard from cost_management
+5. Queue-depth and wait-time metrics
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, Dict, List, Optional
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+import asyncio
+import bisect
+import itertools
+import json
+import os
+import threading
+import time
+
+from agents.fast_router import compile_keywords
+from agents.resilience import LatencyTracker
+
+
+DEFAULT_BUSY_MESSAGE = (
+    "ACS-Mentor is handling many requests right now. "
+    "Please try again in a minute."
+)
+
+
+class AdmissionRejected(Exception):
+    """A request was shed instead of being coordinated"""
+
+    def __init__(self, reason: str, busy_message: str = DEFAULT_BUSY_MESSAGE, retry_after: float = 30.0):
+        super().__init__(f"Request rejected: {reason}")
+        self.reason = reason  # queue_full, queue_timeout, evicted, budget
+        self.busy_message = busy_message
+        self.retry_after = retry_after
+
+
+@dataclass
+class Ticket:
+    """One admitted (or waiting) request"""
+    user_id: str
+    priority: str
+    rank: int
+    enqueued_at: float
+    started_at: Optional[float] = None
+    _future: Optional[asyncio.Future] = field(default=None, repr=False)
+
+    @property
+    def wait_seconds(self) -> float:
+        return (self.started_at or time.monotonic()) - self.enqueued_at
+
+
+class BudgetTracker:
+    """
+    Monthly spend against cost_management.monthly_budget_usd
+
+    Spend is estimated per query from cost_management.budget_per_query
+    (relative cost by number of specialists) times cost_per_unit_usd, and
+    optionally persisted so restarts keep the month's total.
+    """
+
+    _UNIT_KEYS = {1: 'single_specialist', 2: 'two_specialists', 3: 'three_specialists', 4: 'four_specialists'}
+
+    def __init__(
+        self,
+        monthly_budget_usd: float,
+        alert_at_percentage: float = 0.75,
+        cost_per_unit_usd: float = 0.05,
+        units_per_query: Optional[Dict[str, float]] = None,
+        persist_path: Optional[str] = None
+    ):
+        self.monthly_budget_usd = monthly_budget_usd
+        self.alert_at_percentage = alert_at_percentage
+        self.cost_per_unit_usd = cost_per_unit_usd
+        self.units_per_query = units_per_query or {}
+        self.persist_path = persist_path
+        self._lock = threading.Lock()
+        self._month = self._current_month()
+        self._spent = 0.0
+        self._alerted = False
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "BudgetTracker":
+        cost_config = config.get('cost_management', {})
+        budget_config = config.get('parameters', {}).get('admission', {}).get('budget', {})
+        return cls(
+            monthly_budget_usd=cost_config.get('monthly_budget_usd', 0.0),
+            alert_at_percentage=cost_config.get('alert_at_percentage', 0.75),
+            cost_per_unit_usd=budget_config.get('cost_per_unit_usd', 0.05),
+            units_per_query=cost_config.get('budget_per_query', {}),
+            persist_path=budget_config.get('persist_path')
+        )
+
+    @staticmethod
+    def _current_month() -> str:
+        return datetime.now().strftime("%Y-%m")
+
+    def _roll_month(self) -> None:
+        month = self._current_month()
+        if month != self._month:
+            self._month, self._spent, self._alerted = month, 0.0, False
+
+    def record_query(self, num_specialists: int) -> float:
+        """
+        Add the estimated cost of one coordinated query
+
+        Returns:
+            Estimated cost in USD
+        """
+        units = self.units_per_query.get(self._UNIT_KEYS.get(num_specialists, ''), max(1, num_specialists))
+        cost = units * self.cost_per_unit_usd
+        with self._lock:
+            self._roll_month()
+            self._spent += cost
+            if not self._alerted and self._status_locked() != 'ok':
+                self._alerted = True
+                print(f"Warning: Monthly budget at {self._spent / self.monthly_budget_usd:.0%} "
+                      f"(${self._spent:.2f} of ${self.monthly_budget_usd:.2f})")
+            self._save()
+        return cost
+
+    def _status_locked(self) -> str:
+        if self.monthly_budget_usd <= 0:
+            return 'ok'
+        fraction = self._spent / self.monthly_budget_usd
+        if fraction >= 1.0:
+            return 'exhausted'
+        if fraction >= self.alert_at_percentage:
+            return 'alert'
+        return 'ok'
+
+    def status(self) -> str:
+        """ok, alert (past alert_at_percentage) or exhausted"""
+        with self._lock:
+            self._roll_month()
+            return self._status_locked()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._roll_month()
+            return {
+                'month': self._month,
+                'spent_usd': round(self._spent, 4),
+                'budget_usd': self.monthly_budget_usd,
+                'status': self._status_locked()
+            }
+
+    def _load(self) -> None:
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('month') == self._month:
+                self._spent = float(state.get('spent_usd', 0.0))
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read budget state {self.persist_path}: {e}")
+
+    def _save(self) -> None:
+        if not self.persist_path:
+            return
+        directory = os.path.dirname(self.persist_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.persist_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'month': self._month, 'spent_usd': self._spent}, f)
+        os.replace(tmp_path, self.persist_path)
+
+
+class AdmissionController:
+    """
+    Bounded priority queue with concurrency caps
+
+    Usage:
+        admission = AdmissionController.from_config(config)
+        async with admission.admit(user_message, user_id="u42") as ticket:
+            answer = await coordinator.acoordinate(user_message)
+
+    All methods must be used from one event loop (the coordinator's
+    background loop when going through the synchronous API).
+    """
+
+    def __init__(
+        self,
+        priority_classes: Dict[str, List[str]],
+        default_priority: str = "normal",
+        max_concurrent: int = 8,
+        max_queue: int = 64,
+        per_user_max_concurrent: int = 2,
+        queue_timeout_seconds: float = 20.0,
+        busy_message: str = DEFAULT_BUSY_MESSAGE,
+        budget: Optional[BudgetTracker] = None,
+        alert_min_priority: Optional[str] = None,
+        exhausted_min_priority: Optional[str] = None
+    ):
+        """
+        Args:
+            priority_classes: Class name → query keywords, highest priority first
+            default_priority: Class for queries matching no keywords
+            max_concurrent: Coordinations running at once
+            max_queue: Waiting requests before shedding
+            per_user_max_concurrent: Coordinations per user at once
+            queue_timeout_seconds: Longest wait before a busy answer
+            busy_message: Text for shed requests
+            budget: Optional BudgetTracker
+            alert_min_priority: Lowest class admitted once the budget alert fires
+            exhausted_min_priority: Lowest class admitted once the budget is spent
+        """
+        self.priority_classes = priority_classes
+        # Class → keyword alternation (whole words, as in FastRouter)
+        self._class_patterns = {name: compile_keywords(keywords) for name, keywords in priority_classes.items()}
+        self.ranks = {name: rank for rank, name in enumerate(priority_classes)}
+        self.default_priority = default_priority if default_priority in self.ranks else list(self.ranks)[-1]
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.per_user_max_concurrent = max(1, per_user_max_concurrent)
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.busy_message = busy_message
+        self.budget = budget
+        self.alert_min_priority = alert_min_priority
+        self.exhausted_min_priority = exhausted_min_priority
+
+        self._queue: List[tuple] = []  # sorted (rank, seq, Ticket)
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._per_user: Counter = Counter()
+
+        self.admitted = 0
+        self.completed = 0
+        self.shed: Counter = Counter()
+        self.wait_times = LatencyTracker(window=1000)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["AdmissionController"]:
+        """
+        Build from parameters.admission (and cost_management for the budget)
+
+        Returns:
+            AdmissionController, or None if disabled
+        """
+        admission_config = config.get('parameters', {}).get('admission', {})
+        if not admission_config.get('enabled', False):
+            return None
+
+        budget_config = admission_config.get('budget', {})
+        return cls(
+            priority_classes=admission_config.get('priority_classes') or {'normal': []},
+            default_priority=admission_config.get('default_priority', 'normal'),
+            max_concurrent=admission_config.get('max_concurrent', 8),
+            max_queue=admission_config.get('max_queue', 64),
+            per_user_max_concurrent=admission_config.get('per_user_max_concurrent', 2),
+            queue_timeout_seconds=admission_config.get('queue_timeout_seconds', 20.0),
+            busy_message=admission_config.get('busy_message', DEFAULT_BUSY_MESSAGE),
+            budget=BudgetTracker.from_config(config) if budget_config.get('enabled', True) else None,
+            alert_min_priority=budget_config.get('alert_min_priority'),
+            exhausted_min_priority=budget_config.get('exhausted_min_priority')
+        )
+
+    def classify(self, user_message: str) -> str:
+        """Priority class from the first class whose keywords the query mentions"""
+        lowered = user_message.lower()
+        for name, pattern in self._class_patterns.items():
+            if pattern is not None and pattern.search(lowered):
+                return name
+        return self.default_priority
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        self.shed[reason] += 1
+        return AdmissionRejected(reason, self.busy_message, retry_after=self.queue_timeout_seconds)
+
+    def _budget_allows(self, rank: int) -> bool:
+        if self.budget is None:
+            return True
+        floor = {
+            'ok': None,
+            'alert': self.alert_min_priority,
+            'exhausted': self.exhausted_min_priority
+        }[self.budget.status()]
+        return floor not in self.ranks or rank <= self.ranks[floor]
+
+    def _can_start(self, user_id: str) -> bool:
+        return (self._in_flight < self.max_concurrent and
+                self._per_user[user_id] < self.per_user_max_concurrent)
+
+    def _start(self, ticket: Ticket) -> None:
+        ticket.started_at = time.monotonic()
+        self._in_flight += 1
+        self._per_user[ticket.user_id] += 1
+        self.admitted += 1
+        self.wait_times.record(ticket.wait_seconds)
+
+    async def acquire(
+        self,
+        user_message: str,
+        user_id: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> Ticket:
+        """
+        Wait for a slot
+
+        Args:
+            user_message: Query (used to classify priority)
+            user_id: Caller identity for per-user caps (anonymous if None)
+            priority: Explicit priority class (classified from the query if None)
+
+        Returns:
+            Ticket to pass to release()
+
+        Raises:
+            AdmissionRejected: Request shed (queue full, timeout, evicted, budget)
+        """
+        priority = priority if priority in self.ranks else self.classify(user_message)
+        ticket = Ticket(
+            user_id=user_id or "anonymous",
+            priority=priority,
+            rank=self.ranks[priority],
+            enqueued_at=time.monotonic()
+        )
+
+        if not self._budget_allows(ticket.rank):
+            raise self._reject('budget')
+
+        if not self._queue and self._can_start(ticket.user_id):
+            self._start(ticket)
+            return ticket
+
+        if len(self._queue) >= self.max_queue:
+            # Make room by shedding the lowest-priority, newest waiter
+            if not self._queue or self._queue[-1][0] <= ticket.rank:
+                raise self._reject('queue_full')
+            _, _, evicted = self._queue.pop()
+            evicted._future.set_exception(self._reject('evicted'))
+
+        ticket._future = asyncio.get_running_loop().create_future()
+        entry = (ticket.rank, next(self._seq), ticket)
+        bisect.insort(self._queue, entry, key=lambda e: e[:2])
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(ticket._future), self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            if ticket.started_at is not None:
+                # Admitted just as the timeout fired
+                return ticket
+            self._queue.remove(entry)
+            raise self._reject('queue_timeout')
+        except asyncio.CancelledError:
+            if ticket.started_at is not None:
+                self.release(ticket)
+            elif entry in self._queue:
+                self._queue.remove(entry)
+            raise
+        return ticket
+
+    def release(self, ticket: Ticket) -> None:
+        """Free a ticket's slot and admit waiters"""
+        self._in_flight -= 1
+        self._per_user[ticket.user_id] -= 1
+        if self._per_user[ticket.user_id] <= 0:
+            del self._per_user[ticket.user_id]
+        self.completed += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Start waiting tickets in priority order while slots are free"""
+        i = 0
+        while i < len(self._queue) and self._in_flight < self.max_concurrent:
+            ticket = self._queue[i][2]
+            if self._per_user[ticket.user_id] < self.per_user_max_concurrent:
+                del self._queue[i]
+                self._start(ticket)
+                ticket._future.set_result(None)
+            else:
+                i += 1
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        user_message: str,
+        user_id: Optional[str] = None,
+        priority: Optional[str] = None
+    ):
+        """acquire() / release() as an async context manager"""
+        ticket = await self.acquire(user_message, user_id, priority)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, in-flight count, shedding and wait-time statistics"""
+        depth_by_priority = Counter(entry[2].priority for entry in self._queue)
+        return {
+            'queue_depth': len(self._queue),
+            'queue_depth_by_priority': {name: depth_by_priority.get(name, 0) for name in self.ranks},
+            'in_flight': self._in_flight,
+            'max_concurrent': self.max_concurrent,
+            'admitted': self.admitted,
+            'completed': self.completed,
+            'shed': dict(self.shed),
+            'wait_p50_seconds': self.wait_times.percentile(0.5),
+            'wait_p95_seconds': self.wait_times.percentile(0.95),
+            'budget': self.budget.snapshot() if self.budget else None
+        }
@@ -0,0 +1,141 @@
+"""
+ACS-Mentor V3.0 - Async Helpers
+
+Shared plumbing for the async coordination path:
+1. Non-blocking LLM calls (native async when the client supports it)
+2. Token streaming from LLMs
+3. A persistent background event loop for the synchronous wrappers
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Awaitable, Iterator, List, Optional
+
+from agents.tracing import child_span, record_token_usage
+
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+async def acall_llm(llm, messages: List) -> Any:
+    """
+    Call a chat model without blocking the event loop
+
+    Uses the client's native async API when available and falls back to
+    running the blocking call in a worker thread.
+
+    Args:
+        llm: Chat model (LangChain-compatible)
+        messages: List of chat messages
+
+    Returns:
+        Model response (object with a .content attribute)
+    """
+    with child_span('llm', model=_model_name(llm)) as span:
+        if hasattr(llm, 'ainvoke'):
+            response = await llm.ainvoke(messages)
+        elif hasattr(llm, 'apredict_messages'):
+            response = await llm.apredict_messages(messages)
+        else:
+            response = await asyncio.to_thread(llm, messages)
+        record_token_usage(span, messages, response)
+        return response
+
+
+async def astream_llm(llm, messages: List) -> AsyncIterator[str]:
+    """
+    Stream a chat model's answer as text chunks
+
+    Clients without streaming support yield their whole answer as one chunk.
+
+    Args:
+        llm: Chat model (LangChain-compatible)
+        messages: List of chat messages
+
+    Yields:
+        Text chunks in order
+    """
+    if hasattr(llm, 'astream'):
+        with child_span('llm', activate=False, model=_model_name(llm), streamed=True) as span:
+            chunks = []
+            async for chunk in llm.astream(messages):
+                text = getattr(chunk, 'content', chunk)
+                if text:
+                    chunks.append(text)
+                    yield text
+            record_token_usage(span, messages, completion_text="".join(chunks))
+        return
+
+    response = await acall_llm(llm, messages)
+    yield response.content
+
+
+def _model_name(llm) -> str:
+    """Model identifier of a chat model, for tracing"""
+    return str(getattr(llm, 'model_name', None) or getattr(llm, 'model', None) or type(llm).__name__)
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the event loop used by synchronous wrappers"""
+    global _background_loop
+
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="acs-async-loop",
+                daemon=True
+            )
+            thread.start()
+            _background_loop = loop
+
+    return _background_loop
+
+
+def run_sync(coro: Awaitable) -> Any:
+    """
+    Run a coroutine to completion from synchronous code
+
+    All synchronous calls share one long-lived loop, so async LLM clients
+    (and their connection pools) stay bound to a single loop. Safe to call
+    from inside a running event loop, e.g. in notebooks.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    loop = _get_background_loop()
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def iterate_sync(agen) -> Iterator[Any]:
+    """
+    Consume an async generator from synchronous code
+
+    Items are produced on the shared background loop and yielded as they
+    arrive. Abandoning the iterator closes the async generator.
+
+    Args:
+        agen: Async generator
+
+    Yields:
+        Items of the async generator
+    """
+    loop = _get_background_loop()
+    try:
+        while True:
+            future = asyncio.run_coroutine_threadsafe(agen.__anext__(), loop)
+            try:
+                yield future.result()
+            except StopAsyncIteration:
+                break
+    finally:
+        asyncio.run_coroutine_threadsafe(agen.aclose(), loop).result()
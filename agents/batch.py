@@ -0,0 +1,140 @@
+"""
+ACS-Mentor V3.0 - Batch Coordination Helpers
+
+Building blocks for ACSCoordinator.coordinate_many (offline replay and
+re-grading of archived questions):
+1. Request normalization and coalescing of duplicate queries
+2. Async token-bucket rate limiter
+3. Per-item results with timing
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass, field
+import asyncio
+import time
+
+from agents.routing_cache import RoutingCache
+
+
+@dataclass
+class BatchRequest:
+    """One query of a batch"""
+    index: int
+    user_message: str
+    user_level: str
+    project_context: Optional[Dict]
+    key: str  # Coalescing key (normalized query, level, context digest)
+
+
+@dataclass
+class BatchResult:
+    """Result for one query of a batch, in input order"""
+    index: int
+    user_message: str
+    output: Optional[str]
+    error: Optional[str] = None
+    pattern: Optional[str] = None
+    specialists: List[str] = field(default_factory=list)
+    duplicate_of: Optional[int] = None  # Index of the query whose answer was reused
+    wait_seconds: float = 0.0  # Time queued for a worker / rate limit
+    route_seconds: float = 0.0
+    execute_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the query produced an answer"""
+        return self.error is None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Time spent routing and executing this query"""
+        return self.route_seconds + self.execute_seconds
+
+
+def build_requests(
+    queries: List[Union[str, Dict[str, Any]]],
+    user_level: str,
+    project_context: Optional[Dict]
+) -> List[BatchRequest]:
+    """
+    Normalize batch input
+
+    Args:
+        queries: Query strings, or dicts with user_message and optional
+            user_level / project_context overriding the batch defaults
+        user_level: Default user level
+        project_context: Default project context
+
+    Returns:
+        BatchRequests in input order
+    """
+    requests = []
+    for index, query in enumerate(queries):
+        if isinstance(query, str):
+            query = {'user_message': query}
+        message = query['user_message']
+        level = query.get('user_level', user_level)
+        context = query.get('project_context', project_context)
+        requests.append(BatchRequest(
+            index=index,
+            user_message=message,
+            user_level=level,
+            project_context=context,
+            key=RoutingCache.make_key(message, level, context)
+        ))
+    return requests
+
+
+def coalesce(requests: List[BatchRequest]) -> Dict[str, List[BatchRequest]]:
+    """
+    Group requests that normalize to the same query
+
+    Returns:
+        Key → requests sharing it, first occurrence first (insertion order
+        follows the first occurrence of each key)
+    """
+    groups: Dict[str, List[BatchRequest]] = {}
+    for request in requests:
+        groups.setdefault(request.key, []).append(request)
+    return groups
+
+
+class RateLimiter:
+    """
+    Async token bucket
+
+    Usage:
+        limiter = RateLimiter(rate=5, burst=5)
+        await limiter.acquire()  # waits until a token is available
+    """
+
+    def __init__(self, rate: Optional[float], burst: Optional[int] = None):
+        """
+        Args:
+            rate: Tokens per second (None or <= 0 disables limiting)
+            burst: Bucket size (defaults to max(1, rate))
+        """
+        self.rate = rate if rate and rate > 0 else None
+        self.capacity = burst or max(1, int(self.rate or 1))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available"""
+        if self.rate is None:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
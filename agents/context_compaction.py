@@ -0,0 +1,176 @@
+"""
+ACS-Mentor V3.0 - Handoff Context Compaction
+
+Replaces full upstream specialist outputs in sequential handoffs with a
+bounded digest, so prompt size stays flat along a handoff chain:
+1. Decisions (design, methods, sample size) from the plan-fact extractor
+2. Key numbers (alpha, power, effect sizes, follow-up, ...)
+3. References
+4. Extractive summary filling the remaining token budget
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Dict, List
+from dataclasses import dataclass, field
+import re
+
+from agents.extraction import extract_plan_facts, split_sentences
+from agents.tokens import estimate_tokens, truncate_to_tokens
+
+
+_KEY_NUMBER = re.compile(
+    r"(?:alpha|α|power|effect size|cohen'?s d|odds ratio|hazard ratio|relative risk|"
+    r"icc|dropout|attrition|follow-up|margin|confidence interval|\bci\b|p\s*[<=]|"
+    r"检验水准|把握度|效应量|失访|随访)"
+    r"[^.;\n。；]{0,40}?\d+(?:\.\d+)?\s*(?:%|weeks?|months?|years?|周|月|年)?",
+    re.IGNORECASE
+)
+
+_HEADING = re.compile(r"^(?:#+\s|\*\*[^*]+\*\*:?$|[-*]\s*$)")
+
+
+@dataclass
+class HandoffDigest:
+    """Compact representation of one upstream specialist output"""
+    specialist: str
+    decisions: str
+    numbers: List[str] = field(default_factory=list)
+    references: List[str] = field(default_factory=list)
+    summary: str = ""
+
+    def render(self) -> str:
+        """Digest text passed to downstream specialists"""
+        lines = [f"Decisions: {self.decisions}"]
+        if self.numbers:
+            lines.append(f"Key numbers: {'; '.join(self.numbers)}")
+        if self.references:
+            lines.append(f"References: {', '.join(self.references)}")
+        if self.summary:
+            lines.append(f"Summary: {self.summary}")
+        return "\n".join(lines)
+
+
+def extract_key_numbers(text: str, limit: int = 8) -> List[str]:
+    """
+    Numeric parameters stated in a specialist output
+
+    Args:
+        text: Specialist output
+        limit: Maximum items returned
+
+    Returns:
+        Matched phrases in order, deduplicated
+    """
+    found = []
+    for match in _KEY_NUMBER.finditer(text):
+        phrase = " ".join(match.group(0).split())
+        if phrase not in found:
+            found.append(phrase)
+            if len(found) >= limit:
+                break
+    return found
+
+
+def summarize(text: str, budget_tokens: int, priority_terms: List[str] = ()) -> str:
+    """
+    Extractive summary within a token budget
+
+    Sentences stating decisions or numbers come first, then the opening
+    sentences; the chosen sentences keep their original order.
+
+    Args:
+        text: Text to summarize
+        budget_tokens: Token budget
+        priority_terms: Lowercase terms marking important sentences
+
+    Returns:
+        Summary text (may be empty)
+    """
+    if budget_tokens <= 0:
+        return ""
+
+    sentences = [s for s in split_sentences(text) if not _HEADING.match(s)]
+
+    def rank(item):
+        position, sentence = item
+        lowered = sentence.lower()
+        important = any(term in lowered for term in priority_terms) or any(c.isdigit() for c in sentence)
+        return (0 if important else 1, position)
+
+    chosen, used = [], 0
+    for position, sentence in sorted(enumerate(sentences), key=rank):
+        cost = estimate_tokens(sentence) + 1
+        if used + cost > budget_tokens:
+            continue
+        chosen.append((position, sentence))
+        used += cost
+
+    if not chosen and sentences:
+        return truncate_to_tokens(sentences[0], budget_tokens)
+    return " ".join(sentence for _, sentence in sorted(chosen))
+
+
+def compact_output(output, budget_tokens: int) -> Dict:
+    """
+    Handoff entry for one upstream output
+
+    Outputs already within budget are passed through unchanged.
+
+    Args:
+        output: SpecialistOutput
+        budget_tokens: Token budget for this entry
+
+    Returns:
+        previous_specialist_outputs entry ('specialist', 'output',
+        'designs' extracted from the full output for downstream checks,
+        and 'compacted' / 'original_tokens' for reporting)
+    """
+    facts = extract_plan_facts(output.output)
+    original_tokens = estimate_tokens(output.output)
+    if original_tokens <= budget_tokens:
+        return {
+            'specialist': output.specialist_name,
+            'output': output.output,
+            'designs': sorted(facts.designs),
+            'compacted': False,
+            'original_tokens': original_tokens
+        }
+
+    digest = HandoffDigest(
+        specialist=output.specialist_name,
+        decisions=facts.summary(),
+        numbers=extract_key_numbers(output.output),
+        references=list(output.references)
+    )
+
+    priority_terms = [str(v).lower() for name in facts.FIELDS for v in getattr(facts, name)]
+    remaining = budget_tokens - estimate_tokens(digest.render()) - 3
+    digest.summary = summarize(output.output, remaining, priority_terms)
+
+    return {
+        'specialist': output.specialist_name,
+        'output': truncate_to_tokens(digest.render(), budget_tokens),
+        'designs': sorted(facts.designs),
+        'compacted': True,
+        'original_tokens': original_tokens
+    }
+
+
+def compact_handoff(outputs: List, budget_tokens: int) -> List[Dict]:
+    """
+    previous_specialist_outputs for a downstream specialist
+
+    Args:
+        outputs: Upstream SpecialistOutputs
+        budget_tokens: Total budget, split evenly across the outputs
+
+    Returns:
+        One entry per upstream output
+    """
+    if not outputs:
+        return []
+    per_output = max(1, budget_tokens // len(outputs))
+    return [compact_output(output, per_output) for output in outputs]
@@ -9,18 +9,42 @@ Version: 3.0.0
 Date: 2025-11-17
 """
 
-from typing import Dict, List, Optional, Union, Literal
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union, Literal
 import yaml
 import os
-from dataclasses import dataclass
+import asyncio
+import dataclasses
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from enum import Enum
 
-try:
-    from langchain.chat_models import ChatOpenAI
-    from langchain.schema import HumanMessage, SystemMessage, AIMessage
-    from langchain.prompts import ChatPromptTemplate
-except ImportError:
-    print("Warning: LangChain not installed. Install with: pip install langchain")
+from agents.async_utils import acall_llm, astream_llm, iterate_sync, run_sync
+from agents.fast_router import FastRouter, RouteAnalysis
+from agents.routing_cache import RoutingCache
+from agents.response_cache import SemanticResponseCache
+from agents.handoff_graph import HandoffGraph
+from agents.extraction import PlanFacts, extract_plan_facts, plans_agree, sentences_mentioning
+from agents.batch import BatchRequest, BatchResult, RateLimiter, build_requests, coalesce
+from agents.context_compaction import compact_handoff
+from agents.tracing import Tracer, current_span, record_token_usage
+from agents.http_pool import SharedHTTPClients
+from agents.llm_providers import HumanMessage, SystemMessage, create_chat_model
+from agents.prompt_assembly import compile_prompt
+from agents.admission import AdmissionController, AdmissionRejected
+from agents.model_tiers import ModelTier, ModelTierPolicy
+from agents.resilience import CircuitBreaker, ResiliencePolicy, SpecialistUnavailable, hedged
+from agents.local_synthesis import detect_conflicts, merge_outputs, unavailable_note
+from agents.tokens import estimate_tokens
+
+
+# Map router domains to specialists
+DOMAIN_SPECIALISTS = {
+    "design": "Design-Specialist",
+    "stats": "Stats-Specialist",
+    "writing": "Writing-Specialist",
+    "strategy": "Strategy-Advisor"
+}
 
 
 class CollaborationPattern(Enum):
@@ -39,6 +63,8 @@ class RoutingDecision:
     reasoning: str
     complexity_score: float
     domains: List[str]
+    confidence: float = 1.0
+    source: str = "llm"  # llm or fast_path
 
 
 @dataclass
@@ -49,6 +75,21 @@ class SpecialistOutput:
     output: str
     confidence: float
     references: List[str]  # Citations or guideline references
+    metadata: Dict = field(default_factory=dict)  # cache hits, model tier, etc.
+
+
+@dataclass
+class CoordinationEvent:
+    """Event emitted by coordinate_stream"""
+    type: str  # routing, specialist_start, specialist_end, synthesis_start, token, done
+    data: Dict = field(default_factory=dict)
+
+
+# Receives specialist start/end events while a stream is being served;
+# tasks spawned by the executors inherit it
+_event_sink: ContextVar[Optional[Callable[[CoordinationEvent], None]]] = ContextVar(
+    'acs_event_sink', default=None
+)
 
 
 class ACSCoordinator:
@@ -61,21 +102,46 @@ class ACSCoordinator:
     3. Coordinate sequential or parallel execution
     4. Synthesize multi-specialist outputs
     5. Maintain project-level context
+
+    Every step has an async variant (acoordinate, aanalyze_and_route, ...)
+    that makes non-blocking LLM calls; the synchronous methods are thin
+    wrappers that run the async path on a shared background event loop.
     """
 
-    def __init__(self, config_path: str = ".acs_mentor/multi_agent_config.yaml"):
+    def __init__(
+        self,
+        config_path: str = ".acs_mentor/multi_agent_config.yaml",
+        eager: Optional[bool] = None
+    ):
         """
         Initialize coordinator
 
         Args:
             config_path: Path to multi-agent configuration
+            eager: Preload all specialists now (see warm_up); defaults to
+                parameters.warm_pool.eager, lazy loading otherwise
         """
+        self.config_path = config_path
         self.config = self._load_config(config_path)
+        self._config_mtime = os.path.getmtime(config_path)
+        self.http_clients = SharedHTTPClients.from_config(self.config)
         self.llm = self._initialize_llm()
+        self._configure()
+        self.routing_cache = RoutingCache.from_config(self.config)
+        self.response_cache = SemanticResponseCache.from_config(self.config)
+        self.tracer = Tracer.from_config(self.config)
+        self.resilience = ResiliencePolicy.from_config(self.config)
+        self.admission = AdmissionController.from_config(self.config)
 
         # Lazy-load specialists (only initialize when needed)
         self._specialists = {}
 
+        warm_pool_config = self.config.get('parameters', {}).get('warm_pool', {})
+        self.eager = warm_pool_config.get('eager', False) if eager is None else eager
+        self.warm_status: Optional[Dict] = None
+        if self.eager:
+            self.warm_up(probe=warm_pool_config.get('probe', True))
+
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration"""
         if not os.path.exists(config_path):
@@ -84,15 +150,126 @@ class ACSCoordinator:
         with open(config_path, 'r', encoding='utf-8') as f:
             return yaml.safe_load(f)
 
-    def _initialize_llm(self):
-        """Initialize LLM for coordinator"""
+    def _configure(self):
+        """Derive runtime settings from the loaded configuration"""
+        parameters = self.config.get('parameters', {})
+        self.performance_config = parameters.get('performance', {})
+        self.routing_config = parameters.get('routing', {})
+        self.speculation_config = parameters.get('speculation', {})
+        self.synthesis_config = parameters.get('synthesis', {})
+        self.router = FastRouter.from_config(self.config)
+        self.handoff_graph = HandoffGraph.from_config(self.config)
+        self.model_tier_policy = ModelTierPolicy.from_config(self.config)
+        logging_config = self.config.get('monitoring', {}).get('logging', {})
+        self.verbose = logging_config.get('verbose', False)
+        self.log_routing = logging_config.get('log_routing_decisions', True)
+        self.routing_prompt = compile_prompt(self.config, 'coordinator', 'routing_prompt')
+        self.synthesis_prompt = compile_prompt(self.config, 'coordinator', 'synthesis_prompt')
+        self._tier_llms = {}  # ModelTier → coordinator LLM client
+
+    def _reload_config_if_changed(self) -> bool:
+        """
+        Reload configuration if the config file changed on disk
+
+        Cached routing decisions and initialized specialists depend on the
+        configuration, so both are dropped.
+
+        Returns:
+            True if the configuration was reloaded
+        """
+        try:
+            mtime = os.path.getmtime(self.config_path)
+        except OSError:
+            return False
+
+        if mtime == self._config_mtime:
+            return False
+
+        self.config = self._load_config(self.config_path)
+        self._config_mtime = mtime
+        self.llm = self._initialize_llm()
+        self._configure()
+
+        cache_config = self.routing_config.get('cache', {})
+        self.routing_cache.max_entries = cache_config.get('max_entries', self.routing_cache.max_entries)
+        self.routing_cache.ttl_seconds = cache_config.get('ttl_seconds', self.routing_cache.ttl_seconds)
+        self.routing_cache.invalidate()
+        self._specialists = {}
+        if self.eager:
+            self.warm_up(probe=False)
+
+        print(f"[Coordinator] Config changed, reloaded {self.config_path}")
+        return True
+
+    def _initialize_llm(self, tier: Optional[ModelTier] = None):
+        """
+        Initialize LLM for coordinator
+
+        Args:
+            tier: Optional ModelTier overriding model / max_tokens / temperature
+        """
         llm_config = self.config.get('coordinator', {}).get('llm_config', {})
+        temperature = llm_config.get('temperature', 0.3)
+        max_tokens = llm_config.get('max_tokens', 2000)
+        model = llm_config.get('model', 'gpt-4')
+        if tier is not None:
+            model = tier.model
+            temperature = temperature if tier.temperature is None else tier.temperature
+            max_tokens = max_tokens if tier.max_tokens is None else tier.max_tokens
+
+        return create_chat_model(
+            self.config,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **(self.http_clients.llm_kwargs() if self.http_clients else {})
+        )
+
+    def _synthesis_llm(self, tier: Optional[ModelTier] = None):
+        """Coordinator LLM for synthesis at the given tier"""
+        if tier is None:
+            return self.llm
+        if tier not in self._tier_llms:
+            self._tier_llms[tier] = self._initialize_llm(tier)
+        return self._tier_llms[tier]
 
-        return ChatOpenAI(
-            model=llm_config.get('model', 'gpt-4'),
-            temperature=llm_config.get('temperature', 0.3),
-            max_tokens=llm_config.get('max_tokens', 2000)
+    def _with_model_tiers(self, routing_decision: RoutingDecision, context: Dict) -> Dict:
+        """
+        Context extended with the complexity score and, if tiering is
+        enabled, the model tier of each routed specialist and the coordinator
+
+        Args:
+            routing_decision: Routing decision
+            context: Context for the specialists
+
+        Returns:
+            New context dict
+        """
+        context = dict(context, complexity_score=routing_decision.complexity_score)
+        if self.model_tier_policy is None:
+            return context
+
+        tiers = self.model_tier_policy.select_for_route(
+            routing_decision.specialists,
+            routing_decision.complexity_score,
+            context.get('user_level', 'intermediate')
         )
+        context['model_tiers'] = tiers
+        current_span().set('model_tiers', {name: tier.name for name, tier in tiers.items()})
+        self._log(f"Model tiers: {', '.join(f'{name}={tier.name}' for name, tier in tiers.items())}")
+        return context
+
+    def _log(self, message: str):
+        """Per-request progress line, printed only with monitoring.logging.verbose"""
+        if self.verbose:
+            print(f"[Coordinator] {message}")
+
+    def _record_failure(self, specialist_name: str, breaker, span=None):
+        """Count a failed call; the trace notes when it opens the circuit"""
+        if breaker.record_failure():
+            span = span or current_span()
+            span.set('circuit_opened', span.attributes.get('circuit_opened', []) + [specialist_name])
+            self._log(f"Circuit opened for {specialist_name} after {breaker.failures} failures")
 
     def _get_specialist(self, specialist_name: str):
         """
@@ -114,19 +291,77 @@ class ACSCoordinator:
         )
 
         if specialist_name == "Design-Specialist":
-            specialist = DesignSpecialist(self.config)
+            specialist = DesignSpecialist(self.config, self.response_cache, self.http_clients)
         elif specialist_name == "Stats-Specialist":
-            specialist = StatsSpecialist(self.config)
+            specialist = StatsSpecialist(self.config, self.response_cache, self.http_clients)
         elif specialist_name == "Writing-Specialist":
-            specialist = WritingSpecialist(self.config)
+            specialist = WritingSpecialist(self.config, self.response_cache, self.http_clients)
         elif specialist_name == "Strategy-Advisor":
-            specialist = StrategyAdvisor(self.config)
+            specialist = StrategyAdvisor(self.config, self.response_cache, self.http_clients)
         else:
             raise ValueError(f"Unknown specialist: {specialist_name}")
 
         self._specialists[specialist_name] = specialist
         return specialist
 
+    def warm_up(self, probe: bool = True) -> Dict:
+        """
+        Eagerly initialize everything the first request would otherwise pay for
+
+        Loads all specialists (and their LLM clients), their response-cache
+        snapshots and knowledge indexes, and optionally sends one tiny
+        request through the shared connection pool as a health probe. The result is kept in
+        self.warm_status for readiness checks.
+
+        Args:
+            probe: Also make a minimal LLM call to verify the API is reachable
+
+        Returns:
+            Warm-up report: specialists, seconds, probe result and ready flag
+        """
+        started = time.perf_counter()
+        loaded, errors = [], {}
+        for specialist_name in DOMAIN_SPECIALISTS.values():
+            try:
+                self._get_specialist(specialist_name)
+                loaded.append(specialist_name)
+            except Exception as e:
+                errors[specialist_name] = str(e)
+
+        if self.response_cache is not None:
+            self.response_cache.preload(loaded)
+
+        # Open (or build) the specialists' knowledge indexes
+        for specialist in self._specialists.values():
+            if specialist.knowledge is not None:
+                specialist.knowledge.index(specialist.knowledge_domain)
+
+        probe_result = run_sync(self._aprobe()) if probe else None
+
+        self.warm_status = {
+            'specialists': loaded,
+            'errors': errors,
+            'probe': probe_result,
+            'seconds': time.perf_counter() - started,
+            'ready': not errors and (probe_result is None or probe_result['ok'])
+        }
+        print(f"[Coordinator] Warm-up: {len(loaded)} specialists in "
+              f"{self.warm_status['seconds']:.2f}s, ready={self.warm_status['ready']}")
+        return self.warm_status
+
+    async def _aprobe(self) -> Dict:
+        """Minimal LLM round trip (also opens a pooled connection)"""
+        started = time.perf_counter()
+        try:
+            await acall_llm(self.llm, [HumanMessage(content="Reply with OK.")])
+            return {'ok': True, 'latency_seconds': time.perf_counter() - started}
+        except Exception as e:
+            return {
+                'ok': False,
+                'latency_seconds': time.perf_counter() - started,
+                'error': f"{type(e).__name__}: {e}"
+            }
+
     def analyze_and_route(
         self,
         user_message: str,
@@ -144,33 +379,82 @@ class ACSCoordinator:
         Returns:
             RoutingDecision with pattern and specialists
         """
-        # Build routing prompt
-        routing_prompt = self.config['coordinator']['prompts']['routing_prompt']
-        filled_prompt = routing_prompt.format(
+        return run_sync(self.aanalyze_and_route(user_message, user_level, project_context))
+
+    async def aanalyze_and_route(
+        self,
+        user_message: str,
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None
+    ) -> RoutingDecision:
+        """Async version of analyze_and_route"""
+        self._reload_config_if_changed()
+
+        with self.tracer.span('routing') as span:
+            # Near-identical questions are answered from the routing cache
+            use_cache = self.routing_config.get('cache', {}).get('enabled', True)
+            routing_decision = None
+            if use_cache:
+                cache_key = RoutingCache.make_key(user_message, user_level, project_context)
+                routing_decision = self.routing_cache.get(cache_key)
+            span.set('cache_hit', routing_decision is not None)
+
+            if routing_decision is None:
+                routing_decision = await self._aroute(user_message, user_level, project_context)
+                if use_cache:
+                    self.routing_cache.put(cache_key, routing_decision)
+
+            span.set('source', routing_decision.source)
+            span.set('pattern', routing_decision.pattern.value)
+            span.set('specialists', list(routing_decision.specialists))
+
+        return routing_decision
+
+    async def _aroute(
+        self,
+        user_message: str,
+        user_level: str,
+        project_context: Optional[Dict]
+    ) -> RoutingDecision:
+        """Compute a routing decision (fast path first, then LLM)"""
+        # Fast path: unambiguous queries are routed without an LLM call
+        analysis = self.router.analyze(user_message, project_context)
+        if (self.routing_config.get('fast_path_enabled', True) and
+                analysis.confidence >= self.routing_config.get('confidence_threshold', 0.8)):
+            return self._build_routing_decision(
+                analysis,
+                reasoning=f"Fast-path keyword routing (matched: {', '.join(analysis.matched_keywords)})",
+                source="fast_path"
+            )
+
+        # Build routing prompt (static instructions first, query last)
+        prompt = self.routing_prompt.assemble(
             user_message=user_message,
             user_level=user_level,
             project_context=project_context or "None"
         )
+        current_span().set('prompt_prefix_tokens', prompt.prefix_tokens)
 
         messages = [
-            SystemMessage(content=self.config['coordinator']['prompts']['system_prompt']),
-            HumanMessage(content=filled_prompt)
+            SystemMessage(content=prompt.system),
+            HumanMessage(content=prompt.user)
         ]
 
         # Get routing decision from LLM
-        response = self.llm(messages)
+        response = await acall_llm(self.llm, messages)
         decision_text = response.content
 
         # Parse decision (in production, use structured output)
         # For now, use heuristics
-        routing_decision = self._parse_routing_decision(decision_text, user_message)
+        routing_decision = self._parse_routing_decision(decision_text, user_message, analysis)
 
         return routing_decision
 
     def _parse_routing_decision(
         self,
         decision_text: str,
-        user_message: str
+        user_message: str,
+        analysis: Optional[RouteAnalysis] = None
     ) -> RoutingDecision:
         """
         Parse LLM's routing decision
@@ -178,32 +462,37 @@ class ACSCoordinator:
         Args:
             decision_text: LLM's decision text
             user_message: Original query
+            analysis: Fast-path analysis of the query (computed if omitted)
 
         Returns:
             Structured RoutingDecision
         """
         # Simple heuristic-based parsing (in production, use structured output)
+        if analysis is None:
+            analysis = self.router.analyze(user_message)
 
-        # Detect domains
-        domains = []
-        if any(kw in user_message.lower() for kw in ["design", "study", "rct", "cohort", "sample"]):
-            domains.append("design")
-        if any(kw in user_message.lower() for kw in ["statistical", "analysis", "test", "power", "regression"]):
-            domains.append("stats")
-        if any(kw in user_message.lower() for kw in ["write", "manuscript", "methods", "results", "discussion"]):
-            domains.append("writing")
-        if any(kw in user_message.lower() for kw in ["strategy", "career", "publication", "journal", "feasibility"]):
-            domains.append("strategy")
-
-        # Map domains to specialists
-        specialist_map = {
-            "design": "Design-Specialist",
-            "stats": "Stats-Specialist",
-            "writing": "Writing-Specialist",
-            "strategy": "Strategy-Advisor"
-        }
+        return self._build_routing_decision(analysis, reasoning=decision_text, source="llm")
+
+    def _build_routing_decision(
+        self,
+        analysis: RouteAnalysis,
+        reasoning: str,
+        source: str
+    ) -> RoutingDecision:
+        """
+        Turn detected domains into a routing decision
 
-        specialists = [specialist_map[d] for d in domains if d in specialist_map]
+        Args:
+            analysis: Fast-path analysis of the query
+            reasoning: Explanation to record on the decision
+            source: Which router produced the decision
+
+        Returns:
+            RoutingDecision
+        """
+        domains = list(analysis.domains)
+
+        specialists = [DOMAIN_SPECIALISTS[d] for d in domains if d in DOMAIN_SPECIALISTS]
 
         # Determine pattern
         if len(specialists) == 0:
@@ -213,21 +502,24 @@ class ACSCoordinator:
         elif len(specialists) == 1:
             pattern = CollaborationPattern.SINGLE
         elif "design" in domains and "stats" in domains:
-            # Design → Stats is a common sequence
-            pattern = CollaborationPattern.SEQUENTIAL
+            if source == "llm" and "iterative" in reasoning.lower():
+                # Coordinator asked for back-and-forth between Design and Stats
+                pattern = CollaborationPattern.ITERATIVE
+            else:
+                # Design → Stats is a common sequence
+                pattern = CollaborationPattern.SEQUENTIAL
         else:
             # Multiple independent domains
             pattern = CollaborationPattern.PARALLEL
 
-        # Estimate complexity
-        complexity_score = min(len(domains) * 0.3 + 0.3, 1.0)
-
         return RoutingDecision(
             pattern=pattern,
             specialists=specialists,
-            reasoning=decision_text,
-            complexity_score=complexity_score,
-            domains=domains
+            reasoning=reasoning,
+            complexity_score=analysis.complexity_score,
+            domains=domains,
+            confidence=analysis.confidence,
+            source=source
         )
 
     def execute_single(
@@ -245,11 +537,20 @@ class ACSCoordinator:
             context: Additional context
 
         Returns:
-            SpecialistOutput
+            SpecialistOutput (raises SpecialistUnavailable if the specialist
+            fails, times out or its circuit is open)
         """
-        specialist = self._get_specialist(specialist_name)
-        output = specialist.consult(user_message, context)
-        return output
+        return run_sync(self.aexecute_single(specialist_name, user_message, context))
+
+    async def aexecute_single(
+        self,
+        specialist_name: str,
+        user_message: str,
+        context: Optional[Dict] = None,
+        speculative: Optional[Dict[str, asyncio.Task]] = None
+    ) -> SpecialistOutput:
+        """Async version of execute_single (speculative: see _aconsult)"""
+        return await self._aconsult_resilient(specialist_name, user_message, context, speculative)
 
     def execute_sequential(
         self,
@@ -258,7 +559,12 @@ class ACSCoordinator:
         context: Optional[Dict] = None
     ) -> List[SpecialistOutput]:
         """
-        Execute sequential consultation (each builds on previous)
+        Execute sequential consultation (each builds on its inputs)
+
+        The input_from declarations of collaboration_patterns.sequential_handoff
+        are compiled into a dependency graph: each specialist starts as soon
+        as the specialists it takes input from have finished, so independent
+        steps run concurrently (at most max_specialists_parallel at a time).
 
         Args:
             specialists: Ordered list of specialists
@@ -266,24 +572,339 @@ class ACSCoordinator:
             context: Additional context
 
         Returns:
-            List of SpecialistOutputs in order
+            List of SpecialistOutputs in order (specialists that fail are
+            skipped; their dependents build on the remaining inputs)
         """
-        outputs = []
-        cumulative_context = context or {}
+        return run_sync(self.aexecute_sequential(specialists, user_message, context))
 
-        for specialist_name in specialists:
-            # Add previous outputs to context
-            if outputs:
-                cumulative_context['previous_specialist_outputs'] = [
-                    {'specialist': o.specialist_name, 'output': o.output}
-                    for o in outputs
-                ]
+    async def aexecute_sequential(
+        self,
+        specialists: List[str],
+        user_message: str,
+        context: Optional[Dict] = None,
+        speculative: Optional[Dict[str, asyncio.Task]] = None
+    ) -> List[SpecialistOutput]:
+        """Async version of execute_sequential (speculative: see _aconsult)"""
+        steps = self.handoff_graph.compile(specialists)
+        semaphore = asyncio.Semaphore(max(1, self.performance_config.get('max_specialists_parallel', 3)))
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run(step) -> Optional[SpecialistOutput]:
+            # Unavailable inputs are skipped; the step builds on the rest
+            upstream = [
+                output for output in [await tasks[name] for name in step.depends_on]
+                if output is not None
+            ]
 
-            specialist = self._get_specialist(specialist_name)
-            output = specialist.consult(user_message, cumulative_context)
-            outputs.append(output)
+            step_context = dict(context or {})
+            if upstream:
+                # Add input specialists' outputs (or their digests) to context
+                step_context['previous_specialist_outputs'] = self._handoff_inputs(
+                    step.specialist, upstream
+                )
 
-        return outputs
+            queued_at = time.monotonic()
+            async with semaphore:
+                try:
+                    return await self._aconsult_resilient(
+                        step.specialist, user_message, step_context, speculative, queued_at
+                    )
+                except SpecialistUnavailable as e:
+                    print(f"[Coordinator] {e}, skipping")
+                    return None
+
+        # Steps are in topological order, so inputs are scheduled first
+        for step in steps:
+            tasks[step.specialist] = asyncio.create_task(run(step))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+
+        results = [tasks[name].result() for name in dict.fromkeys(specialists)]
+        return [output for output in results if output is not None]
+
+    def _handoff_inputs(self, specialist_name: str, upstream: List[SpecialistOutput]) -> List[Dict]:
+        """
+        previous_specialist_outputs for one handoff step
+
+        With parameters.handoff.compaction_enabled, upstream outputs are
+        reduced to digests (decisions, key numbers, references, summary)
+        within the receiving specialist's token budget.
+        """
+        handoff_config = self.config.get('parameters', {}).get('handoff', {})
+        if not handoff_config.get('compaction_enabled', False):
+            return [
+                {
+                    'specialist': o.specialist_name,
+                    'output': o.output,
+                    'designs': sorted(extract_plan_facts(o.output).designs)
+                }
+                for o in upstream
+            ]
+
+        budget = handoff_config.get('budget_tokens', {}).get(
+            specialist_name, handoff_config.get('default_budget_tokens', 400)
+        )
+        entries = compact_handoff(upstream, budget)
+
+        original = sum(e['original_tokens'] for e in entries)
+        compacted = sum(estimate_tokens(e['output']) for e in entries)
+        if compacted < original:
+            self._log(f"Handoff to {specialist_name}: {original} → {compacted} tokens")
+        return entries
+
+    def execute_iterative(
+        self,
+        specialists: List[str],
+        user_message: str,
+        context: Optional[Dict] = None
+    ) -> List[SpecialistOutput]:
+        """
+        Execute iterative refinement until specialists agree
+
+        Round 1 is a normal sequential handoff. In later rounds each
+        specialist receives only what changed in the other specialists'
+        plans since it last saw them (iteration_feedback), not the full
+        history. Designs, methods and sample sizes are extracted from each
+        output; refinement stops as soon as they agree or stop changing,
+        or after collaboration_patterns.iterative_refinement.max_iterations.
+
+        Args:
+            specialists: Specialists taking part (e.g. Design and Stats)
+            user_message: User's query
+            context: Additional context
+
+        Returns:
+            Final SpecialistOutputs in specialist order
+        """
+        return run_sync(self.aexecute_iterative(specialists, user_message, context))
+
+    async def aexecute_iterative(
+        self,
+        specialists: List[str],
+        user_message: str,
+        context: Optional[Dict] = None,
+        speculative: Optional[Dict[str, asyncio.Task]] = None
+    ) -> List[SpecialistOutput]:
+        """Async version of execute_iterative (speculative: see _aconsult)"""
+        max_iterations = (
+            self.config.get('collaboration_patterns', {})
+            .get('iterative_refinement', {})
+            .get('max_iterations', 3)
+        )
+
+        # Round 1: initial plans via the normal handoff
+        first_round = await self.aexecute_sequential(specialists, user_message, context, speculative)
+        latest = {o.specialist_name: o for o in first_round}
+        facts = {name: extract_plan_facts(o.output) for name, o in latest.items()}
+        names = list(latest)
+
+        # What each specialist last saw of every other specialist's plan
+        seen = {name: {other: PlanFacts() for other in names if other != name} for name in names}
+        for i, name in enumerate(names):
+            for other in names[:i]:
+                seen[name][other] = facts[other]
+
+        for iteration in range(2, max_iterations + 1):
+            if plans_agree(list(facts.values())):
+                break
+
+            changed = False
+            for name in names:
+                if plans_agree(list(facts.values())):
+                    # An earlier specialist in this round closed the gap
+                    break
+
+                feedback = []
+                for other in names:
+                    if other == name:
+                        continue
+                    delta = facts[other].diff(seen[name][other])
+                    if delta:
+                        terms = [v for change in delta.values() for v in change['added']]
+                        feedback.append({
+                            'specialist': other,
+                            'changes': delta,
+                            'excerpts': sentences_mentioning(latest[other].output, terms)
+                        })
+                        seen[name][other] = facts[other]
+                if not feedback:
+                    continue
+
+                round_context = dict(context or {})
+                round_context['iteration_feedback'] = {
+                    'iteration': iteration,
+                    'your_previous_plan': facts[name].summary(),
+                    'updates': feedback
+                }
+                try:
+                    output = await self._aconsult_resilient(name, user_message, round_context)
+                except SpecialistUnavailable as e:
+                    # Keep the specialist's previous plan
+                    print(f"[Coordinator] {e}, keeping its previous plan")
+                    continue
+
+                new_facts = extract_plan_facts(output.output)
+                changed = changed or bool(new_facts.diff(facts[name]))
+                latest[name], facts[name] = output, new_facts
+
+            if not changed:
+                # Nobody moved: further rounds would not converge either
+                break
+
+        return [latest[name] for name in names]
+
+    def _emit(self, event_type: str, **data):
+        """Send an event to the active stream, if any"""
+        sink = _event_sink.get()
+        if sink is not None:
+            sink(CoordinationEvent(event_type, data))
+
+    async def _aconsult(
+        self,
+        specialist_name: str,
+        user_message: str,
+        context: Optional[Dict] = None,
+        speculative: Optional[Dict[str, asyncio.Task]] = None,
+        queued_at: Optional[float] = None,
+        hedge_delay: Optional[float] = None
+    ) -> SpecialistOutput:
+        """
+        Consult one specialist (every executor goes through here)
+
+        Args:
+            specialist_name: Which specialist to consult
+            user_message: User's query
+            context: Additional context
+            speculative: Consultations started before routing finished;
+                a matching one is claimed instead of calling the LLM again
+                (only when no upstream outputs are involved)
+            queued_at: time.monotonic() when the executor started waiting
+                for a slot, recorded as the span's queue wait
+            hedge_delay: Start a duplicate LLM call if the first has not
+                answered after this many seconds (None: no hedging)
+
+        Returns:
+            SpecialistOutput
+        """
+        specialist = self._get_specialist(specialist_name)
+        self._emit('specialist_start', specialist=specialist_name)
+
+        with self.tracer.span('specialist', specialist=specialist_name) as span:
+            if queued_at is not None:
+                span.set('queue_wait_seconds', time.monotonic() - queued_at)
+            handoff = (context or {}).get('previous_specialist_outputs', [])
+            span.set('handoff_inputs', len(handoff))
+            if any(entry.get('compacted') for entry in handoff):
+                span.set('handoff_original_tokens', sum(entry['original_tokens'] for entry in handoff))
+                span.set('handoff_tokens', sum(estimate_tokens(entry['output']) for entry in handoff))
+
+            task = None
+            if speculative and not (context or {}).get('previous_specialist_outputs'):
+                task = speculative.pop(specialist_name, None)
+
+            if task is not None:
+                output = await task
+                # The prediction may have picked another model tier than the final route
+                tier = ((context or {}).get('model_tiers') or {}).get(specialist_name)
+                if tier is not None and output.metadata.get('model_tier', {}).get('tier') != tier.name:
+                    task = None
+            span.set('speculative', task is not None)
+
+            if task is None:
+                output, attempts = await hedged(
+                    lambda: specialist.aconsult(user_message, context),
+                    hedge_delay,
+                    self.resilience.max_hedges
+                )
+                span.set('hedged', attempts > 1)
+            span.set('cache_hit', output.metadata.get('cache', {}).get('hit', False))
+            if 'model_tier' in output.metadata:
+                span.set('model_tier', output.metadata['model_tier']['tier'])
+
+        self._emit(
+            'specialist_end',
+            specialist=specialist_name,
+            confidence=output.confidence,
+            references=output.references
+        )
+        return output
+
+    async def _aconsult_resilient(
+        self,
+        specialist_name: str,
+        user_message: str,
+        context: Optional[Dict] = None,
+        speculative: Optional[Dict[str, asyncio.Task]] = None,
+        queued_at: Optional[float] = None
+    ) -> SpecialistOutput:
+        """
+        Consult a specialist with failure isolation
+
+        Within timeout_per_specialist seconds (from the moment the specialist
+        gets a slot, retries included): slow calls are hedged after the
+        specialist's recent p95 latency, and failed calls are retried up to
+        retry_on_failure times with jittered backoff. Failures count against
+        the specialist's circuit breaker; while it is open the specialist is
+        skipped immediately.
+
+        Args:
+            specialist_name: Which specialist to consult
+            user_message: User's query
+            context: Additional context
+            speculative: See _aconsult
+            queued_at: See _aconsult
+
+        Returns:
+            SpecialistOutput (raises SpecialistUnavailable if it cannot answer)
+        """
+        policy = self.resilience
+        breaker = policy.breaker(specialist_name)
+        if not breaker.allow():
+            raise SpecialistUnavailable(specialist_name, "circuit open")
+
+        async def attempts() -> SpecialistOutput:
+            for attempt in range(policy.retries + 1):
+                started = time.monotonic()
+                try:
+                    output = await self._aconsult(
+                        specialist_name, user_message, context, speculative,
+                        queued_at if attempt == 0 else None,
+                        policy.hedge_delay(specialist_name)
+                    )
+                except Exception as e:
+                    self._record_failure(specialist_name, breaker)
+                    if attempt == policy.retries or not breaker.allow():
+                        raise
+                    span = current_span()
+                    span.set('retries', {**span.attributes.get('retries', {}), specialist_name: attempt + 1})
+                    self._log(f"{specialist_name} failed (attempt {attempt + 1}): {e}")
+                    await asyncio.sleep(policy.backoff(attempt))
+                    continue
+
+                breaker.record_success()
+                if not output.metadata.get('cache', {}).get('hit'):
+                    # A claimed speculative answer took its own run time, not the wait since the claim
+                    speculation = output.metadata.get('speculation')
+                    elapsed = speculation['seconds'] if speculation else time.monotonic() - started
+                    policy.tracker(specialist_name).record(elapsed)
+                return output
+
+        try:
+            return await asyncio.wait_for(attempts(), timeout=policy.timeout)
+        except asyncio.TimeoutError:
+            self._record_failure(specialist_name, breaker)
+            raise SpecialistUnavailable(specialist_name, f"timed out after {policy.timeout}s")
+        except Exception as e:
+            raise SpecialistUnavailable(specialist_name, str(e)) from e
+        except BaseException:
+            # Cancelled: no outcome, but a half-open trial must not stay taken
+            breaker.release()
+            raise
 
     def execute_parallel(
         self,
@@ -294,22 +915,46 @@ class ACSCoordinator:
         """
         Execute parallel consultation (specialists work independently)
 
+        Specialists run concurrently, at most max_specialists_parallel at a
+        time. Each one gets timeout_per_specialist seconds (including
+        retries) from the moment it starts; specialists that time out or
+        fail are dropped and the remaining outputs are returned.
+
         Args:
             specialists: List of specialists
             user_message: User's query
             context: Additional context
 
         Returns:
-            List of SpecialistOutputs
+            List of SpecialistOutputs (in specialist order, possibly partial)
         """
-        outputs = []
-
-        for specialist_name in specialists:
-            specialist = self._get_specialist(specialist_name)
-            output = specialist.consult(user_message, context)
-            outputs.append(output)
+        return run_sync(self.aexecute_parallel(specialists, user_message, context))
 
-        return outputs
+    async def aexecute_parallel(
+        self,
+        specialists: List[str],
+        user_message: str,
+        context: Optional[Dict] = None,
+        speculative: Optional[Dict[str, asyncio.Task]] = None
+    ) -> List[SpecialistOutput]:
+        """Async version of execute_parallel (speculative: see _aconsult)"""
+        max_parallel = max(1, self.performance_config.get('max_specialists_parallel', 3))
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def run(specialist_name: str) -> Optional[SpecialistOutput]:
+            # The timeout starts once the specialist gets a slot
+            queued_at = time.monotonic()
+            async with semaphore:
+                try:
+                    return await self._aconsult_resilient(
+                        specialist_name, user_message, context, speculative, queued_at
+                    )
+                except SpecialistUnavailable as e:
+                    print(f"[Coordinator] {e}, skipping")
+                return None
+
+        results = await asyncio.gather(*(run(name) for name in specialists))
+        return [output for output in results if output is not None]
 
     def synthesize(
         self,
@@ -328,29 +973,108 @@ class ACSCoordinator:
         Returns:
             Synthesized guidance
         """
+        return run_sync(self.asynthesize(user_message, specialist_outputs, routing_decision))
+
+    async def asynthesize(
+        self,
+        user_message: str,
+        specialist_outputs: List[SpecialistOutput],
+        routing_decision: RoutingDecision,
+        model_tier: Optional[ModelTier] = None
+    ) -> str:
+        """Async version of synthesize (model_tier: coordinator tier to synthesize with)"""
+        skipped = self._skipped_specialists(routing_decision, specialist_outputs)
+
+        with self.tracer.span('synthesis', specialists=len(specialist_outputs)) as span:
+            span.set('skipped', skipped)
+            local_output = self._local_synthesis(user_message, specialist_outputs, skipped)
+            span.set('mode', 'llm' if local_output is None else 'local')
+            if local_output is not None:
+                return local_output
+
+            messages = self._build_synthesis_messages(user_message, specialist_outputs, skipped)
+
+            # Get synthesis
+            if model_tier is not None:
+                span.set('model_tier', model_tier.name)
+            response = await acall_llm(self._synthesis_llm(model_tier), messages)
+            synthesized_output = response.content
+
+        return synthesized_output
+
+    @staticmethod
+    def _skipped_specialists(
+        routing_decision: Optional[RoutingDecision],
+        specialist_outputs: List[SpecialistOutput]
+    ) -> List[str]:
+        """Routed specialists that produced no output (failed, timed out, circuit open)"""
+        if routing_decision is None:
+            return []
+        answered = {o.specialist_name for o in specialist_outputs}
+        return [name for name in routing_decision.specialists if name not in answered]
+
+    def _local_synthesis(
+        self,
+        user_message: str,
+        specialist_outputs: List[SpecialistOutput],
+        skipped: List[str] = ()
+    ) -> Optional[str]:
+        """
+        Merge outputs without the LLM when synthesis would add little
+
+        Applies when parameters.synthesis.local_merge is enabled, the
+        combined outputs fit within max_output_length and the conflict
+        detector finds neither contradicting plans nor overlapping content.
+
+        Returns:
+            Merged guidance, or None if LLM synthesis is needed
+        """
+        merge_config = self.synthesis_config.get('local_merge', {})
+        if not merge_config.get('enabled', False):
+            return None
+
+        total_tokens = sum(estimate_tokens(o.output) for o in specialist_outputs)
+        if total_tokens > self.synthesis_config.get('max_output_length', 3000):
+            return None
+
+        report = detect_conflicts(specialist_outputs, merge_config.get('max_overlap', 0.35))
+        if not report.clean:
+            return None
+
+        current_span().set('local_synthesis_tokens', total_tokens)
+        self._log(f"Local synthesis ({total_tokens} tokens, no conflicts)")
+        return merge_outputs(user_message, specialist_outputs, skipped)
+
+    def _build_synthesis_messages(
+        self,
+        user_message: str,
+        specialist_outputs: List[SpecialistOutput],
+        skipped: List[str] = ()
+    ) -> List:
+        """Build the synthesis prompt"""
         # Format specialist outputs for synthesis
         formatted_outputs = "\n\n".join([
             f"### {output.specialist_name} ({output.domain})\n{output.output}"
             for output in specialist_outputs
         ])
+        if skipped:
+            formatted_outputs += (
+                f"\n\n{unavailable_note(list(skipped))}"
+                " Include this note in the guidance."
+            )
 
-        # Build synthesis prompt
-        synthesis_prompt = self.config['coordinator']['prompts']['synthesis_prompt']
-        filled_prompt = synthesis_prompt.format(
+        # Build synthesis prompt (static instructions first, outputs last)
+        prompt = self.synthesis_prompt.assemble(
             user_message=user_message,
             specialist_outputs=formatted_outputs
         )
+        current_span().set('prompt_prefix_tokens', prompt.prefix_tokens)
 
         messages = [
-            SystemMessage(content=self.config['coordinator']['prompts']['system_prompt']),
-            HumanMessage(content=filled_prompt)
+            SystemMessage(content=prompt.system),
+            HumanMessage(content=prompt.user)
         ]
-
-        # Get synthesis
-        response = self.llm(messages)
-        synthesized_output = response.content
-
-        return synthesized_output
+        return messages
 
     def coordinate(
         self,
@@ -369,54 +1093,655 @@ class ACSCoordinator:
         Returns:
             Final synthesized guidance
         """
-        # Step 1: Analyze and route
-        routing_decision = self.analyze_and_route(
-            user_message, user_level, project_context
+        return run_sync(self.acoordinate(user_message, user_level, project_context))
+
+    async def acoordinate(
+        self,
+        user_message: str,
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None
+    ) -> str:
+        """
+        Async coordination workflow
+
+        Safe to run many sessions concurrently on one event loop.
+
+        Args:
+            user_message: User's query
+            user_level: User's expertise level
+            project_context: Ongoing project context
+
+        Returns:
+            Final synthesized guidance
+        """
+        final_output, _ = await self._acoordinate(user_message, user_level, project_context)
+        return final_output
+
+    async def _acoordinate(
+        self,
+        user_message: str,
+        user_level: str,
+        project_context: Optional[Dict]
+    ) -> Tuple[str, RoutingDecision]:
+        """acoordinate, also returning the routing decision"""
+        context = {'user_level': user_level, 'project_context': project_context}
+
+        with self.tracer.span('coordinate', user_level=user_level) as span:
+            # Predicted specialists start while the routing LLM call is running
+            speculative = self._start_speculation(user_message, user_level, project_context, context)
+            span.set('speculated', sorted(speculative))
+
+            try:
+                # Step 1: Analyze and route
+                routing_decision = await self.aanalyze_and_route(
+                    user_message, user_level, project_context
+                )
+                span.set('pattern', routing_decision.pattern.value)
+                span.set('specialists', list(routing_decision.specialists))
+
+                if self.log_routing:
+                    print(f"[Coordinator] Routing: {routing_decision.pattern.value}")
+                    print(f"[Coordinator] Specialists: {routing_decision.specialists}")
+
+                # Steps 2-3: Execute based on pattern, then synthesize
+                final_output = await self._aexecute_and_synthesize(
+                    routing_decision, user_message, context, speculative
+                )
+                return final_output, routing_decision
+            finally:
+                self._discard_speculation(speculative)
+
+    def coordinate_admitted(
+        self,
+        user_message: str,
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None,
+        user_id: Optional[str] = None,
+        priority: Optional[str] = None,
+        raise_on_reject: bool = False
+    ) -> str:
+        """
+        Coordinate through admission control (parameters.admission)
+
+        Requests wait in a bounded priority queue under global and per-user
+        concurrency caps; when the queue is full, the wait too long or the
+        monthly budget (cost_management) says so, the request is shed with
+        a fast busy answer instead of being coordinated.
+
+        Args:
+            user_message: User's query
+            user_level: User's expertise level
+            project_context: Ongoing project context
+            user_id: Caller identity for per-user caps
+            priority: Priority class (classified from the query if None)
+            raise_on_reject: Raise AdmissionRejected instead of returning
+                the busy message
+
+        Returns:
+            Final synthesized guidance, or the busy message if shed
+        """
+        return run_sync(self.acoordinate_admitted(
+            user_message, user_level, project_context, user_id, priority, raise_on_reject
+        ))
+
+    async def acoordinate_admitted(
+        self,
+        user_message: str,
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None,
+        user_id: Optional[str] = None,
+        priority: Optional[str] = None,
+        raise_on_reject: bool = False
+    ) -> str:
+        """Async version of coordinate_admitted"""
+        if self.admission is None:
+            return await self.acoordinate(user_message, user_level, project_context)
+
+        try:
+            async with self.admission.admit(user_message, user_id, priority) as ticket:
+                with self.tracer.span('admission', priority=ticket.priority,
+                                      queue_wait_seconds=ticket.wait_seconds):
+                    final_output, routing_decision = await self._acoordinate(
+                        user_message, user_level, project_context
+                    )
+        except AdmissionRejected as e:
+            print(f"[Coordinator] {e}")
+            if raise_on_reject:
+                raise
+            return e.busy_message
+
+        if self.admission.budget is not None:
+            self.admission.budget.record_query(len(routing_decision.specialists))
+        return final_output
+
+    async def _aexecute_and_synthesize(
+        self,
+        routing_decision: RoutingDecision,
+        user_message: str,
+        context: Dict,
+        speculative: Optional[Dict[str, asyncio.Task]] = None
+    ) -> str:
+        """Run the routed specialists and combine their outputs"""
+        context = self._with_model_tiers(routing_decision, context)
+        specialist_outputs = await self._aexecute_pattern(
+            routing_decision, user_message, context, speculative
         )
 
-        print(f"[Coordinator] Routing: {routing_decision.pattern.value}")
-        print(f"[Coordinator] Specialists: {routing_decision.specialists}")
+        # Synthesize (if multiple specialists)
+        if len(specialist_outputs) <= 1:
+            # Single specialist (or none left), return directly
+            return self._direct_output(routing_decision, specialist_outputs)
 
-        # Step 2: Execute based on pattern
-        if routing_decision.pattern == CollaborationPattern.SINGLE:
-            specialist_outputs = [
-                self.execute_single(
-                    routing_decision.specialists[0],
-                    user_message,
-                    {'user_level': user_level, 'project_context': project_context}
+        return await self.asynthesize(
+            user_message,
+            specialist_outputs,
+            routing_decision,
+            model_tier=context.get('model_tiers', {}).get('coordinator')
+        )
+
+    def _direct_output(
+        self,
+        routing_decision: RoutingDecision,
+        specialist_outputs: List[SpecialistOutput]
+    ) -> str:
+        """Answer without synthesis, noting specialists that were skipped"""
+        note = unavailable_note(self._skipped_specialists(routing_decision, specialist_outputs))
+        if not specialist_outputs:
+            return note
+        if note:
+            return f"{specialist_outputs[0].output}\n\n*{note}*"
+        return specialist_outputs[0].output
+
+    def coordinate_many(
+        self,
+        queries: List[Union[str, Dict]],
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None,
+        max_workers: Optional[int] = None,
+        requests_per_second: Optional[float] = None
+    ) -> List[BatchResult]:
+        """
+        Coordinate a batch of queries (offline replay, re-grading)
+
+        Args:
+            queries: Query strings, or dicts with user_message and optional
+                user_level / project_context
+            user_level: Default user level
+            project_context: Default project context
+            max_workers: Concurrent queries (default parameters.batch.max_workers)
+            requests_per_second: Query starts per second
+                (default parameters.batch.requests_per_second)
+
+        Returns:
+            One BatchResult per query, in input order
+        """
+        return run_sync(self.acoordinate_many(
+            queries, user_level, project_context, max_workers, requests_per_second
+        ))
+
+    async def acoordinate_many(
+        self,
+        queries: List[Union[str, Dict]],
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None,
+        max_workers: Optional[int] = None,
+        requests_per_second: Optional[float] = None
+    ) -> List[BatchResult]:
+        """
+        Async version of coordinate_many
+
+        Queries that normalize to the same text (same user level and project
+        context) are answered once. All unique queries are routed first, then
+        executed grouped by routed specialists so same-specialist queries run
+        back to back and reuse warm specialists and response-cache entries.
+        A failing query is reported in its BatchResult and does not abort
+        the batch.
+        """
+        self._reload_config_if_changed()
+        batch_config = self.config.get('parameters', {}).get('batch', {})
+        workers = asyncio.Semaphore(max(1, max_workers or batch_config.get('max_workers', 4)))
+        limiter = RateLimiter(
+            requests_per_second if requests_per_second is not None
+            else batch_config.get('requests_per_second')
+        )
+
+        groups = coalesce(build_requests(queries, user_level, project_context))
+        unique = [requests[0] for requests in groups.values()]
+        results = {r.index: BatchResult(r.index, r.user_message, output=None) for r in unique}
+        decisions = {}
+
+        async def route(request: BatchRequest):
+            queued_at = time.monotonic()
+            async with workers:
+                await limiter.acquire()
+                started_at = time.monotonic()
+                result = results[request.index]
+                result.wait_seconds += started_at - queued_at
+                try:
+                    with self.tracer.span('batch_route', index=request.index):
+                        decision = await self.aanalyze_and_route(
+                            request.user_message, request.user_level, request.project_context
+                        )
+                    decisions[request.index] = decision
+                    result.pattern = decision.pattern.value
+                    result.specialists = list(decision.specialists)
+                except Exception as e:
+                    result.error = f"routing failed: {e}"
+                result.route_seconds = time.monotonic() - started_at
+
+        async def execute(request: BatchRequest):
+            queued_at = time.monotonic()
+            async with workers:
+                await limiter.acquire()
+                started_at = time.monotonic()
+                result = results[request.index]
+                result.wait_seconds += started_at - queued_at
+                context = {
+                    'user_level': request.user_level,
+                    'project_context': request.project_context
+                }
+                try:
+                    with self.tracer.span('batch_execute', index=request.index,
+                                          pattern=decisions[request.index].pattern.value):
+                        result.output = await self._aexecute_and_synthesize(
+                            decisions[request.index], request.user_message, context
+                        )
+                except Exception as e:
+                    result.error = f"execution failed: {e}"
+                result.execute_seconds = time.monotonic() - started_at
+
+        await asyncio.gather(*(route(r) for r in unique))
+
+        routed = sorted(
+            (r for r in unique if r.index in decisions),
+            key=lambda r: (tuple(decisions[r.index].specialists), r.index)
+        )
+        await asyncio.gather(*(execute(r) for r in routed))
+
+        print(f"[Coordinator] Batch: {len(queries)} queries, {len(unique)} unique, "
+              f"{sum(1 for r in results.values() if not r.ok)} failed")
+
+        ordered = []
+        for requests in groups.values():
+            original = results[requests[0].index]
+            ordered.append(original)
+            for duplicate in requests[1:]:
+                ordered.append(dataclasses.replace(
+                    original,
+                    index=duplicate.index,
+                    user_message=duplicate.user_message,
+                    specialists=list(original.specialists),
+                    duplicate_of=original.index
+                ))
+        return sorted(ordered, key=lambda r: r.index)
+
+    def _start_speculation(
+        self,
+        user_message: str,
+        user_level: str,
+        project_context: Optional[Dict],
+        context: Dict
+    ) -> Dict[str, asyncio.Task]:
+        """
+        Start the specialists the keyword pre-pass predicts
+
+        Only worthwhile when routing will call the LLM (no cached decision,
+        fast path not confident). Bounded by parameters.speculation:
+        max_specialists caps the extra calls per query, and
+        min_prepass_confidence skips speculation on pure guesses.
+
+        Speculative consultations use the model tiers and complexity score
+        of the predicted route, are hedged and bounded by
+        timeout_per_specialist, but leave the circuit breaker and latency
+        tracker alone: the route's _aconsult_resilient accounts for a
+        claimed task once, and specialists whose circuit is not closed are
+        not speculated on.
+
+        Returns:
+            Specialist name → running consultation task
+        """
+        if not self.speculation_config.get('enabled', False):
+            return {}
+
+        self._reload_config_if_changed()
+        if (self.routing_config.get('cache', {}).get('enabled', True) and
+                self.routing_cache.peek(RoutingCache.make_key(user_message, user_level, project_context))):
+            return {}
+
+        analysis = self.router.analyze(user_message, project_context)
+        threshold = self.routing_config.get('confidence_threshold', 0.8)
+        if self.routing_config.get('fast_path_enabled', True) and analysis.confidence >= threshold:
+            return {}
+        if analysis.confidence < self.speculation_config.get('min_prepass_confidence', 0.5):
+            return {}
+
+        predicted = self._build_routing_decision(analysis, reasoning="", source="prepass")
+        candidates = predicted.specialists
+        if predicted.pattern == CollaborationPattern.SEQUENTIAL:
+            # Later steps need upstream outputs; only the first can start early
+            candidates = candidates[:1]
+        candidates = [
+            name for name in candidates[:self.speculation_config.get('max_specialists', 1)]
+            if self.resilience.breaker(name).state == CircuitBreaker.CLOSED
+        ]
+        if not candidates:
+            return {}
+
+        speculative_context = self._with_model_tiers(predicted, context)
+
+        async def speculate(name: str) -> SpecialistOutput:
+            started = time.monotonic()
+            with self.tracer.span('speculation', specialist=name):
+                output = await asyncio.wait_for(
+                    self._aconsult(
+                        name, user_message, speculative_context,
+                        hedge_delay=self.resilience.hedge_delay(name)
+                    ),
+                    timeout=self.resilience.timeout
                 )
-            ]
+            output.metadata['speculation'] = {'seconds': time.monotonic() - started}
+            return output
+
+        return {name: asyncio.create_task(speculate(name)) for name in candidates}
+
+    def _discard_speculation(self, speculative: Dict[str, asyncio.Task]):
+        """Cancel speculative consultations the final route did not use"""
+        for specialist_name, task in speculative.items():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Retrieve any exception so asyncio does not log it as unhandled
+                task.exception()
+            self._log(f"Discarded speculative {specialist_name}")
+        if speculative:
+            current_span().set('speculation_discarded', sorted(speculative))
+        speculative.clear()
+
+    async def _aexecute_pattern(
+        self,
+        routing_decision: RoutingDecision,
+        user_message: str,
+        context: Dict,
+        speculative: Optional[Dict[str, asyncio.Task]] = None
+    ) -> List[SpecialistOutput]:
+        """
+        Run the executor matching the routing decision's pattern
+
+        Args:
+            routing_decision: Routing decision
+            user_message: User's query
+            context: Context passed to specialists
+            speculative: Speculative consultations to claim (see _aconsult)
+
+        Returns:
+            List of SpecialistOutputs
+        """
+        if routing_decision.pattern == CollaborationPattern.SINGLE:
+            try:
+                return [
+                    await self.aexecute_single(
+                        routing_decision.specialists[0], user_message, context, speculative
+                    )
+                ]
+            except SpecialistUnavailable as e:
+                print(f"[Coordinator] {e}")
+                return []
 
         elif routing_decision.pattern == CollaborationPattern.SEQUENTIAL:
-            specialist_outputs = self.execute_sequential(
-                routing_decision.specialists,
-                user_message,
-                {'user_level': user_level, 'project_context': project_context}
+            return await self.aexecute_sequential(
+                routing_decision.specialists, user_message, context, speculative
             )
 
         elif routing_decision.pattern == CollaborationPattern.PARALLEL:
-            specialist_outputs = self.execute_parallel(
-                routing_decision.specialists,
-                user_message,
-                {'user_level': user_level, 'project_context': project_context}
+            return await self.aexecute_parallel(
+                routing_decision.specialists, user_message, context, speculative
             )
 
-        else:
-            raise ValueError(f"Unsupported pattern: {routing_decision.pattern}")
-
-        # Step 3: Synthesize (if multiple specialists)
-        if len(specialist_outputs) == 1:
-            # Single specialist, return directly
-            final_output = specialist_outputs[0].output
-        else:
-            # Multiple specialists, synthesize
-            final_output = self.synthesize(
-                user_message,
-                specialist_outputs,
-                routing_decision
+        elif routing_decision.pattern == CollaborationPattern.ITERATIVE:
+            return await self.aexecute_iterative(
+                routing_decision.specialists, user_message, context, speculative
             )
 
-        return final_output
+        raise ValueError(f"Unsupported pattern: {routing_decision.pattern}")
+
+    def coordinate_stream(
+        self,
+        user_message: str,
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None
+    ) -> Iterator[CoordinationEvent]:
+        """
+        Streaming coordination workflow
+
+        Args:
+            user_message: User's query
+            user_level: User's expertise level
+            project_context: Ongoing project context
+
+        Yields:
+            CoordinationEvents (see acoordinate_stream)
+        """
+        return iterate_sync(self.acoordinate_stream(user_message, user_level, project_context))
+
+    def coordinate_stream_admitted(
+        self,
+        user_message: str,
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None,
+        user_id: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> Iterator[CoordinationEvent]:
+        """
+        Streaming coordination through admission control
+
+        The admission slot is taken before the first event and held until
+        the stream ends or is closed, like coordinate_admitted holds it for
+        the whole coordination.
+
+        Args:
+            user_message: User's query
+            user_level: User's expertise level
+            project_context: Ongoing project context
+            user_id: Caller identity for per-user caps
+            priority: Priority class (classified from the query if None)
+
+        Yields:
+            CoordinationEvents (see acoordinate_stream)
+
+        Raises:
+            AdmissionRejected: On the first item, if the request is shed
+        """
+        return iterate_sync(self.acoordinate_stream_admitted(
+            user_message, user_level, project_context, user_id, priority
+        ))
+
+    async def acoordinate_stream_admitted(
+        self,
+        user_message: str,
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None,
+        user_id: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> AsyncIterator[CoordinationEvent]:
+        """Async version of coordinate_stream_admitted"""
+        stream = self.acoordinate_stream(user_message, user_level, project_context)
+        if self.admission is None:
+            async for event in stream:
+                yield event
+            return
+
+        try:
+            ticket = await self.admission.acquire(user_message, user_id, priority)
+        except AdmissionRejected as e:
+            print(f"[Coordinator] {e}")
+            raise
+
+        specialists = None
+        with self.tracer.span('admission', activate=False, priority=ticket.priority,
+                              queue_wait_seconds=ticket.wait_seconds, streamed=True) as span:
+            try:
+                # The stream's coordinate span opens (under this one) on its first step
+                with self.tracer.activate(span):
+                    event = await stream.__anext__()
+                while True:
+                    if event.type == 'routing':
+                        specialists = event.data['specialists']
+                    yield event
+                    event = await stream.__anext__()
+            except StopAsyncIteration:
+                pass
+            finally:
+                await stream.aclose()
+                self.admission.release(ticket)
+
+        if self.admission.budget is not None and specialists is not None:
+            self.admission.budget.record_query(len(specialists))
+
+    async def acoordinate_stream(
+        self,
+        user_message: str,
+        user_level: str = "intermediate",
+        project_context: Optional[Dict] = None
+    ) -> AsyncIterator[CoordinationEvent]:
+        """
+        Async streaming coordination workflow
+
+        Single-specialist routes stream the specialist's answer directly;
+        multi-specialist routes stream the synthesis.
+
+        Event sequence:
+            routing → (specialist_start → specialist_end)* → [synthesis_start]
+            → token* → done
+
+        Args:
+            user_message: User's query
+            user_level: User's expertise level
+            project_context: Ongoing project context
+
+        Yields:
+            CoordinationEvents
+        """
+        # Steps run in whatever context the consumer resumes the stream in
+        # (iterate_sync uses a new task per item), so the coordinate span is
+        # only activated around the work between yields
+        with self.tracer.span('coordinate', activate=False, user_level=user_level, streamed=True) as span:
+            with self.tracer.activate(span):
+                routing_decision = await self.aanalyze_and_route(
+                    user_message, user_level, project_context
+                )
+                context = self._with_model_tiers(
+                    routing_decision,
+                    {'user_level': user_level, 'project_context': project_context}
+                )
+            span.set('pattern', routing_decision.pattern.value)
+            span.set('specialists', list(routing_decision.specialists))
+            yield CoordinationEvent('routing', {
+                'pattern': routing_decision.pattern.value,
+                'specialists': routing_decision.specialists,
+                'complexity_score': routing_decision.complexity_score,
+                'source': routing_decision.source
+            })
+
+            if routing_decision.pattern == CollaborationPattern.SINGLE:
+                specialist_name = routing_decision.specialists[0]
+                specialist = self._get_specialist(specialist_name)
+
+                # Streams cannot be retried or hedged, but still respect the breaker
+                breaker = self.resilience.breaker(specialist_name)
+                if not breaker.allow():
+                    span.set('unavailable', [specialist_name])
+                    note = unavailable_note([specialist_name])
+                    yield CoordinationEvent('token', {'source': 'coordinator', 'text': note})
+                    yield CoordinationEvent('done', {'output': note})
+                    return
+
+                output = None
+                with self.tracer.span('specialist', activate=False, parent=span,
+                                      specialist=specialist_name, streamed=True) as specialist_span:
+                    try:
+                        yield CoordinationEvent('specialist_start', {'specialist': specialist_name})
+                        async for item in specialist.astream_consult(user_message, context):
+                            if isinstance(item, str):
+                                yield CoordinationEvent('token', {'source': specialist_name, 'text': item})
+                            else:
+                                output = item
+                    except Exception:
+                        self._record_failure(specialist_name, breaker, specialist_span)
+                        raise
+                    except BaseException:
+                        # Stream closed by the consumer (GeneratorExit) or cancelled
+                        breaker.release()
+                        raise
+                    breaker.record_success()
+                    specialist_span.set('cache_hit', output.metadata.get('cache', {}).get('hit', False))
+                    if 'model_tier' in output.metadata:
+                        specialist_span.set('model_tier', output.metadata['model_tier']['tier'])
+                yield CoordinationEvent('specialist_end', {
+                    'specialist': specialist_name,
+                    'confidence': output.confidence,
+                    'references': output.references
+                })
+                yield CoordinationEvent('done', {'output': output.output})
+                return
+
+            # Multi-specialist: relay executor events while specialists run
+            events: asyncio.Queue = asyncio.Queue()
+            sink_token = _event_sink.set(events.put_nowait)
+            try:
+                with self.tracer.activate(span):
+                    execution = asyncio.create_task(
+                        self._aexecute_pattern(routing_decision, user_message, context)
+                    )
+            finally:
+                _event_sink.reset(sink_token)
+
+            try:
+                while not execution.done():
+                    next_event = asyncio.ensure_future(events.get())
+                    await asyncio.wait({next_event, execution}, return_when=asyncio.FIRST_COMPLETED)
+                    if next_event.done():
+                        yield next_event.result()
+                    else:
+                        next_event.cancel()
+                while not events.empty():
+                    yield events.get_nowait()
+                specialist_outputs = execution.result()
+            finally:
+                if not execution.done():
+                    execution.cancel()
+
+            if len(specialist_outputs) <= 1:
+                final_output = self._direct_output(routing_decision, specialist_outputs)
+                yield CoordinationEvent('token', {
+                    'source': specialist_outputs[0].specialist_name if specialist_outputs else 'coordinator',
+                    'text': final_output
+                })
+                yield CoordinationEvent('done', {'output': final_output})
+                return
+
+            skipped = self._skipped_specialists(routing_decision, specialist_outputs)
+            with self.tracer.activate(span):
+                local_output = self._local_synthesis(user_message, specialist_outputs, skipped)
+            yield CoordinationEvent('synthesis_start', {
+                'specialists': [o.specialist_name for o in specialist_outputs],
+                'mode': 'llm' if local_output is None else 'local'
+            })
+            if local_output is not None:
+                yield CoordinationEvent('token', {'source': 'synthesis', 'text': local_output})
+                yield CoordinationEvent('done', {'output': local_output})
+                return
+
+            chunks = []
+            with self.tracer.span('synthesis', activate=False, parent=span,
+                                  specialists=len(specialist_outputs), streamed=True) as synthesis_span:
+                with self.tracer.activate(synthesis_span):
+                    messages = self._build_synthesis_messages(user_message, specialist_outputs, skipped)
+                synthesis_llm = self._synthesis_llm(context.get('model_tiers', {}).get('coordinator'))
+                async for chunk in astream_llm(synthesis_llm, messages):
+                    chunks.append(chunk)
+                    yield CoordinationEvent('token', {'source': 'synthesis', 'text': chunk})
+                record_token_usage(synthesis_span, messages, completion_text="".join(chunks))
+            yield CoordinationEvent('done', {'output': "".join(chunks)})
 
 
 # Example usage
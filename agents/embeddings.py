@@ -0,0 +1,115 @@
+"""
+ACS-Mentor V3.0 - Text Embeddings
+
+Small embedding backends for similarity lookups:
+1. HashingEmbedder: dependency-free character n-gram hashing (default)
+2. SentenceTransformerEmbedder: sentence-transformers models, if installed
+
+Both return L2-normalized float32 vectors, so cosine similarity is a dot
+product.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import List, Sequence
+import re
+import unicodedata
+import zlib
+
+import numpy as np
+
+
+_WORD = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*|[\u4e00-\u9fff]")
+
+
+class HashingEmbedder:
+    """
+    Character n-gram + word hashing embedder
+
+    Works for Chinese and English without a tokenizer or model download
+    and embeds a short query in well under a millisecond.
+    """
+
+    def __init__(self, dim: int = 512, ngram_range: Sequence[int] = (2, 4)):
+        """
+        Args:
+            dim: Embedding dimension
+            ngram_range: Inclusive character n-gram sizes
+        """
+        self.dim = dim
+        self.ngram_range = (ngram_range[0], ngram_range[1])
+        self.name = f"hashing-{dim}"
+
+    def _features(self, text: str) -> List[str]:
+        """Words plus character n-grams of the normalized text"""
+        text = unicodedata.normalize("NFKC", text).lower()
+        words = _WORD.findall(text)
+        features = [f"w:{w}" for w in words]
+
+        joined = " ".join(words)
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            features.extend(joined[i:i + n] for i in range(len(joined) - n + 1))
+        return features
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed one text"""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature in self._features(text):
+            h = zlib.crc32(feature.encode("utf-8"))
+            # Signed hashing keeps collisions from only ever adding up
+            vector[h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed several texts into an (n, dim) matrix"""
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack([self.embed(t) for t in texts])
+
+
+class SentenceTransformerEmbedder:
+    """sentence-transformers backend (better recall, slower)"""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name)
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = model_name
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed one text"""
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed several texts into an (n, dim) matrix"""
+        return np.asarray(
+            self.model.encode(list(texts), normalize_embeddings=True),
+            dtype=np.float32
+        )
+
+
+def create_embedder(model_name: str = "hashing", dim: int = 512):
+    """
+    Create an embedder by name
+
+    Args:
+        model_name: "hashing" or a sentence-transformers model name
+        dim: Dimension for the hashing embedder
+
+    Returns:
+        Embedder with embed()/embed_many()
+    """
+    if model_name in (None, "", "hashing"):
+        return HashingEmbedder(dim=dim)
+
+    try:
+        return SentenceTransformerEmbedder(model_name)
+    except ImportError:
+        print(f"Warning: sentence-transformers not installed, using hashing embedder instead of {model_name}")
+        return HashingEmbedder(dim=dim)
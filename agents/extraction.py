@@ -0,0 +1,393 @@
+"""
+ACS-Mentor V3.0 - Plan Fact and Reference Extraction
+
+Cheap, deterministic extraction from specialist outputs, without another
+LLM call:
+1. ReferenceExtractor: one compiled pattern over a declarative vocabulary
+   (guidelines, methods, designs, frameworks, study-type cues) that finds
+   every mention with its position in a single scan
+2. Plan facts (study design, statistical methods, sample sizes), used to
+   compare specialist outputs
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+import re
+
+
+# Canonical label → lowercase surface forms
+DESIGN_TERMS = {
+    "RCT": ["rct", "randomized controlled trial", "randomised controlled trial", "随机对照"],
+    "Cohort study": ["cohort", "队列"],
+    "Case-control study": ["case-control", "case control", "病例对照"],
+    "Cross-sectional study": ["cross-sectional", "cross sectional", "横断面"],
+}
+
+METHOD_TERMS = {
+    "t-test": ["t-test", "t test", "t检验"],
+    "ANOVA": ["anova", "方差分析"],
+    "Regression": ["regression", "回归"],
+    "Chi-square test": ["chi-square", "chi square", "卡方"],
+    "Mann-Whitney U test": ["mann-whitney", "mann whitney"],
+    "Kruskal-Wallis test": ["kruskal-wallis", "kruskal wallis"],
+    "Fisher's exact test": ["fisher's exact", "fisher exact"],
+    "Mixed model": ["mixed model", "mixed-effects", "混合模型"],
+    "Cox model": ["cox"],
+    "Propensity score": ["propensity score", "倾向性评分"],
+}
+
+# Reference vocabulary: kind → canonical label → surface forms. A list of
+# forms matches case-insensitively; {'forms': [...], 'case_sensitive': True}
+# matches exact case. Forms that start (end) with a Latin letter or digit
+# only match at a word start (end), optionally followed by a plural "s" —
+# "rct" is not found in "infarction", nor "cox" in "Wilcoxon". Other forms
+# (Chinese terms) match anywhere.
+REFERENCE_VOCABULARY: Dict[str, Dict[str, Any]] = {
+    "guideline": {
+        "CONSORT 2010": {"forms": ["CONSORT"], "case_sensitive": True},
+        "STROBE 2007": {"forms": ["STROBE"], "case_sensitive": True},
+        "SPIRIT 2013": {"forms": ["SPIRIT"], "case_sensitive": True},
+        "PRISMA 2020": {"forms": ["PRISMA"], "case_sensitive": True},
+        "TRIPOD 2015": {"forms": ["TRIPOD"], "case_sensitive": True},
+        "STARD 2015": {"forms": ["STARD"], "case_sensitive": True},
+    },
+    "method": METHOD_TERMS,
+    "design": DESIGN_TERMS,
+    "framework": {
+        "PICO framework": {"forms": ["PICO"], "case_sensitive": True},
+        "FINER criteria": {"forms": ["FINER"], "case_sensitive": True},
+        "SMART goals": ["smart"],
+    },
+    # Cues for choosing a reporting guideline; labels are keys of
+    # writing_specialist.reporting_guidelines
+    "study_type": {
+        "RCT": {"forms": ["RCT"], "case_sensitive": True},
+        "observational": ["observational"],
+        "systematic_review": ["systematic review"],
+        "prediction_model": ["prediction", "model"],
+    },
+}
+
+_SAMPLE_SIZE_PATTERNS = [
+    re.compile(r"\bn\s*=\s*(\d[\d,]*)", re.IGNORECASE),
+    re.compile(r"sample size (?:of|is|=|:)?\s*(?:about |approximately |~)?(\d[\d,]*)", re.IGNORECASE),
+    re.compile(r"(\d[\d,]*)\s*(?:participants|patients|subjects)\b", re.IGNORECASE),
+    re.compile(r"(\d[\d,]*)\s*(?:例|名受试者|名患者|人)"),
+]
+
+_WORD_CHAR = re.compile(r"[A-Za-z0-9]")
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+
+
+@dataclass
+class PlanFacts:
+    """Decisions extracted from one specialist output"""
+    designs: Set[str] = field(default_factory=set)
+    methods: Set[str] = field(default_factory=set)
+    sample_sizes: Set[int] = field(default_factory=set)
+
+    FIELDS = ("designs", "methods", "sample_sizes")
+
+    def is_empty(self) -> bool:
+        """True if nothing was extracted"""
+        return not (self.designs or self.methods or self.sample_sizes)
+
+    def diff(self, previous: "PlanFacts") -> Dict[str, Dict[str, List]]:
+        """
+        Changes relative to an earlier set of facts
+
+        Returns:
+            field → {'added': [...], 'removed': [...]} (only changed fields)
+        """
+        changes = {}
+        for name in self.FIELDS:
+            current, before = getattr(self, name), getattr(previous, name)
+            added, removed = sorted(current - before), sorted(before - current)
+            if added or removed:
+                changes[name] = {'added': added, 'removed': removed}
+        return changes
+
+    def summary(self) -> str:
+        """One-line description"""
+        parts = [
+            f"{name.replace('_', ' ')}: {', '.join(str(v) for v in sorted(getattr(self, name)))}"
+            for name in self.FIELDS if getattr(self, name)
+        ]
+        return "; ".join(parts) if parts else "no explicit design, methods or sample size"
+
+
+@dataclass(frozen=True)
+class ReferenceMatch:
+    """One vocabulary mention in a text"""
+    kind: str
+    label: str
+    start: int
+    end: int
+
+
+@dataclass
+class ExtractionResult:
+    """All vocabulary mentions found in one text, in order of position"""
+    matches: List[ReferenceMatch] = field(default_factory=list)
+
+    def labels(self, kind: str) -> List[str]:
+        """Distinct labels of a kind, in order of first mention"""
+        return list(dict.fromkeys(m.label for m in self.matches if m.kind == kind))
+
+    def has(self, kind: str, label: str) -> bool:
+        return any(m.kind == kind and m.label == label for m in self.matches)
+
+    def positions(self, kind: str, label: str) -> List[Tuple[int, int]]:
+        """(start, end) offsets of every mention of a label"""
+        return [(m.start, m.end) for m in self.matches if m.kind == kind and m.label == label]
+
+
+def _trie_regex(forms: Iterable[str]) -> str:
+    """Regex alternation of literal forms, factored by common prefix (longest match first)"""
+    trie: Dict = {}
+    for form in forms:
+        node = trie
+        for char in form:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        end = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if end else body
+
+    return build(trie)
+
+
+class ReferenceExtractor:
+    """
+    Single-pass multi-pattern matcher over a reference vocabulary
+
+    All surface forms are compiled into one prefix-factored regex (longest
+    form wins), run over the lowercased text. Mentions hidden inside a
+    longer match — shorter forms it starts with ("cox" in "cox model") or
+    contains ("model" in "mixed model") — are derived from the matched
+    form, and case-sensitive forms are checked against the original text.
+    The scan only steps back inside a match when a form could start
+    there and run past its end.
+
+    Usage:
+        extractor = get_extractor(config)
+        result = extractor.extract(output_text)
+        result.labels("method")  # ['t-test', 'ANOVA']
+    """
+
+    def __init__(self, vocabulary: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            vocabulary: kind → label → forms (see REFERENCE_VOCABULARY)
+        """
+        self.vocabulary = vocabulary
+        # Lowercased form → [(kind, label, exact form or None)]
+        table: Dict[str, List[Tuple[str, str, Optional[str]]]] = {}
+
+        for kind, entries in vocabulary.items():
+            for label, spec in entries.items():
+                if isinstance(spec, dict):
+                    forms, case_sensitive = spec.get('forms', []), spec.get('case_sensitive', False)
+                else:
+                    forms, case_sensitive = spec, False
+                for form in forms:
+                    table.setdefault(form.lower(), []).append((kind, label, form if case_sensitive else None))
+
+        self._table = table
+        # Matched form → (offset, length, kind, label, exact form, needs
+        # left/right word boundary) of every form occurring inside it,
+        # itself included
+        self._inner = {
+            form: sorted(
+                (offset, len(other), kind, label, exact or '',
+                 bool(_WORD_CHAR.match(other[0])), bool(_WORD_CHAR.match(other[-1])))
+                for other in table
+                for offset in range(len(form) - len(other) + 1)
+                if form.startswith(other, offset)
+                for kind, label, exact in table[other]
+            )
+            for form in table
+        }
+        # Matched forms whose tail could begin a form that runs past them
+        self._rescan = {
+            form for form in table
+            if any(other.startswith(form[i:]) and len(other) > len(form) - i
+                   for i in range(1, len(form)) for other in table)
+        }
+        alternation = _trie_regex(table)
+        self.pattern = re.compile(alternation) if table else None
+        # For the rare texts whose lowercase form changes length
+        self._folding_pattern = re.compile(f"(?i:{alternation})") if table else None
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict] = None) -> "ReferenceExtractor":
+        """
+        Default vocabulary plus every guideline named in
+        writing_specialist.reporting_guidelines
+        """
+        vocabulary = {kind: dict(entries) for kind, entries in REFERENCE_VOCABULARY.items()}
+        guideline_map = (config or {}).get('writing_specialist', {}).get('reporting_guidelines', {})
+        known = {form for spec in vocabulary['guideline'].values() for form in spec['forms']}
+        for name in guideline_map.values():
+            if name not in known:
+                vocabulary['guideline'][name] = {'forms': [name], 'case_sensitive': True}
+                known.add(name)
+        return cls(vocabulary)
+
+    @staticmethod
+    def _boundary_before(text: str, index: int) -> bool:
+        return index == 0 or not _WORD_CHAR.match(text[index - 1])
+
+    @staticmethod
+    def _boundary_after(text: str, index: int) -> bool:
+        """Word end at index, allowing a plural "s" ("RCTs", "cohorts")"""
+        if index < len(text) and text[index] in "sS":
+            index += 1
+        return index >= len(text) or not _WORD_CHAR.match(text[index])
+
+    def extract(self, text: str) -> ExtractionResult:
+        """
+        Find every vocabulary mention in text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            ExtractionResult with matches ordered by position
+        """
+        if self.pattern is None:
+            return ExtractionResult()
+
+        found = set()  # Rescanning can see an inner mention twice
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            search, scanned = self.pattern.search, lowered
+        else:
+            search, scanned = self._folding_pattern.search, text
+
+        match = search(scanned)
+        while match is not None:
+            start, end = match.span()
+            matched = match.group().lower()
+            for offset, length, kind, label, exact, left, right in self._inner[matched]:
+                begin = start + offset
+                if exact and not text.startswith(exact, begin):
+                    continue
+                if left and not self._boundary_before(scanned, begin):
+                    continue
+                if right and not self._boundary_after(scanned, begin + length):
+                    continue
+                found.add((begin, -length, kind, label))
+            match = search(scanned, start + 1 if matched in self._rescan else end)
+
+        return ExtractionResult([
+            ReferenceMatch(kind, label, begin, begin - negative_length)
+            for begin, negative_length, kind, label in sorted(found)
+        ])
+
+
+_extractors: Dict[Tuple, ReferenceExtractor] = {}
+
+
+def get_extractor(config: Optional[Dict] = None) -> ReferenceExtractor:
+    """Shared ReferenceExtractor for a configuration (compiled once per guideline map)"""
+    guideline_map = (config or {}).get('writing_specialist', {}).get('reporting_guidelines', {})
+    key = tuple(sorted(guideline_map.items()))
+    if key not in _extractors:
+        _extractors[key] = ReferenceExtractor.from_config(config)
+    return _extractors[key]
+
+
+def extract_plan_facts(text: str) -> PlanFacts:
+    """
+    Extract designs, methods and sample sizes from a specialist output
+
+    Args:
+        text: Specialist output
+
+    Returns:
+        PlanFacts
+    """
+    mentions = get_extractor().extract(text)
+
+    sample_sizes = set()
+    for pattern in _SAMPLE_SIZE_PATTERNS:
+        for match in pattern.finditer(text):
+            value = int(match.group(1).replace(",", ""))
+            if value > 1:
+                sample_sizes.add(value)
+
+    return PlanFacts(
+        designs=set(mentions.labels("design")),
+        methods=set(mentions.labels("method")),
+        sample_sizes=sample_sizes
+    )
+
+
+def plans_agree(facts: List[PlanFacts]) -> bool:
+    """
+    Whether several specialists' plans are consistent
+
+    For each field, the specialists that state something must share at
+    least one value; a specialist that is silent on a field does not count
+    as disagreeing.
+
+    Args:
+        facts: One PlanFacts per specialist
+
+    Returns:
+        True if no field conflicts
+    """
+    for name in PlanFacts.FIELDS:
+        stated = [getattr(f, name) for f in facts if getattr(f, name)]
+        if len(stated) > 1 and not set.intersection(*stated):
+            return False
+    return True
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences (and lines)
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Non-empty stripped sentences in order
+    """
+    return [s.strip() for s in _SENTENCE_SPLIT.split(text) if s.strip()]
+
+
+def sentences_mentioning(text: str, terms: List[str], limit: int = 5) -> List[str]:
+    """
+    Sentences of text that mention any of the terms
+
+    Args:
+        text: Text to search
+        terms: Terms (case-insensitive)
+        limit: Maximum sentences returned
+
+    Returns:
+        Matching sentences in order
+    """
+    lowered_terms = [str(t).lower() for t in terms if str(t)]
+    if not lowered_terms:
+        return []
+
+    found = []
+    for sentence in split_sentences(text):
+        if any(t in sentence.lower() for t in lowered_terms):
+            found.append(sentence)
+            if len(found) >= limit:
+                break
+    return found
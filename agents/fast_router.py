@@ -0,0 +1,309 @@
+"""
+ACS-Mentor V3.0 - Fast-Path Router
+
+LLM-free routing for the ACS-Coordinator:
+1. Domain detection (design/stats/writing/strategy)
+2. Weighted task complexity (complexity_aware_routing.yaml)
+3. Routing confidence, used to decide whether the LLM is needed
+
+All keyword tables (Chinese and English) are compiled into one regex and
+each message is scanned once.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+import os
+import re
+import yaml
+
+
+# Used when the multi-agent config has no domain_keywords table
+DEFAULT_DOMAIN_KEYWORDS = {
+    "design": ["design", "study", "rct", "cohort", "sample"],
+    "stats": ["statistical", "analysis", "test", "power", "regression"],
+    "writing": ["write", "manuscript", "methods", "results", "discussion"],
+    "strategy": ["strategy", "career", "publication", "journal", "feasibility"],
+}
+
+DEFAULT_WEIGHTS = {
+    "conceptual_depth": 0.40,
+    "user_uncertainty": 0.35,
+    "context_dependency": 0.25,
+}
+
+# "power=0.8", "N=200", "AUC=0.75"
+SPECIFIC_PARAMETER_PATTERN = re.compile(r"[a-z\u4e00-\u9fff]+\s*[=<>≈]\s*\d")
+
+
+def keyword_pattern(keyword: str) -> str:
+    """
+    Regex for a lowercase keyword: Latin-letter/digit ends only match at
+    word boundaries (a plural "s" may follow), other ends (Chinese) anywhere
+    """
+    pattern = re.escape(keyword)
+    if re.match(r"[a-z0-9]", keyword):
+        pattern = r"(?<![a-z0-9])" + pattern
+    if re.match(r"[a-z0-9]", keyword[-1]):
+        pattern += r"(?=s?(?![a-z0-9]))"
+    return pattern
+
+
+def compile_keywords(keywords) -> Optional[re.Pattern]:
+    """One alternation of keyword patterns, longest first (None if empty)"""
+    ordered = sorted({str(k).lower().strip() for k in keywords or []} - {""}, key=len, reverse=True)
+    if not ordered:
+        return None
+    return re.compile("|".join(keyword_pattern(k) for k in ordered))
+
+
+@dataclass
+class RouteAnalysis:
+    """Result of one fast-path pass over a query"""
+    domains: List[str]
+    domain_hits: Dict[str, int]
+    complexity_score: float
+    dimension_scores: Dict[str, float]
+    confidence: float
+    matched_keywords: List[str] = field(default_factory=list)
+
+
+class FastRouter:
+    """
+    Single-pass keyword router
+
+    Every keyword maps to one or more tags such as ("domain", "stats") or
+    ("conceptual", "high"). Keywords are matched case-insensitively,
+    longest first; Latin keywords only as whole words (plural "s"
+    allowed), so "rct" does not fire inside "infarction" and "test" not
+    inside "latest". A matched keyword also carries the tags of every
+    shorter keyword it contains as a word, so "t-test" still counts as a
+    "test" hit for the stats domain.
+    """
+
+    def __init__(
+        self,
+        complexity_config: Optional[Dict] = None,
+        domain_keywords: Optional[Dict[str, List[str]]] = None
+    ):
+        """
+        Compile the router
+
+        Args:
+            complexity_config: Parsed complexity_aware_routing.yaml
+            domain_keywords: Domain → keyword list
+        """
+        complexity_config = complexity_config or {}
+        self.domain_order = list((domain_keywords or DEFAULT_DOMAIN_KEYWORDS).keys())
+
+        dimensions = complexity_config.get('task_complexity_scoring', {}).get('dimensions', {})
+        self.weights = {
+            name: dimensions.get(name, {}).get('weight', default)
+            for name, default in DEFAULT_WEIGHTS.items()
+        }
+        self.very_complex_floor = (
+            complexity_config.get('task_complexity_scoring', {})
+            .get('complexity_levels', {})
+            .get('very_complex', {})
+            .get('range', [0.8, 1.0])[0]
+        )
+
+        tagged = self._collect_keywords(dimensions, domain_keywords or DEFAULT_DOMAIN_KEYWORDS)
+        self._tags = self._propagate_contained_tags(tagged)
+        self._pattern = self._compile(self._tags.keys())
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "FastRouter":
+        """
+        Build router from the multi-agent configuration
+
+        Args:
+            config: Full multi-agent configuration
+
+        Returns:
+            FastRouter
+        """
+        complexity_path = (
+            config.get('parameters', {})
+            .get('routing', {})
+            .get('complexity_config', 'complexity_aware_routing.yaml')
+        )
+
+        complexity_config = {}
+        if os.path.exists(complexity_path):
+            with open(complexity_path, 'r', encoding='utf-8') as f:
+                complexity_config = yaml.safe_load(f) or {}
+        else:
+            print(f"Warning: Complexity config not found: {complexity_path}, using defaults")
+
+        domain_keywords = (
+            config.get('coordinator', {})
+            .get('routing_strategy', {})
+            .get('domain_keywords')
+        )
+
+        return cls(complexity_config, domain_keywords)
+
+    def _collect_keywords(
+        self,
+        dimensions: Dict,
+        domain_keywords: Dict[str, List[str]]
+    ) -> Dict[str, Set[Tuple[str, str]]]:
+        """Gather every keyword table into keyword → tags"""
+        tagged: Dict[str, Set[Tuple[str, str]]] = {}
+
+        def add(keywords, tag):
+            for keyword in keywords or []:
+                keyword = str(keyword).lower().strip()
+                if keyword:
+                    tagged.setdefault(keyword, set()).add(tag)
+
+        for domain, keywords in domain_keywords.items():
+            add(keywords, ("domain", domain))
+
+        conceptual = dimensions.get('conceptual_depth', {}).get('signal_mapping', {})
+        for level in ("low", "medium", "high"):
+            add(conceptual.get(f'{level}_complexity', {}).get('keywords'), ("conceptual", level))
+
+        uncertainty = dimensions.get('user_uncertainty', {}).get('signal_mapping', {})
+        for level in ("medium", "high"):
+            add(uncertainty.get(f'{level}_uncertainty', {}).get('signals'), ("uncertainty", level))
+
+        context = dimensions.get('context_dependency', {}).get('signal_mapping', {})
+        add(context.get('medium_dependency', {}).get('signals'), ("context", "reference"))
+        add(context.get('high_dependency', {}).get('signals'), ("context", "strategic"))
+
+        return tagged
+
+    @staticmethod
+    def _propagate_contained_tags(
+        tagged: Dict[str, Set[Tuple[str, str]]]
+    ) -> Dict[str, Set[Tuple[str, str]]]:
+        """Give each keyword the tags of the keywords it contains"""
+        propagated = {}
+        for keyword, tags in tagged.items():
+            merged = set(tags)
+            for other, other_tags in tagged.items():
+                if other != keyword and re.search(keyword_pattern(other), keyword):
+                    merged |= other_tags
+            propagated[keyword] = merged
+        return propagated
+
+    @staticmethod
+    def _compile(keywords) -> Optional[re.Pattern]:
+        """Compile keywords into one alternation, longest first"""
+        return compile_keywords(keywords)
+
+    def analyze(self, user_message: str, project_context: Optional[Dict] = None) -> RouteAnalysis:
+        """
+        Scan a query once and score it
+
+        Args:
+            user_message: User's query
+            project_context: Ongoing project context (recent_history is used
+                for the context-dependency dimension)
+
+        Returns:
+            RouteAnalysis
+        """
+        text = user_message.lower()
+        counts: Dict[Tuple[str, str], int] = {}
+        matched = []
+
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                keyword = match.group(0)
+                matched.append(keyword)
+                for tag in self._tags[keyword]:
+                    counts[tag] = counts.get(tag, 0) + 1
+
+        domain_hits = {
+            domain: counts[("domain", domain)]
+            for domain in self.domain_order
+            if counts.get(("domain", domain))
+        }
+        domains = list(domain_hits)
+
+        dimension_scores = {
+            "conceptual_depth": self._score_conceptual(counts),
+            "user_uncertainty": self._score_uncertainty(counts, text),
+            "context_dependency": self._score_context(counts, project_context),
+        }
+        complexity_score = sum(
+            dimension_scores[name] * weight for name, weight in self.weights.items()
+        )
+        complexity_score = round(min(max(complexity_score, 0.0), 1.0), 3)
+
+        return RouteAnalysis(
+            domains=domains,
+            domain_hits=domain_hits,
+            complexity_score=complexity_score,
+            dimension_scores=dimension_scores,
+            confidence=self._estimate_confidence(domain_hits, complexity_score),
+            matched_keywords=matched
+        )
+
+    def _score_conceptual(self, counts: Dict) -> float:
+        """Conceptual depth, per complexity_aware_routing.yaml scoring_logic"""
+        high = counts.get(("conceptual", "high"), 0)
+        medium = counts.get(("conceptual", "medium"), 0)
+        low = counts.get(("conceptual", "low"), 0)
+
+        if high > 0:
+            score = 0.8 + min(high * 0.05, 0.2)
+        elif medium > 0:
+            score = 0.4 + min(medium * 0.1, 0.3)
+        elif low > 0:
+            score = 0.1 + min(low * 0.05, 0.2)
+        else:
+            score = 0.5
+        return min(score, 1.0)
+
+    def _score_uncertainty(self, counts: Dict, text: str) -> float:
+        """User uncertainty, per complexity_aware_routing.yaml scoring_logic"""
+        if counts.get(("uncertainty", "high")):
+            return 0.85
+        if counts.get(("uncertainty", "medium")):
+            return 0.55
+        if SPECIFIC_PARAMETER_PATTERN.search(text):
+            return 0.2
+        return 0.5
+
+    def _score_context(self, counts: Dict, project_context: Optional[Dict]) -> float:
+        """Context dependency, per complexity_aware_routing.yaml scoring_logic"""
+        history = []
+        if isinstance(project_context, dict):
+            history = project_context.get('recent_history') or []
+
+        if counts.get(("context", "strategic")):
+            return 0.9
+        if counts.get(("context", "reference")) and history:
+            return 0.6
+        if len(history) >= 3:
+            return 0.5
+        return 0.2
+
+    def _estimate_confidence(self, domain_hits: Dict[str, int], complexity_score: float) -> float:
+        """
+        How much to trust the keyword route without asking the LLM
+
+        No domain match means the route is a guess, and a single keyword
+        hit stays below the default 0.8 threshold; two or more hits clear
+        it with a margin. Very complex or very broad queries benefit from
+        the LLM's reasoning.
+        """
+        if not domain_hits:
+            return 0.4
+
+        hits = sum(domain_hits.values())
+        if hits < 2:
+            return 0.6
+        confidence = 0.8 + 0.05 * min(hits - 1, 3)
+        if complexity_score >= self.very_complex_floor:
+            confidence -= 0.2
+        if len(domain_hits) > 2:
+            confidence -= 0.1
+        return round(confidence, 3)
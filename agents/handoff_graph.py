@@ -0,0 +1,121 @@
+"""
+ACS-Mentor V3.0 - Handoff Dependency Graph
+
+Compiles collaboration_patterns.sequential_handoff into a DAG so the
+coordinator can start each specialist as soon as its inputs are ready:
+
+    Strategy-Advisor → Design-Specialist → Stats-Specialist
+                                 └──────────────┴→ Writing-Specialist
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Dict, List
+from dataclasses import dataclass
+
+
+@dataclass
+class HandoffStep:
+    """One specialist in a compiled handoff plan"""
+    specialist: str
+    depends_on: List[str]  # Direct inputs (specialist names)
+
+
+class HandoffGraph:
+    """
+    Declared specialist inputs (input_from) → executable plans
+
+    Specialists with declared inputs wait only for those inputs that are
+    part of the route. Specialists the workflow does not mention keep the
+    legacy behaviour of depending on everyone before them in the route.
+    """
+
+    def __init__(self, declared_inputs: Dict[str, List[str]]):
+        """
+        Args:
+            declared_inputs: Specialist → specialists it takes input from
+        """
+        self.declared_inputs = declared_inputs
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "HandoffGraph":
+        """
+        Read input_from declarations from sequential_handoff.workflow
+
+        Args:
+            config: Full multi-agent configuration
+
+        Returns:
+            HandoffGraph
+        """
+        workflow = (
+            config.get('collaboration_patterns', {})
+            .get('sequential_handoff', {})
+            .get('workflow', [])
+        )
+
+        declared_inputs = {}
+        for step in workflow:
+            agent = step.get('agent')
+            if not agent:
+                continue
+            inputs = step.get('input_from') or []
+            if isinstance(inputs, str):
+                inputs = [inputs]
+            declared_inputs[agent] = list(inputs)
+
+        return cls(declared_inputs)
+
+    def compile(self, specialists: List[str]) -> List[HandoffStep]:
+        """
+        Build an execution plan for a route
+
+        Args:
+            specialists: Specialists in route order
+
+        Returns:
+            Steps in a valid execution (topological) order
+        """
+        route = list(dict.fromkeys(specialists))
+        in_route = set(route)
+
+        steps = {}
+        for i, name in enumerate(route):
+            if name in self.declared_inputs:
+                depends_on = [d for d in self.declared_inputs[name] if d in in_route and d != name]
+            else:
+                depends_on = route[:i]
+            steps[name] = HandoffStep(name, depends_on)
+
+        ordered = self._topological_order(route, steps)
+        if ordered is None:
+            print(f"Warning: Cyclic input_from declarations for {route}, running as a chain")
+            return [HandoffStep(name, route[:i]) for i, name in enumerate(route)]
+        return ordered
+
+    @staticmethod
+    def _topological_order(route: List[str], steps: Dict[str, HandoffStep]):
+        """Kahn's algorithm, ties broken by route order (None on cycles)"""
+        remaining = {name: set(step.depends_on) for name, step in steps.items()}
+        ordered = []
+
+        while remaining:
+            ready = [name for name in route if name in remaining and not remaining[name]]
+            if not ready:
+                return None
+            for name in ready:
+                ordered.append(steps[name])
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        return ordered
+
+    def critical_path_length(self, specialists: List[str]) -> int:
+        """Number of LLM calls on the longest dependency chain"""
+        depth = {}
+        for step in self.compile(specialists):
+            depth[step.specialist] = 1 + max((depth[d] for d in step.depends_on), default=0)
+        return max(depth.values(), default=0)
@@ -0,0 +1,103 @@
+"""
+ACS-Mentor V3.0 - Shared HTTP Connection Pool
+
+One pooled httpx client pair (sync + async) shared by the coordinator and
+all specialists, so every LLM client reuses the same warm keep-alive
+connections instead of opening its own.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, Dict, Optional
+import threading
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class SharedHTTPClients:
+    """
+    Lazily created, process-wide httpx clients for LLM API calls
+
+    Usage:
+        clients = SharedHTTPClients.from_config(config)
+        llm = ChatOpenAI(model="gpt-4", **clients.llm_kwargs())
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 60.0
+    ):
+        """
+        Args:
+            max_connections: Upper bound on open connections
+            max_keepalive_connections: Idle connections kept warm
+            keepalive_expiry: Seconds an idle connection is kept
+            timeout: Request timeout in seconds
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(timeout)
+        self._client = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["SharedHTTPClients"]:
+        """
+        Build from parameters.warm_pool.http
+
+        Returns:
+            SharedHTTPClients, or None if disabled or httpx is not installed
+            (each LLM client then manages its own connections)
+        """
+        http_config = config.get('parameters', {}).get('warm_pool', {}).get('http', {})
+        if not http_config.get('enabled', False):
+            return None
+        if httpx is None:
+            print("Warning: httpx not installed, LLM clients will not share connections")
+            return None
+
+        return cls(
+            max_connections=http_config.get('max_connections', 20),
+            max_keepalive_connections=http_config.get('max_keepalive_connections', 10),
+            keepalive_expiry=http_config.get('keepalive_expiry', 30.0),
+            timeout=http_config.get('timeout', 60.0)
+        )
+
+    @property
+    def client(self):
+        """Shared synchronous client"""
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(limits=self.limits, timeout=self.timeout)
+            return self._client
+
+    @property
+    def async_client(self):
+        """Shared asynchronous client (used on the shared background loop)"""
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+            return self._async_client
+
+    def llm_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments that make a ChatOpenAI client use the shared pool"""
+        return {'http_client': self.client, 'http_async_client': self.async_client}
+
+    def close(self) -> None:
+        """Close the sync client (the async client closes with its loop)"""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
@@ -0,0 +1,333 @@
+"""
+ACS-Mentor V3.0 - Specialist Knowledge Indexes
+
+Small per-domain indexes of reporting-guideline excerpts (CONSORT, STROBE,
+TRIPOD, ...) that specialists retrieve from before calling the LLM:
+
+1. Excerpts come from .acs_mentor/knowledge/guideline_excerpts.yaml, one
+   list per index name in v25_integration.knowledge.specialist_knowledge_base
+2. Embeddings are computed once and stored as <index_dir>/<name>.npy plus
+   <name>.json metadata; the matrix is opened memory-mapped
+3. A lookup is one query embedding and one matrix-vector product, well
+   within a few milliseconds, and needs no LLM call
+
+An index is rebuilt when the excerpt file or the embedder changes
+(build_if_missing) or with scripts/build_specialist_indexes.py.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+import json
+import os
+import re
+import threading
+
+import numpy as np
+import yaml
+
+from agents.embeddings import create_embedder
+
+
+@dataclass
+class KnowledgeExcerpt:
+    """One retrieved guideline excerpt"""
+    id: str
+    guideline: str
+    item: str
+    topic: str
+    text: str
+    score: float = 0.0
+
+    @property
+    def citation(self) -> str:
+        return f"{self.guideline} item {self.item}"
+
+    @property
+    def acronym(self) -> str:
+        """Guideline name without its year (e.g. "CONSORT")"""
+        return self.guideline.split()[0]
+
+
+def load_excerpts(path: str) -> Dict[str, List[Dict]]:
+    """Index name → excerpt records from the excerpt file (missing file: empty)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+    return {name: list(records or []) for name, records in (data.get('indexes') or {}).items()}
+
+
+class SpecialistKnowledgeIndex:
+    """
+    Precomputed, memory-mapped embedding index for one specialist domain
+
+    Usage:
+        index = SpecialistKnowledgeIndex.open("stats_knowledge_index", excerpts_path, index_dir, embedder)
+        for excerpt in index.search("how should I handle missing covariates?", top_k=3):
+            print(excerpt.citation, excerpt.text)
+    """
+
+    def __init__(self, name: str, records: List[Dict], vectors: np.ndarray, embedder):
+        """
+        Args:
+            name: Index name
+            records: Excerpt records (id, guideline, item, topic, text)
+            vectors: (n, dim) normalized float32 matrix, row i embedding records[i]
+            embedder: Embedder used for queries (must match the vectors)
+        """
+        self.name = name
+        self.records = records
+        self.vectors = vectors
+        self.embedder = embedder
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @staticmethod
+    def _paths(index_dir: str, name: str) -> Tuple[str, str]:
+        base = os.path.join(index_dir, re.sub(r"[^A-Za-z0-9_.-]", "_", name))
+        return f"{base}.json", f"{base}.npy"
+
+    @staticmethod
+    def _document(record: Dict) -> str:
+        """Text embedded for an excerpt"""
+        return f"{record.get('guideline', '')} {record.get('topic', '')}: {record.get('text', '')}"
+
+    @classmethod
+    def build(cls, name: str, excerpts_path: str, index_dir: str, embedder) -> "SpecialistKnowledgeIndex":
+        """
+        Embed an index's excerpts and write it to index_dir
+
+        Returns:
+            The index, opened from the files just written
+        """
+        records = load_excerpts(excerpts_path).get(name, [])
+        vectors = embedder.embed_many([cls._document(r) for r in records]).astype(np.float32)
+
+        os.makedirs(index_dir, exist_ok=True)
+        meta_path, vector_path = cls._paths(index_dir, name)
+        meta = {
+            'name': name,
+            'embedder': embedder.name,
+            'source_mtime': os.path.getmtime(excerpts_path) if os.path.exists(excerpts_path) else None,
+            'records': records
+        }
+        with open(vector_path + ".tmp", 'wb') as f:
+            np.save(f, vectors)
+        with open(meta_path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(vector_path + ".tmp", vector_path)
+        os.replace(meta_path + ".tmp", meta_path)
+
+        return cls._read(name, index_dir, embedder, meta)
+
+    @classmethod
+    def _read(cls, name: str, index_dir: str, embedder, meta: Dict) -> "SpecialistKnowledgeIndex":
+        _, vector_path = cls._paths(index_dir, name)
+        vectors = np.load(vector_path, mmap_mode='r')
+        return cls(name, meta['records'], vectors, embedder)
+
+    @classmethod
+    def open(
+        cls,
+        name: str,
+        excerpts_path: str,
+        index_dir: str,
+        embedder,
+        build_if_missing: bool = True
+    ) -> Optional["SpecialistKnowledgeIndex"]:
+        """
+        Open a prebuilt index
+
+        Args:
+            name: Index name
+            excerpts_path: Excerpt file the index was built from
+            index_dir: Directory holding <name>.json / <name>.npy
+            embedder: Query embedder
+            build_if_missing: Build when absent or stale (excerpt file
+                modified, different embedder); otherwise a stale index is
+                used as is and a missing one is None
+
+        Returns:
+            SpecialistKnowledgeIndex or None
+        """
+        meta_path, vector_path = cls._paths(index_dir, name)
+        meta = None
+        if os.path.exists(meta_path) and os.path.exists(vector_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable knowledge index {name}: {e}")
+
+        source_mtime = os.path.getmtime(excerpts_path) if os.path.exists(excerpts_path) else None
+        stale = meta is None or meta.get('embedder') != embedder.name or meta.get('source_mtime') != source_mtime
+
+        if stale and build_if_missing:
+            return cls.build(name, excerpts_path, index_dir, embedder)
+        if meta is None:
+            return None
+        if meta.get('embedder') != embedder.name:
+            # Vectors from another embedder are not comparable with queries
+            print(f"Warning: Knowledge index {name} was built with {meta.get('embedder')}, not {embedder.name}")
+            return None
+
+        index = cls._read(name, index_dir, embedder, meta)
+        if len(index.vectors) != len(index.records):
+            print(f"Warning: Knowledge index {name} is inconsistent; rebuild it")
+            return None
+        return index
+
+    def search(self, query: str, top_k: int = 3, min_score: float = 0.0) -> List[KnowledgeExcerpt]:
+        """
+        Most similar excerpts to a query
+
+        Args:
+            query: Query text
+            top_k: Maximum number of excerpts
+            min_score: Minimum cosine similarity
+
+        Returns:
+            KnowledgeExcerpt list, best first
+        """
+        if not len(self.records) or top_k <= 0:
+            return []
+
+        scores = self.vectors @ self.embedder.embed(query)
+        k = min(top_k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+
+        results = []
+        for i in best:
+            if scores[i] < min_score:
+                break
+            record = self.records[i]
+            results.append(KnowledgeExcerpt(
+                id=record.get('id', str(i)),
+                guideline=record.get('guideline', ''),
+                item=str(record.get('item', '')),
+                topic=record.get('topic', ''),
+                text=record.get('text', ''),
+                score=float(scores[i])
+            ))
+        return results
+
+
+class KnowledgeRetriever:
+    """
+    Domain → knowledge index lookup shared by the specialists
+
+    Domains are the keys of v25_integration.knowledge.specialist_knowledge_base
+    (design, stats, writing); indexes open on first use.
+    """
+
+    def __init__(
+        self,
+        index_names: Dict[str, str],
+        excerpts_path: str,
+        index_dir: str,
+        embedder=None,
+        top_k: int = 3,
+        min_score: float = 0.3,
+        build_if_missing: bool = True
+    ):
+        """
+        Args:
+            index_names: Domain → index name
+            excerpts_path: Guideline excerpt file
+            index_dir: Directory of the prebuilt indexes
+            embedder: Query/document embedder
+            top_k: Excerpts per consultation
+            min_score: Minimum cosine similarity of a retrieved excerpt
+            build_if_missing: Build absent or stale indexes on open
+        """
+        self.index_names = dict(index_names)
+        self.excerpts_path = excerpts_path
+        self.index_dir = index_dir
+        self.embedder = embedder or create_embedder()
+        self.top_k = top_k
+        self.min_score = min_score
+        self.build_if_missing = build_if_missing
+        self._indexes: Dict[str, Optional[SpecialistKnowledgeIndex]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["KnowledgeRetriever"]:
+        """
+        Build from parameters.knowledge_retrieval and the index names in
+        v25_integration.knowledge.specialist_knowledge_base
+
+        Returns:
+            KnowledgeRetriever, or None when disabled
+        """
+        retrieval_config = config.get('parameters', {}).get('knowledge_retrieval', {})
+        index_names = config.get('v25_integration', {}).get('knowledge', {}).get('specialist_knowledge_base', {})
+        if not retrieval_config.get('enabled', False) or not index_names:
+            return None
+
+        return cls(
+            index_names,
+            excerpts_path=retrieval_config.get('excerpts_path', '.acs_mentor/knowledge/guideline_excerpts.yaml'),
+            index_dir=retrieval_config.get('index_dir', '.acs_mentor/knowledge/indexes'),
+            embedder=create_embedder(
+                retrieval_config.get('embedding_model', 'hashing'),
+                dim=retrieval_config.get('embedding_dim', 512)
+            ),
+            top_k=retrieval_config.get('top_k', 3),
+            min_score=retrieval_config.get('min_score', 0.3),
+            build_if_missing=retrieval_config.get('build_if_missing', True)
+        )
+
+    def index(self, domain: str) -> Optional[SpecialistKnowledgeIndex]:
+        """Index of a domain (opened on first use; None if it has none)"""
+        if domain in self._indexes:
+            return self._indexes[domain]
+        with self._lock:
+            if domain not in self._indexes:
+                name = self.index_names.get(domain)
+                self._indexes[domain] = SpecialistKnowledgeIndex.open(
+                    name, self.excerpts_path, self.index_dir, self.embedder, self.build_if_missing
+                ) if name else None
+            return self._indexes[domain]
+
+    def preload(self, domains: Optional[List[str]] = None) -> None:
+        """Open indexes now rather than on the first consultation"""
+        for domain in domains or list(self.index_names):
+            self.index(domain)
+
+    def retrieve(self, domain: str, query: str, top_k: Optional[int] = None) -> List[KnowledgeExcerpt]:
+        """Top excerpts for a query from a domain's index"""
+        index = self.index(domain)
+        if index is None:
+            return []
+        return index.search(query, top_k=self.top_k if top_k is None else top_k, min_score=self.min_score)
+
+    def rebuild(self) -> Dict[str, int]:
+        """Rebuild every index; returns index name → excerpt count"""
+        counts = {}
+        with self._lock:
+            for domain, name in self.index_names.items():
+                index = SpecialistKnowledgeIndex.build(name, self.excerpts_path, self.index_dir, self.embedder)
+                self._indexes[domain] = index
+                counts[name] = len(index)
+        return counts
+
+
+_retrievers: Dict[str, Optional[KnowledgeRetriever]] = {}
+
+
+def get_knowledge_retriever(config: Optional[Dict] = None) -> Optional[KnowledgeRetriever]:
+    """Shared KnowledgeRetriever for a configuration (None when disabled)"""
+    config = config or {}
+    key = json.dumps([
+        config.get('parameters', {}).get('knowledge_retrieval', {}),
+        config.get('v25_integration', {}).get('knowledge', {}).get('specialist_knowledge_base', {})
+    ], sort_keys=True, default=str)
+    if key not in _retrievers:
+        _retrievers[key] = KnowledgeRetriever.from_config(config)
+    return _retrievers[key]
@@ -0,0 +1,343 @@
+"""
+ACS-Mentor V3.0 - LLM Provider Factory
+
+Every component that calls an LLM (coordinator, specialists, DAG advisor)
+builds its chat model through create_chat_model, so the backend can be
+swapped without touching call sites:
+
+- openai: LangChain ChatOpenAI (default)
+- fake:   FakeChatModel, a local deterministic backend with configurable
+          latency, token rate, failure injection and canned responses, for
+          measuring orchestration overhead offline
+
+The provider comes from the ACS_LLM_PROVIDER environment variable, else
+parameters.llm_provider.name in the configuration.
+
+Message classes (SystemMessage, HumanMessage, AIMessage) are LangChain's
+when it is installed, else minimal stand-ins, so the fake backend runs
+without LangChain.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, AsyncIterator, Callable, ClassVar, Dict, List, Optional
+from dataclasses import dataclass, field
+import asyncio
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+
+import yaml
+
+from agents.tokens import estimate_tokens
+
+
+PROVIDER_ENV_VAR = "ACS_LLM_PROVIDER"
+
+
+# ============================================================================
+# Message types
+# ============================================================================
+
+try:
+    from langchain.schema import AIMessage, HumanMessage, SystemMessage
+except ImportError:
+    @dataclass
+    class _ChatMessage:
+        """Chat message stand-in (content and LangChain's role name)"""
+        content: str
+        type: ClassVar[str] = ""
+
+    class SystemMessage(_ChatMessage):
+        type = "system"
+
+    class HumanMessage(_ChatMessage):
+        type = "human"
+
+    class AIMessage(_ChatMessage):
+        type = "ai"
+
+
+def prompt_hash(messages: List) -> str:
+    """
+    Stable hash of a prompt (message roles and contents)
+
+    Canned responses for FakeChatModel are keyed by this value.
+    """
+    digest = hashlib.sha256()
+    for message in messages:
+        role = getattr(message, 'type', None) or type(message).__name__
+        digest.update(f"{role}\x00{getattr(message, 'content', message)}\x01".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+# ============================================================================
+# Fake backend
+# ============================================================================
+
+class FakeLLMError(RuntimeError):
+    """Injected LLM failure"""
+
+
+@dataclass
+class FakeMessage:
+    """Response of FakeChatModel (same attributes the pipeline reads from AIMessage)"""
+    content: str
+    usage_metadata: Dict[str, int] = field(default_factory=dict)
+    response_metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class FakeChatModel:
+    """
+    Deterministic local chat model
+
+    Each call sleeps for a time-to-first-token drawn from the latency
+    distribution plus completion_tokens / tokens_per_second, then returns
+    the canned response for the prompt hash (or a synthetic answer of
+    response_tokens tokens). Random draws are seeded by (seed, prompt hash,
+    how often this prompt was seen), so results do not depend on how
+    concurrent calls interleave, and a retried prompt draws anew.
+
+    Usage:
+        llm = FakeChatModel(latency={'distribution': 'lognormal', 'median_seconds': 0.8},
+                            tokens_per_second=60, failure_rate=0.02)
+        response = await llm.ainvoke(messages)
+    """
+
+    def __init__(
+        self,
+        model: str = "fake",
+        temperature: float = 0.0,
+        max_tokens: Optional[int] = None,
+        latency: Optional[Dict] = None,
+        tokens_per_second: Optional[float] = 50.0,
+        response_tokens: int = 300,
+        failure_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        hang_seconds: float = 120.0,
+        responses: Optional[Dict[str, str]] = None,
+        default_response: Optional[str] = None,
+        seed: int = 0
+    ):
+        """
+        Args:
+            model: Reported model name
+            temperature: Accepted for interface compatibility
+            max_tokens: Completion cap (synthetic and canned responses are cut)
+            latency: Time to first token: {distribution: fixed | uniform |
+                lognormal, seconds | min_seconds/max_seconds |
+                median_seconds/sigma}
+            tokens_per_second: Completion token rate (None: instant)
+            response_tokens: Length of synthetic responses
+            failure_rate: Probability a call raises FakeLLMError
+            timeout_rate: Probability a call hangs for hang_seconds
+            hang_seconds: Duration of a simulated hang
+            responses: Prompt hash → canned response text
+            default_response: Response for unknown prompts (default: synthetic)
+            seed: Random seed
+        """
+        self.model_name = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.latency = latency or {'distribution': 'fixed', 'seconds': 0.0}
+        self.tokens_per_second = tokens_per_second
+        self.response_tokens = response_tokens
+        self.failure_rate = failure_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.responses = responses or {}
+        self.default_response = default_response
+        self.seed = seed
+
+        self.calls = 0
+        self.failures = 0
+        self._seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def _plan(self, messages: List):
+        """Draw the outcome of one call: (text, first-token delay, per-token delay, failure)"""
+        key = prompt_hash(messages)
+        with self._lock:
+            self.calls += 1
+            occurrence = self._seen.get(key, 0)
+            self._seen[key] = occurrence + 1
+        rng = random.Random(f"{self.seed}:{key}:{occurrence}")
+
+        first_token = self._sample_latency(rng)
+        roll = rng.random()
+        if roll < self.failure_rate:
+            with self._lock:
+                self.failures += 1
+            return None, first_token, 0.0, FakeLLMError(f"Injected failure (prompt {key})")
+        if roll < self.failure_rate + self.timeout_rate:
+            return None, self.hang_seconds, 0.0, FakeLLMError(f"Injected hang (prompt {key})")
+
+        text = self.responses.get(key, self.default_response)
+        if text is None:
+            text = self._synthetic_response(messages, key)
+        if self.max_tokens:
+            text = text[:self.max_tokens * 4]
+
+        per_token = 1.0 / self.tokens_per_second if self.tokens_per_second else 0.0
+        return text, first_token, per_token, None
+
+    def _sample_latency(self, rng: random.Random) -> float:
+        distribution = self.latency.get('distribution', 'fixed')
+        if distribution == 'uniform':
+            return rng.uniform(self.latency.get('min_seconds', 0.0), self.latency.get('max_seconds', 1.0))
+        if distribution == 'lognormal':
+            median = self.latency.get('median_seconds', 0.5)
+            return median * rng.lognormvariate(0.0, self.latency.get('sigma', 0.5))
+        return self.latency.get('seconds', 0.0)
+
+    def _synthetic_response(self, messages: List, key: str) -> str:
+        """Deterministic filler of response_tokens tokens echoing the prompt's vocabulary"""
+        prompt = str(getattr(messages[-1], 'content', messages[-1])) if messages else ""
+        words = [w for w in prompt.split() if w.isalpha()] or ["guidance"]
+        rng = random.Random(key)
+        body = " ".join(rng.choice(words) for _ in range(self.response_tokens))
+        return f"[fake:{self.model_name}:{key}] {body}"
+
+    def _response(self, messages: List, text: str) -> FakeMessage:
+        prompt_tokens = sum(estimate_tokens(str(getattr(m, 'content', m))) for m in messages)
+        return FakeMessage(
+            content=text,
+            usage_metadata={'input_tokens': prompt_tokens, 'output_tokens': estimate_tokens(text)},
+            response_metadata={'model_name': self.model_name, 'prompt_hash': prompt_hash(messages)}
+        )
+
+    # ------------------------------------------------------------------
+    # Chat model interface
+    # ------------------------------------------------------------------
+
+    def invoke(self, messages: List) -> FakeMessage:
+        text, first_token, per_token, error = self._plan(messages)
+        time.sleep(first_token)
+        if error is not None:
+            raise error
+        time.sleep(per_token * estimate_tokens(text))
+        return self._response(messages, text)
+
+    __call__ = invoke
+
+    async def ainvoke(self, messages: List) -> FakeMessage:
+        text, first_token, per_token, error = self._plan(messages)
+        await asyncio.sleep(first_token)
+        if error is not None:
+            raise error
+        await asyncio.sleep(per_token * estimate_tokens(text))
+        return self._response(messages, text)
+
+    async def astream(self, messages: List) -> AsyncIterator[FakeMessage]:
+        """Yield the response in chunks of about four tokens at the token rate"""
+        text, first_token, per_token, error = self._plan(messages)
+        await asyncio.sleep(first_token)
+        if error is not None:
+            raise error
+        chunk_chars = 16
+        for start in range(0, len(text), chunk_chars):
+            chunk = text[start:start + chunk_chars]
+            await asyncio.sleep(per_token * estimate_tokens(chunk))
+            yield FakeMessage(content=chunk)
+
+    def stats(self) -> Dict[str, int]:
+        return {'calls': self.calls, 'failures': self.failures, 'distinct_prompts': len(self._seen)}
+
+
+def load_canned_responses(path: Optional[str]) -> Dict[str, str]:
+    """Prompt hash → response mapping from a YAML or JSON file (missing file: empty)"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f) if path.endswith('.json') else yaml.safe_load(f)
+    return {str(k): str(v) for k, v in (data or {}).items()}
+
+
+# ============================================================================
+# Factory
+# ============================================================================
+
+def _openai_chat_model(model: str, temperature: float, max_tokens: Optional[int],
+                       settings: Dict, **client_kwargs):
+    from langchain.chat_models import ChatOpenAI
+    return ChatOpenAI(model=model, temperature=temperature, max_tokens=max_tokens, **client_kwargs)
+
+
+def _fake_chat_model(model: str, temperature: float, max_tokens: Optional[int],
+                     settings: Dict, **client_kwargs):
+    fake = settings.get('fake', {})
+    return FakeChatModel(
+        model=f"fake-{model}",
+        temperature=temperature,
+        max_tokens=max_tokens,
+        latency=fake.get('latency'),
+        tokens_per_second=fake.get('tokens_per_second', 50.0),
+        response_tokens=fake.get('response_tokens', 300),
+        failure_rate=fake.get('failure_rate', 0.0),
+        timeout_rate=fake.get('timeout_rate', 0.0),
+        hang_seconds=fake.get('hang_seconds', 120.0),
+        responses=load_canned_responses(fake.get('responses_path')),
+        default_response=fake.get('default_response'),
+        seed=fake.get('seed', 0)
+    )
+
+
+PROVIDERS: Dict[str, Callable[..., Any]] = {
+    'openai': _openai_chat_model,
+    'fake': _fake_chat_model
+}
+
+
+def register_provider(name: str, factory: Callable[..., Any]) -> None:
+    """
+    Add an LLM backend
+
+    Args:
+        name: Provider name (selected via ACS_LLM_PROVIDER or config)
+        factory: f(model, temperature, max_tokens, settings, **client_kwargs)
+            returning a chat model with invoke/ainvoke (astream optional)
+    """
+    PROVIDERS[name] = factory
+
+
+def provider_name(config: Optional[Dict] = None) -> str:
+    """Active provider: ACS_LLM_PROVIDER, else parameters.llm_provider.name, else openai"""
+    settings = (config or {}).get('parameters', {}).get('llm_provider', {})
+    return os.environ.get(PROVIDER_ENV_VAR) or settings.get('name', 'openai')
+
+
+def create_chat_model(
+    config: Optional[Dict],
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    **client_kwargs
+):
+    """
+    Chat model from the active provider
+
+    Args:
+        config: Configuration holding parameters.llm_provider (may be None)
+        model: Model name
+        temperature: Sampling temperature
+        max_tokens: Completion cap
+        **client_kwargs: Provider client options (e.g. shared http clients);
+            providers ignore options they do not use
+
+    Returns:
+        Chat model
+    """
+    name = provider_name(config)
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown LLM provider '{name}' (available: {', '.join(sorted(PROVIDERS))})")
+    settings = (config or {}).get('parameters', {}).get('llm_provider', {})
+    return PROVIDERS[name](model, temperature, max_tokens, settings, **client_kwargs)
@@ -0,0 +1,146 @@
+"""
+ACS-Mentor V3.0 - Local Synthesis
+
+Deterministic alternative to the coordinator's LLM synthesis for
+specialist outputs that cover disjoint ground:
+1. Cheap conflict detector (duplicate domains, contradicting plan facts,
+   heavy lexical overlap)
+2. Template merge into per-specialist sections with consolidated references
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import List, Set, Tuple
+from dataclasses import dataclass, field
+import re
+
+from agents.extraction import PlanFacts, extract_plan_facts
+
+
+_CONTENT_WORD = re.compile(r"[a-z][a-z-]{3,}|[\u4e00-\u9fff]{2}")
+
+_STOPWORDS = {
+    "that", "this", "with", "from", "your", "have", "should", "would", "will",
+    "there", "their", "they", "which", "what", "when", "where", "into", "also",
+    "more", "than", "then", "such", "each", "these", "those", "been", "being",
+    "about", "study", "research", "consider", "ensure", "use", "using",
+}
+
+DOMAIN_TITLES = {
+    "research_design": "Research design",
+    "statistics": "Statistical analysis",
+    "scientific_writing": "Scientific writing",
+    "research_strategy": "Research strategy",
+}
+
+
+@dataclass
+class ConflictReport:
+    """What the conflict detector found"""
+    conflicts: List[str] = field(default_factory=list)
+    overlaps: List[Tuple[str, str, float]] = field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        """True if outputs can be merged without an LLM"""
+        return not self.conflicts and not self.overlaps
+
+
+def _content_words(text: str) -> Set[str]:
+    """Distinctive words used for overlap estimation"""
+    return {w for w in _CONTENT_WORD.findall(text.lower()) if w not in _STOPWORDS}
+
+
+def detect_conflicts(outputs: List, max_overlap: float = 0.35) -> ConflictReport:
+    """
+    Look for overlap or contradiction between specialist outputs
+
+    Args:
+        outputs: SpecialistOutputs
+        max_overlap: Jaccard similarity of content words above which two
+            outputs are considered to cover the same ground
+
+    Returns:
+        ConflictReport
+    """
+    report = ConflictReport()
+
+    seen_domains = {}
+    for output in outputs:
+        if output.domain in seen_domains:
+            report.overlaps.append((seen_domains[output.domain], output.specialist_name, 1.0))
+        seen_domains.setdefault(output.domain, output.specialist_name)
+
+    facts = [(o.specialist_name, extract_plan_facts(o.output)) for o in outputs]
+    for field_name in PlanFacts.FIELDS:
+        stated = [(name, getattr(f, field_name)) for name, f in facts if getattr(f, field_name)]
+        if len(stated) > 1 and not set.intersection(*(values for _, values in stated)):
+            positions = "; ".join(
+                f"{name}: {', '.join(str(v) for v in sorted(values))}" for name, values in stated
+            )
+            report.conflicts.append(f"{field_name.replace('_', ' ')} differ ({positions})")
+
+    words = [(o.specialist_name, _content_words(o.output)) for o in outputs]
+    for i in range(len(words)):
+        for j in range(i + 1, len(words)):
+            (name_a, a), (name_b, b) = words[i], words[j]
+            if a and b:
+                jaccard = len(a & b) / len(a | b)
+                if jaccard > max_overlap:
+                    report.overlaps.append((name_a, name_b, round(jaccard, 3)))
+
+    return report
+
+
+def unavailable_note(skipped: List[str]) -> str:
+    """
+    Note telling the user which specialists could not contribute
+
+    Args:
+        skipped: Routed specialists that produced no output
+
+    Returns:
+        Note text (empty if nothing was skipped)
+    """
+    if not skipped:
+        return ""
+    names = ", ".join(skipped)
+    verb = "was" if len(skipped) == 1 else "were"
+    return (f"Note: {names} {verb} unavailable for this request, so this guidance "
+            f"does not cover that area. Please ask again later for that part.")
+
+
+def merge_outputs(user_message: str, outputs: List, skipped: List[str] = ()) -> str:
+    """
+    Merge specialist outputs into one structured answer
+
+    Args:
+        user_message: Original user query
+        outputs: SpecialistOutputs (assumed non-conflicting)
+        skipped: Routed specialists that produced no output
+
+    Returns:
+        Markdown guidance
+    """
+    lines = ["## Integrated guidance", f"*Question: {user_message.strip()}*", ""]
+
+    references = []
+    for output in outputs:
+        title = DOMAIN_TITLES.get(output.domain, output.domain.replace('_', ' ').capitalize())
+        lines.append(f"### {title} ({output.specialist_name})")
+        lines.append(output.output.strip())
+        lines.append("")
+        for reference in output.references:
+            if reference not in references:
+                references.append(reference)
+
+    if references:
+        lines.append("### Key references")
+        lines.extend(f"- {reference}" for reference in references)
+
+    if skipped:
+        lines.extend(["", f"*{unavailable_note(list(skipped))}*"])
+
+    return "\n".join(lines).rstrip() + "\n"
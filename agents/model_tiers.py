@@ -0,0 +1,133 @@
+"""
+ACS-Mentor V3.0 - Complexity-Tiered Model Selection
+
+Maps a routed query (complexity score, user level, number of specialists)
+to a model tier per specialist, so simple single-specialist questions use
+a faster, cheaper model than complex multi-specialist ones.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    """Model settings chosen for one LLM call site"""
+    name: str
+    model: str
+    max_tokens: Optional[int] = None  # None: keep the caller's llm_config value
+    temperature: Optional[float] = None  # None: keep the caller's llm_config value
+
+
+class ModelTierPolicy:
+    """
+    First-match rules from query features to tiers
+
+    Usage:
+        policy = ModelTierPolicy.from_config(config)
+        tier = policy.select("Stats-Specialist", complexity_score=0.3,
+                             user_level="novice", num_specialists=1)
+    """
+
+    def __init__(
+        self,
+        tiers: Dict[str, Dict],
+        rules: List[Dict],
+        default_tier: str,
+        minimum_tier: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            tiers: Tier name → {model, max_tokens, temperature, specialists:
+                {name: overrides}}, cheapest first
+            rules: [{tier, max_complexity, max_specialists, user_levels}];
+                unset conditions match anything
+            default_tier: Tier when no rule matches
+            minimum_tier: Specialist (or "coordinator") → lowest allowed tier
+        """
+        self.tiers = tiers
+        self.order = list(tiers)
+        self.rules = rules
+        self.default_tier = default_tier if default_tier in tiers else self.order[-1]
+        self.minimum_tier = minimum_tier or {}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["ModelTierPolicy"]:
+        """
+        Build from cost_management.model_tiers
+
+        Returns:
+            ModelTierPolicy, or None if disabled (every call keeps its llm_config)
+        """
+        tier_config = config.get('cost_management', {}).get('model_tiers', {})
+        if not tier_config.get('enabled', False) or not tier_config.get('tiers'):
+            return None
+
+        return cls(
+            tiers=tier_config['tiers'],
+            rules=tier_config.get('rules', []),
+            default_tier=tier_config.get('default_tier', ''),
+            minimum_tier=tier_config.get('minimum_tier', {})
+        )
+
+    def _matching_tier(self, complexity_score: float, user_level: str, num_specialists: int) -> str:
+        for rule in self.rules:
+            if 'max_complexity' in rule and complexity_score > rule['max_complexity']:
+                continue
+            if 'max_specialists' in rule and num_specialists > rule['max_specialists']:
+                continue
+            if 'user_levels' in rule and user_level not in rule['user_levels']:
+                continue
+            if rule.get('tier') in self.tiers:
+                return rule['tier']
+        return self.default_tier
+
+    def select(
+        self,
+        specialist: str,
+        complexity_score: float,
+        user_level: str,
+        num_specialists: int
+    ) -> ModelTier:
+        """
+        Tier for one specialist (or "coordinator" for synthesis)
+
+        Args:
+            specialist: Specialist name or "coordinator"
+            complexity_score: RoutingDecision.complexity_score (0-1)
+            user_level: novice / intermediate / expert
+            num_specialists: Specialists in the route
+
+        Returns:
+            ModelTier
+        """
+        name = self._matching_tier(complexity_score, user_level, num_specialists)
+
+        floor = self.minimum_tier.get(specialist)
+        if floor in self.tiers and self.order.index(floor) > self.order.index(name):
+            name = floor
+
+        settings = dict(self.tiers[name])
+        settings.update(settings.pop('specialists', {}).get(specialist, {}))
+        return ModelTier(
+            name=name,
+            model=settings.get('model', 'gpt-4'),
+            max_tokens=settings.get('max_tokens'),
+            temperature=settings.get('temperature')
+        )
+
+    def select_for_route(
+        self,
+        specialists: List[str],
+        complexity_score: float,
+        user_level: str
+    ) -> Dict[str, ModelTier]:
+        """Tiers for every specialist of a route plus the coordinator"""
+        return {
+            name: self.select(name, complexity_score, user_level, len(specialists))
+            for name in list(specialists) + ['coordinator']
+        }
@@ -0,0 +1,241 @@
+"""
+ACS-Mentor V3.0 - Adaptive Output Budgets
+
+Completion tokens dominate generation latency, and most answers need far
+fewer than a specialist's configured max_tokens. Before each consultation
+the planner picks a completion budget and a matching response-depth
+instruction from:
+
+1. user_level: base budget (novice answers are shorter)
+2. RoutingDecision.complexity_score: scales the base around 0.5
+3. response_depth_preference from the user profile: brief / standard /
+   detailed multiplier and wording
+4. The specialist's recent output lengths at that user level: the budget
+   is capped near what it actually uses, and raised again when answers
+   start hitting it
+
+Budgets are rounded up to step_tokens (each distinct budget is one cached
+LLM client per tier) and never exceed the configured max_tokens.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Deque, Dict, Optional, Tuple
+from collections import deque
+from dataclasses import dataclass
+import math
+import threading
+
+
+DEFAULT_DEPTHS = {
+    'brief': {
+        'multiplier': 0.6,
+        'instruction': "Be concise: give the key recommendation and the essential reasoning only."
+    },
+    'standard': {
+        'multiplier': 1.0,
+        'instruction': "Give a focused answer covering the recommendation, reasoning and next steps."
+    },
+    'detailed': {
+        'multiplier': 1.5,
+        'instruction': "Give a thorough answer with reasoning, alternatives and worked details."
+    }
+}
+
+
+@dataclass(frozen=True)
+class OutputBudget:
+    """Completion budget for one specialist call"""
+    max_tokens: int
+    depth: str
+    instruction: str  # Response-depth instruction for the prompt
+    user_level: str = 'intermediate'
+
+    def stats(self) -> Dict:
+        return {'max_tokens': self.max_tokens, 'depth': self.depth}
+
+
+class OutputBudgetPlanner:
+    """
+    Per-call max_tokens and depth instruction
+
+    Usage:
+        planner = OutputBudgetPlanner.from_config(config)
+        budget = planner.plan("Stats-Specialist", context, ceiling=2000)
+        ...
+        planner.record("Stats-Specialist", completion_tokens, budget)
+    """
+
+    def __init__(
+        self,
+        base_tokens: Dict[str, int],
+        depths: Optional[Dict[str, Dict]] = None,
+        default_depth: str = 'standard',
+        complexity_weight: float = 0.8,
+        min_tokens: int = 300,
+        step_tokens: int = 100,
+        history_window: int = 50,
+        history_min_samples: int = 10,
+        history_percentile: float = 0.95,
+        history_headroom: float = 1.2,
+        truncation_rate: float = 0.1,
+        truncation_boost: float = 1.3
+    ):
+        """
+        Args:
+            base_tokens: user_level → budget at complexity 0.5, standard depth
+            depths: Depth → {multiplier, instruction}
+            default_depth: Depth when the profile has no (known) preference
+            complexity_weight: Budget × (1 + weight × (complexity − 0.5))
+            min_tokens: Smallest budget
+            step_tokens: Budgets are rounded up to a multiple of this
+            history_window: Recent outputs remembered per specialist and user level
+            history_min_samples: Outputs needed before history caps budgets
+            history_percentile: Output length percentile used as the cap
+            history_headroom: Cap = percentile length × headroom
+            truncation_rate: Share of recent outputs that used their whole
+                budget above which budgets are raised
+            truncation_boost: Factor applied while over truncation_rate
+        """
+        self.base_tokens = dict(base_tokens)
+        self.depths = depths or DEFAULT_DEPTHS
+        self.default_depth = default_depth if default_depth in self.depths else next(iter(self.depths))
+        self.complexity_weight = complexity_weight
+        self.min_tokens = min_tokens
+        self.step_tokens = max(1, step_tokens)
+        self.history_window = history_window
+        self.history_min_samples = history_min_samples
+        self.history_percentile = history_percentile
+        self.history_headroom = history_headroom
+        self.truncation_rate = truncation_rate
+        self.truncation_boost = truncation_boost
+
+        # (specialist, user_level) → recent (completion tokens, hit its budget)
+        self._history: Dict[Tuple[str, str], Deque] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["OutputBudgetPlanner"]:
+        """
+        Build from parameters.output_budget
+
+        Returns:
+            OutputBudgetPlanner, or None when disabled (fixed llm_config max_tokens)
+        """
+        budget_config = config.get('parameters', {}).get('output_budget', {})
+        if not budget_config.get('enabled', False):
+            return None
+
+        history = budget_config.get('history', {})
+        return cls(
+            base_tokens=budget_config.get('base_tokens', {'novice': 700, 'intermediate': 1000, 'expert': 1400}),
+            depths=budget_config.get('depth_preferences') or DEFAULT_DEPTHS,
+            default_depth=budget_config.get('default_depth', 'standard'),
+            complexity_weight=budget_config.get('complexity_weight', 0.8),
+            min_tokens=budget_config.get('min_tokens', 300),
+            step_tokens=budget_config.get('step_tokens', 100),
+            history_window=history.get('window', 50),
+            history_min_samples=history.get('min_samples', 10),
+            history_percentile=history.get('percentile', 0.95),
+            history_headroom=history.get('headroom', 1.2),
+            truncation_rate=history.get('truncation_rate', 0.1),
+            truncation_boost=history.get('truncation_boost', 1.3)
+        )
+
+    def depth_preference(self, context: Optional[Dict]) -> str:
+        """
+        Depth from context['response_depth_preference'] or the profile in
+        project_context['user_profile'] (user_profiles.response_depth_preference)
+        """
+        context = context or {}
+        project_context = context.get('project_context')
+        profile = project_context.get('user_profile') if isinstance(project_context, dict) else None
+
+        preference = context.get('response_depth_preference')
+        if preference is None and isinstance(profile, dict):
+            preference = profile.get('response_depth_preference')
+        preference = str(preference).lower() if preference else None
+        return preference if preference in self.depths else self.default_depth
+
+    def plan(self, specialist: str, context: Optional[Dict], ceiling: int) -> OutputBudget:
+        """
+        Budget for one consultation
+
+        Args:
+            specialist: Specialist name (history key)
+            context: Consultation context (user_level, complexity_score,
+                project_context)
+            ceiling: Configured max_tokens; budgets never exceed it
+
+        Returns:
+            OutputBudget
+        """
+        context = context or {}
+        user_level = context.get('user_level', 'intermediate')
+        base = self.base_tokens.get(user_level, self.base_tokens.get('intermediate', 1000))
+
+        complexity = context.get('complexity_score')
+        complexity = 0.5 if complexity is None else min(max(float(complexity), 0.0), 1.0)
+        depth = self.depth_preference(context)
+
+        tokens = base * (1 + self.complexity_weight * (complexity - 0.5)) * self.depths[depth].get('multiplier', 1.0)
+        tokens = self._apply_history((specialist, user_level), tokens)
+
+        tokens = math.ceil(tokens / self.step_tokens) * self.step_tokens
+        tokens = int(min(max(tokens, self.min_tokens), ceiling))
+        return OutputBudget(
+            max_tokens=tokens,
+            depth=depth,
+            instruction=self.depths[depth].get('instruction', ''),
+            user_level=user_level
+        )
+
+    def _apply_history(self, key: Tuple[str, str], tokens: float) -> float:
+        """Cap near the specialist's usual output length; boost while outputs get cut off"""
+        with self._lock:
+            history = list(self._history.get(key, ()))
+        if len(history) < self.history_min_samples:
+            return tokens
+
+        lengths = sorted(length for length, _ in history)
+        usual = lengths[min(len(lengths) - 1, int(self.history_percentile * len(lengths)))]
+        tokens = min(tokens, usual * self.history_headroom)
+
+        truncated = sum(1 for _, hit in history if hit) / len(history)
+        if truncated > self.truncation_rate:
+            tokens *= self.truncation_boost
+        return tokens
+
+    def record(self, specialist: str, completion_tokens: int, budget: OutputBudget) -> None:
+        """Remember the length of an answer produced under a budget"""
+        hit = completion_tokens >= 0.95 * budget.max_tokens
+        with self._lock:
+            history = self._history.setdefault((specialist, budget.user_level), deque(maxlen=self.history_window))
+            history.append((completion_tokens, hit))
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per specialist and user level: recent outputs, mean length and share that hit the budget"""
+        with self._lock:
+            snapshot = {f"{name}/{level}": list(history) for (name, level), history in self._history.items()}
+        return {
+            name: {
+                'samples': len(history),
+                'mean_tokens': round(sum(length for length, _ in history) / len(history), 1),
+                'truncated_share': round(sum(1 for _, hit in history if hit) / len(history), 3)
+            }
+            for name, history in snapshot.items() if history
+        }
+
+
+_planners: Dict[str, Optional[OutputBudgetPlanner]] = {}
+
+
+def get_output_budget_planner(config: Optional[Dict] = None) -> Optional[OutputBudgetPlanner]:
+    """Shared OutputBudgetPlanner for a configuration (None when disabled)"""
+    budget_config = (config or {}).get('parameters', {}).get('output_budget', {})
+    key = repr(budget_config)
+    if key not in _planners:
+        _planners[key] = OutputBudgetPlanner.from_config(config or {})
+    return _planners[key]
@@ -0,0 +1,216 @@
+"""
+ACS-Mentor V3.0 - Prefix-Stable Prompt Assembly
+
+Providers cache the longest previously seen prompt prefix, so a prompt
+should start with everything that is identical across calls and end with
+what varies. Templates are compiled once into:
+
+    system:  system prompt → soul persona → static reference sections
+    user:    static task instructions → variable fields (query, context)
+
+A task-prompt line containing a {field} is variable; a label line ending
+in ":" directly above a variable line moves with it. Everything else in
+the task prompt keeps its relative order in the static part.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Dict, Iterable, List, Optional
+from dataclasses import dataclass
+from string import Formatter
+import hashlib
+import re
+
+import yaml
+
+from agents.tokens import estimate_tokens
+
+
+@dataclass
+class AssembledPrompt:
+    """Rendered prompt with its cacheable-prefix size"""
+    system: str
+    user: str
+    prefix_tokens: int  # Tokens identical across calls of the same template
+    total_tokens: int
+    prefix_hash: str  # Changes only when the static prefix changes
+
+    def stats(self) -> Dict:
+        return {
+            'prefix_tokens': self.prefix_tokens,
+            'total_tokens': self.total_tokens,
+            'prefix_hash': self.prefix_hash
+        }
+
+
+def _field_names(line: str) -> List[str]:
+    return [name for _, name, _, _ in Formatter().parse(line) if name]
+
+
+def _collapse_blank_lines(lines: List[str]) -> str:
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def render_section(title: str, content) -> str:
+    """Static reference section (e.g. a guideline table from the config) as text"""
+    if not isinstance(content, str):
+        content = yaml.safe_dump(content, sort_keys=False, allow_unicode=True, default_flow_style=False)
+    return f"## Reference: {title.replace('_', ' ').title()}\n{content.strip()}"
+
+
+class PromptTemplate:
+    """
+    System + task prompt compiled for a stable prefix
+
+    Usage:
+        template = PromptTemplate(system_prompt, task_prompt, sections={...})
+        prompt = template.assemble(user_message="...", user_level="novice")
+        messages = [SystemMessage(content=prompt.system), HumanMessage(content=prompt.user)]
+    """
+
+    def __init__(
+        self,
+        system_prompt: str,
+        task_prompt: str,
+        sections: Optional[Dict] = None,
+        persona: Optional[str] = None,
+        reorder: bool = True
+    ):
+        """
+        Args:
+            system_prompt: Static system prompt
+            task_prompt: str.format template with {field} placeholders
+            sections: Title → static reference content (str, dict or list)
+            persona: Persona text placed after the system prompt
+            reorder: Move variable lines after static ones; False keeps the
+                task prompt in its written order (no static user prefix)
+        """
+        self.system_prompt = system_prompt.strip()
+        self.sections = dict(sections or {})
+        self.reorder = reorder
+        self.fields = set(_field_names(task_prompt))
+        self._compile_task(task_prompt)
+        self.set_persona(persona)
+
+    def _compile_task(self, task_prompt: str) -> None:
+        lines = task_prompt.strip().splitlines()
+        if not self.reorder:
+            self.static_user, self.variable_template = "", task_prompt.strip()
+            return
+
+        variable = [bool(_field_names(line)) for line in lines]
+        for i in range(len(lines) - 2, -1, -1):
+            if not variable[i] and variable[i + 1] and lines[i].rstrip().endswith(':'):
+                variable[i] = True
+
+        # Static lines hold no fields, but may hold {{ }} escapes
+        self.static_user = _collapse_blank_lines([l for l, v in zip(lines, variable) if not v]).format()
+        self.variable_template = _collapse_blank_lines([l for l, v in zip(lines, variable) if v])
+
+    def set_persona(self, persona: Optional[str]) -> None:
+        """Set the persona block and recompile the static system text"""
+        self.persona = (persona or "").strip() or None
+        blocks = [self.system_prompt]
+        if self.persona:
+            blocks.append(self.persona)
+        blocks.extend(render_section(title, content) for title, content in self.sections.items())
+        self.system = "\n\n".join(blocks)
+
+        self._user_prefix = f"{self.static_user}\n\n" if self.static_user else ""
+        prefix = f"{self.system}\x00{self._user_prefix}"
+        self._prefix_tokens = estimate_tokens(self.system) + estimate_tokens(self._user_prefix)
+        self._prefix_hash = hashlib.sha256(prefix.encode('utf-8')).hexdigest()[:12]
+
+    @property
+    def prefix_tokens(self) -> int:
+        """Tokens of the static prefix"""
+        return self._prefix_tokens
+
+    def assemble(self, **values) -> AssembledPrompt:
+        """
+        Render the prompt
+
+        Args:
+            **values: Field values; missing fields render as "Not specified"
+
+        Returns:
+            AssembledPrompt
+        """
+        user = self._user_prefix + self.render_variable(values)
+        return AssembledPrompt(
+            system=self.system,
+            user=user,
+            prefix_tokens=self._prefix_tokens,
+            total_tokens=estimate_tokens(self.system) + estimate_tokens(user),
+            prefix_hash=self._prefix_hash
+        )
+
+    def render_variable(self, values: Dict) -> str:
+        """Variable part of the user message for one set of field values"""
+        filled = {name: values.get(name, 'Not specified') for name in self.fields}
+        return self.variable_template.format(**filled)
+
+    def assemble_batch(self, values: List[Dict], instructions: str) -> AssembledPrompt:
+        """
+        Render several questions into one prompt
+
+        The static prefix is shared; instructions (static too) follow it,
+        then one "### Question <n>" block per set of field values.
+
+        Args:
+            values: Field values per question
+            instructions: How to answer and format the answers
+
+        Returns:
+            AssembledPrompt
+        """
+        blocks = [
+            f"### Question {number}\n{self.render_variable(fields)}"
+            for number, fields in enumerate(values, start=1)
+        ]
+        user = self._user_prefix + instructions.strip() + "\n\n" + "\n\n".join(blocks)
+        return AssembledPrompt(
+            system=self.system,
+            user=user,
+            prefix_tokens=self._prefix_tokens,
+            total_tokens=estimate_tokens(self.system) + estimate_tokens(user),
+            prefix_hash=self._prefix_hash
+        )
+
+
+def compile_prompt(
+    config: Dict,
+    section_key: str,
+    task_key: str = 'task_prompt',
+    persona: Optional[str] = None
+) -> PromptTemplate:
+    """
+    Compile one agent's prompt from the multi-agent configuration
+
+    Args:
+        config: Full configuration
+        section_key: Agent section (e.g. 'stats_specialist', 'coordinator')
+        task_key: Task template within <section>.prompts
+        persona: Persona text (see the soul registry)
+
+    Returns:
+        PromptTemplate; static reference sections come from
+        parameters.prompt_assembly.static_sections[section_key]
+    """
+    assembly_config = config.get('parameters', {}).get('prompt_assembly', {})
+    agent_config = config.get(section_key, {})
+    prompts = agent_config.get('prompts', {})
+
+    enabled = assembly_config.get('enabled', True)
+    section_names: Iterable[str] = assembly_config.get('static_sections', {}).get(section_key, []) if enabled else []
+    sections = {name: agent_config[name] for name in section_names if name in agent_config}
+
+    return PromptTemplate(
+        prompts.get('system_prompt', ''),
+        prompts.get(task_key, '{user_message}'),
+        sections=sections,
+        persona=persona,
+        reorder=enabled
+    )
@@ -0,0 +1,278 @@
+"""
+ACS-Mentor V3.0 - Specialist Call Resilience
+
+Failure isolation for specialist LLM calls:
+1. Hedged requests: a duplicate call is started if the first one is
+   slower than the specialist's recent p95 latency; the first answer wins
+2. Bounded retries with full-jitter exponential backoff
+3. Per-specialist circuit breakers, so a failing specialist is skipped
+   quickly instead of stalling every coordination
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from collections import deque
+import asyncio
+import random
+import threading
+import time
+
+
+class SpecialistUnavailable(Exception):
+    """A specialist could not answer (failures, timeout or open circuit)"""
+
+    def __init__(self, specialist: str, reason: str):
+        super().__init__(f"{specialist} unavailable: {reason}")
+        self.specialist = specialist
+        self.reason = reason
+
+
+class LatencyTracker:
+    """Sliding window of call latencies"""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Latency percentile
+
+        Args:
+            q: Percentile in [0, 1]
+            min_samples: Fewer samples than this yields None
+
+        Returns:
+            Seconds, or None if not enough data
+        """
+        with self._lock:
+            if len(self._samples) < max(1, min_samples):
+                return None
+            ordered = sorted(self._samples)
+        return ordered[int(q * (len(ordered) - 1))]
+
+
+class CircuitBreaker:
+    """
+    Closed → open after failure_threshold consecutive failures; after
+    reset_timeout one trial call is let through (half-open), whose outcome
+    closes or re-opens the circuit. A trial that is abandoned (cancelled,
+    stream closed) must be released; one that never reports back is
+    replaced after another reset_timeout.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may be made now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and (
+                    not self._trial_in_flight or time.monotonic() - self._trial_started >= self.reset_timeout):
+                self._trial_in_flight = True
+                self._trial_started = time.monotonic()
+                return True
+            return False
+
+    def release(self) -> None:
+        """A call let through by allow() ended without an outcome (cancelled)"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a failed call; True if this failure opened the circuit"""
+        with self._lock:
+            self.failures += 1
+            opened = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                opened = self.state != self.OPEN
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+            return opened
+
+
+def jittered_backoff(attempt: int, base: float = 0.5, cap: float = 4.0) -> float:
+    """Full-jitter exponential backoff before retry number attempt + 1"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+async def hedged(
+    start: Callable[[], Awaitable[Any]],
+    delay: Optional[float],
+    max_hedges: int = 1
+) -> Tuple[Any, int]:
+    """
+    Run a call, starting duplicates if it is slow
+
+    Args:
+        start: Creates a new attempt of the call
+        delay: Seconds to wait before each duplicate (None: no hedging)
+        max_hedges: Maximum duplicates
+
+    Returns:
+        (first successful result, number of attempts started)
+
+    Raises:
+        The last error if every attempt fails
+    """
+    tasks = {asyncio.ensure_future(start())}
+    launched = 1
+    last_error: Optional[BaseException] = None
+
+    try:
+        while tasks:
+            can_hedge = delay is not None and launched <= max_hedges
+            done, _ = await asyncio.wait(
+                tasks,
+                timeout=delay if can_hedge else None,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not done:
+                tasks.add(asyncio.ensure_future(start()))
+                launched += 1
+                continue
+
+            for task in done:
+                tasks.discard(task)
+                if task.exception() is None:
+                    return task.result(), launched
+                last_error = task.exception()
+
+        # Every attempt failed (retrying is the caller's decision)
+        raise last_error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class ResiliencePolicy:
+    """
+    Per-specialist breakers, latency trackers and retry/hedge settings
+
+    Usage:
+        policy = ResiliencePolicy.from_config(config)
+        if policy.breaker("Stats-Specialist").allow():
+            ...
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 4.0,
+        hedging_enabled: bool = True,
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        hedge_min_delay: float = 1.0,
+        hedge_initial_delay: Optional[float] = None,
+        max_hedges: int = 1,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0
+    ):
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.hedging_enabled = hedging_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_initial_delay = hedge_initial_delay
+        self.max_hedges = max_hedges
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._trackers: Dict[str, LatencyTracker] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "ResiliencePolicy":
+        """
+        Build from parameters.performance (timeout, retries) and
+        parameters.resilience (backoff, hedging, circuit breaker)
+        """
+        parameters = config.get('parameters', {})
+        performance = parameters.get('performance', {})
+        resilience = parameters.get('resilience', {})
+        backoff = resilience.get('backoff', {})
+        hedging = resilience.get('hedging', {})
+        breaker = resilience.get('circuit_breaker', {})
+
+        return cls(
+            timeout=performance.get('timeout_per_specialist', 30),
+            retries=performance.get('retry_on_failure', 2),
+            backoff_base=backoff.get('base_seconds', 0.5),
+            backoff_cap=backoff.get('max_seconds', 4.0),
+            hedging_enabled=hedging.get('enabled', True),
+            hedge_percentile=hedging.get('percentile', 0.95),
+            hedge_min_samples=hedging.get('min_samples', 20),
+            hedge_min_delay=hedging.get('min_delay_seconds', 1.0),
+            hedge_initial_delay=hedging.get('initial_delay_seconds'),
+            max_hedges=hedging.get('max_hedges', 1),
+            failure_threshold=breaker.get('failure_threshold', 5),
+            reset_timeout=breaker.get('reset_timeout_seconds', 60)
+        )
+
+    def breaker(self, specialist: str) -> CircuitBreaker:
+        if specialist not in self._breakers:
+            self._breakers[specialist] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self._breakers[specialist]
+
+    def tracker(self, specialist: str) -> LatencyTracker:
+        if specialist not in self._trackers:
+            self._trackers[specialist] = LatencyTracker()
+        return self._trackers[specialist]
+
+    def hedge_delay(self, specialist: str) -> Optional[float]:
+        """Seconds before a duplicate call is started (None: do not hedge)"""
+        if not self.hedging_enabled:
+            return None
+        p = self.tracker(specialist).percentile(self.hedge_percentile, self.hedge_min_samples)
+        if p is None:
+            return self.hedge_initial_delay
+        return max(self.hedge_min_delay, p)
+
+    def backoff(self, attempt: int) -> float:
+        return jittered_backoff(attempt, self.backoff_base, self.backoff_cap)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit state and latency p95 per specialist"""
+        names = set(self._breakers) | set(self._trackers)
+        return {
+            name: {
+                'circuit': self.breaker(name).state,
+                'consecutive_failures': self.breaker(name).failures,
+                'p95_seconds': self.tracker(name).percentile(0.95)
+            }
+            for name in sorted(names)
+        }
@@ -0,0 +1,362 @@
+"""
+ACS-Mentor V3.0 - Semantic Specialist Response Cache
+
+Serves stored specialist answers for semantically similar questions:
+1. One namespace per specialist
+2. Cosine similarity over query embeddings, gated by a threshold
+3. Exact match on the context fields the specialist's prompt uses
+4. Exact match on the query's key terms: numbers, negations, design /
+   method / guideline mentions and outcome types. Embedding similarity
+   alone cannot tell "200 patients" from "40 patients" or an RCT from a
+   cohort study
+5. LRU eviction per namespace and persistence across restarts
+
+Stores only mark their namespace dirty; a background writer thread
+snapshots dirty namespaces at most every flush_interval seconds, so
+consultations on the event loop never wait for disk writes.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+import atexit
+import json
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+from agents.embeddings import create_embedder
+from agents.extraction import get_extractor
+
+
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+_NUMBER_WORDS = re.compile(
+    r"\b(?:one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|"
+    r"single|double|triple|twice|dozen|hundred|thousand|million)\b"
+)
+_NEGATION = re.compile(
+    r"\b(?:not|no|never|none|neither|nor|without|cannot|avoid|instead)\b|n't|[不没无非未勿别]"
+)
+# Outcome / data types and test properties that change the right answer
+_QUALIFIER = re.compile(
+    r"\b(?:continuous|binary|dichotomous|categorical|ordinal|nominal|count|"
+    r"time-to-event|survival|paired|unpaired|independent|repeated|"
+    r"one-sided|two-sided|one-tailed|two-tailed|parametric|non-parametric|nonparametric|"
+    r"superiority|non-inferiority|noninferiority|equivalence|crossover|cluster)\b|"
+    r"连续|二分类|分类|有序|配对|生存"
+)
+
+
+def query_key_terms(query: str, extractor=None) -> str:
+    """
+    Terms two queries must share for one's answer to serve the other
+
+    Args:
+        query: User's query
+        extractor: ReferenceExtractor with the configured vocabulary
+            (default: get_extractor() without configured guidelines)
+
+    Returns:
+        Serialized sorted terms: numbers, number words, negations,
+        qualifiers and every vocabulary label ReferenceExtractor finds
+    """
+    text = query.lower()
+    terms = {f"n:{m.group().replace(',', '')}" for m in _NUMBER.finditer(text)}
+    terms.update(f"w:{m.group()}" for m in _NUMBER_WORDS.finditer(text))
+    terms.update(f"q:{m.group()}" for m in _QUALIFIER.finditer(text))
+    if _NEGATION.search(text):
+        terms.add("negated")
+    terms.update(f"{m.kind}:{m.label}" for m in (extractor or get_extractor()).extract(query).matches)
+    return "|".join(sorted(terms))
+
+
+class _Namespace:
+    """Entries for one specialist"""
+
+    def __init__(self, dim: int):
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.entries: List[Dict[str, Any]] = []  # query, signature, payload, last_used
+
+
+class SemanticResponseCache:
+    """
+    Similarity cache in front of BaseSpecialist.consult
+
+    Usage:
+        cache = SemanticResponseCache.from_config(config)
+        hit = cache.lookup("Stats-Specialist", query, signature)
+        if hit is None:
+            ...
+            cache.store("Stats-Specialist", query, signature, payload)
+    """
+
+    def __init__(
+        self,
+        embedder=None,
+        similarity_threshold: float = 0.92,
+        max_entries_per_namespace: int = 256,
+        persist_dir: Optional[str] = None,
+        flush_interval: float = 2.0,
+        extractor=None
+    ):
+        """
+        Initialize cache
+
+        Args:
+            embedder: Object with embed(text) -> normalized vector
+            similarity_threshold: Minimum cosine similarity for a hit
+            max_entries_per_namespace: LRU bound per specialist
+            persist_dir: Directory for on-disk snapshots (None = memory only)
+            flush_interval: Seconds between a store and the background
+                snapshot of its namespace (stores in between are batched)
+            extractor: ReferenceExtractor for query key terms; should be
+                the specialists' get_extractor(config)
+        """
+        self.embedder = embedder or create_embedder()
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max(1, int(max_entries_per_namespace))
+        self.persist_dir = persist_dir
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.extractor = extractor or get_extractor()
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+
+        # Namespaces changed since their last snapshot; one pending writer
+        self._dirty: Set[str] = set()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._write_lock = threading.Lock()
+        if persist_dir:
+            atexit.register(self.flush)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["SemanticResponseCache"]:
+        """
+        Build cache from cost_management.response_cache
+
+        Returns:
+            SemanticResponseCache, or None when disabled
+        """
+        cache_config = config.get('cost_management', {}).get('response_cache', {})
+        if not cache_config.get('enabled', False):
+            return None
+
+        return cls(
+            embedder=create_embedder(
+                cache_config.get('embedding_model', 'hashing'),
+                dim=cache_config.get('embedding_dim', 512)
+            ),
+            similarity_threshold=cache_config.get('similarity_threshold', 0.92),
+            max_entries_per_namespace=cache_config.get('max_entries_per_specialist', 256),
+            persist_dir=cache_config.get('persist_dir'),
+            flush_interval=cache_config.get('flush_interval_seconds', 2.0),
+            extractor=get_extractor(config)
+        )
+
+    def _namespace(self, name: str) -> _Namespace:
+        """Get (loading from disk on first use) a namespace"""
+        namespace = self._namespaces.get(name)
+        if namespace is None:
+            namespace = self._load(name) or _Namespace(self.embedder.dim)
+            self._namespaces[name] = namespace
+        return namespace
+
+    def preload(self, namespace_names: List[str]) -> None:
+        """Load namespaces' snapshots now rather than on first lookup"""
+        with self._lock:
+            for name in namespace_names:
+                self._namespace(name)
+
+    def lookup(
+        self,
+        namespace_name: str,
+        query: str,
+        signature: str
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Find a stored answer for a similar query
+
+        A candidate must have the same signature and the same key terms
+        (query_key_terms) as the query, then reach similarity_threshold.
+
+        Args:
+            namespace_name: Specialist name
+            query: User's query
+            signature: Serialized context fields that must match exactly
+
+        Returns:
+            (payload, similarity) or None
+        """
+        vector = self.embedder.embed(query)
+        key_terms = query_key_terms(query, self.extractor)
+
+        with self._lock:
+            namespace = self._namespace(namespace_name)
+            if not namespace.entries:
+                self.misses += 1
+                return None
+
+            similarities = namespace.vectors @ vector
+            for i, entry in enumerate(namespace.entries):
+                if entry['signature'] != signature or entry.get('key_terms') != key_terms:
+                    similarities[i] = -1.0
+
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.similarity_threshold:
+                self.misses += 1
+                return None
+
+            entry = namespace.entries[best]
+            entry['last_used'] = time.time()
+            self.hits += 1
+            return entry['payload'], similarity
+
+    def store(
+        self,
+        namespace_name: str,
+        query: str,
+        signature: str,
+        payload: Dict[str, Any]
+    ) -> None:
+        """
+        Store an answer, evicting the least recently used entry if full
+
+        Args:
+            namespace_name: Specialist name
+            query: User's query
+            signature: Serialized context fields
+            payload: JSON-serializable answer (asdict of SpecialistOutput)
+        """
+        vector = self.embedder.embed(query)
+
+        with self._lock:
+            namespace = self._namespace(namespace_name)
+            namespace.entries.append({
+                'query': query,
+                'signature': signature,
+                'key_terms': query_key_terms(query, self.extractor),
+                'payload': payload,
+                'last_used': time.time()
+            })
+            namespace.vectors = np.vstack([namespace.vectors, vector[None, :]])
+
+            while len(namespace.entries) > self.max_entries:
+                oldest = min(range(len(namespace.entries)), key=lambda i: namespace.entries[i]['last_used'])
+                del namespace.entries[oldest]
+                namespace.vectors = np.delete(namespace.vectors, oldest, axis=0)
+                self.evictions += 1
+
+            self._mark_dirty(namespace_name)
+
+    def clear(self, namespace_name: Optional[str] = None) -> None:
+        """Drop one namespace (or all), including snapshots on disk"""
+        with self._lock:
+            names = [namespace_name] if namespace_name else list(self._namespaces)
+            for name in names:
+                self._namespaces[name] = _Namespace(self.embedder.dim)
+                self._mark_dirty(name)
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and namespace sizes"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'namespaces': {name: len(ns.entries) for name, ns in self._namespaces.items()}
+            }
+
+    # ------------------------------------------------------------------
+    # Persistence: <persist_dir>/<namespace>.json + <namespace>.npy
+    # ------------------------------------------------------------------
+
+    def _paths(self, namespace_name: str) -> Tuple[str, str]:
+        """Snapshot file paths for a namespace"""
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", namespace_name)
+        base = os.path.join(self.persist_dir, safe_name)
+        return f"{base}.json", f"{base}.npy"
+
+    def _mark_dirty(self, namespace_name: str) -> None:
+        """Queue a namespace for the background writer (call under _lock)"""
+        if not self.persist_dir:
+            return
+        self._dirty.add(namespace_name)
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.name = "acs-cache-writer"
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write every dirty namespace snapshot now"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            # Entries are copied; vector matrices are replaced, never
+            # modified in place, so snapshots are serialized unlocked
+            pending = {
+                name: ([dict(entry) for entry in self._namespaces[name].entries], self._namespaces[name].vectors)
+                for name in self._dirty if name in self._namespaces
+            }
+            self._dirty.clear()
+
+        with self._write_lock:
+            for name, (entries, vectors) in pending.items():
+                self._save(name, entries, vectors)
+
+    def _load(self, namespace_name: str) -> Optional[_Namespace]:
+        """Load a namespace snapshot (None if absent, stale or corrupt)"""
+        if not self.persist_dir:
+            return None
+
+        meta_path, vector_path = self._paths(namespace_name)
+        if not (os.path.exists(meta_path) and os.path.exists(vector_path)):
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            vectors = np.load(vector_path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable response cache for {namespace_name}: {e}")
+            return None
+
+        # Snapshots from a different embedder are not comparable
+        if meta.get('embedder') != self.embedder.name or len(meta.get('entries', [])) != len(vectors):
+            return None
+
+        namespace = _Namespace(self.embedder.dim)
+        namespace.entries = meta['entries']
+        namespace.vectors = vectors.astype(np.float32)
+        return namespace
+
+    def _save(self, namespace_name: str, entries: List[Dict[str, Any]], vectors: np.ndarray) -> None:
+        """Write a namespace snapshot atomically"""
+        if not self.persist_dir:
+            return
+
+        meta_path, vector_path = self._paths(namespace_name)
+
+        try:
+            os.makedirs(self.persist_dir, exist_ok=True)
+            with open(meta_path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump({'embedder': self.embedder.name, 'entries': entries}, f, ensure_ascii=False)
+            with open(vector_path + ".tmp", 'wb') as f:
+                np.save(f, vectors)
+            os.replace(vector_path + ".tmp", vector_path)
+            os.replace(meta_path + ".tmp", meta_path)
+        except OSError as e:
+            print(f"Warning: Could not persist response cache for {namespace_name}: {e}")
@@ -0,0 +1,171 @@
+"""
+ACS-Mentor V3.0 - Routing Decision Cache
+
+Bounded TTL/LRU cache for the coordinator's RoutingDecisions, keyed on
+the normalized query, the user level and a digest of the project context.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, Dict, Optional
+from collections import OrderedDict
+import dataclasses
+import hashlib
+import json
+import re
+import threading
+import time
+import unicodedata
+
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = " \t\n.?!,;:。？！，；：…"
+
+
+def normalize_query(user_message: str) -> str:
+    """
+    Normalize a query for cache lookups
+
+    Folds case and full-width characters, collapses whitespace and drops
+    trailing punctuation, so trivially re-sent questions share a key.
+
+    Args:
+        user_message: Raw user query
+
+    Returns:
+        Normalized query
+    """
+    text = unicodedata.normalize("NFKC", user_message).lower()
+    text = _WHITESPACE.sub(" ", text).strip()
+    return text.rstrip(_TRAILING_PUNCTUATION)
+
+
+def context_digest(project_context: Any) -> str:
+    """
+    Stable short digest of a project context
+
+    Args:
+        project_context: Project context (any JSON-like value)
+
+    Returns:
+        Hex digest ("none" when there is no context)
+    """
+    if not project_context:
+        return "none"
+    payload = json.dumps(project_context, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class RoutingCache:
+    """
+    TTL + LRU cache of RoutingDecisions
+
+    Usage:
+        cache = RoutingCache(max_entries=1024, ttl_seconds=3600)
+        key = cache.make_key(user_message, user_level, project_context)
+        decision = cache.get(key)
+        if decision is None:
+            decision = route(...)
+            cache.put(key, decision)
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum cached decisions before LRU eviction
+            ttl_seconds: Lifetime of a cached decision
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, decision)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "RoutingCache":
+        """Build cache from parameters.routing.cache"""
+        cache_config = config.get('parameters', {}).get('routing', {}).get('cache', {})
+        return cls(
+            max_entries=cache_config.get('max_entries', 1024),
+            ttl_seconds=cache_config.get('ttl_seconds', 3600)
+        )
+
+    @staticmethod
+    def make_key(user_message: str, user_level: str, project_context: Any = None) -> str:
+        """Cache key for a routing request"""
+        return f"{user_level}|{context_digest(project_context)}|{normalize_query(user_message)}"
+
+    def get(self, key: str):
+        """
+        Look up a decision
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Copy of the cached RoutingDecision, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, decision = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        # Callers get their own copy so cached decisions stay untouched
+        return dataclasses.replace(
+            decision,
+            specialists=list(decision.specialists),
+            domains=list(decision.domains)
+        )
+
+    def peek(self, key: str) -> bool:
+        """True if a live entry exists (does not touch counters or LRU order)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() < entry[0]
+
+    def put(self, key: str, decision) -> None:
+        """Store a decision, evicting the least recently used if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, decision)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop every cached decision (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,409 @@
+"""
+ACS-Mentor V3.0 - Coordinator Service
+
+Long-running process that keeps the coordinator, all specialists, their
+LLM connection pool and the memory / literature components warm, and
+serves them over a local HTTP API:
+
+    POST /coordinate   one query through admission control → JSON answer
+    POST /stream       one query through admission control → NDJSON CoordinationEvents
+    POST /batch        many queries (coordinate_many) → JSON results
+    GET  /healthz      liveness
+    GET  /readyz       readiness (warm-up, components, admission, circuits)
+
+Each connection is handled on its own thread, so health checks answer
+while queries wait in admission control; at most max_pending POST
+requests are in progress at once, beyond that the service answers 503.
+
+Usage:
+    python -m agents.service --port 8765 --max-pending 96
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, Dict, Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import dataclasses
+import json
+import threading
+import time
+
+from agents.coordinator import ACSCoordinator
+from agents.admission import AdmissionRejected, DEFAULT_BUSY_MESSAGE
+
+
+class CoordinatorService:
+    """
+    Resident coordinator with warm components
+
+    Usage:
+        service = CoordinatorService()
+        service.serve_forever()  # blocks; or start() for a background thread
+    """
+
+    def __init__(
+        self,
+        config_path: str = ".acs_mentor/multi_agent_config.yaml",
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        probe: Optional[bool] = None
+    ):
+        """
+        Args:
+            config_path: Path to multi-agent configuration
+            host: Bind address (default parameters.service.host)
+            port: Port, 0 for any free port (default parameters.service.port)
+            max_pending: POST requests in progress at once, running or
+                waiting for admission (default
+                parameters.service.max_pending_requests)
+            probe: Send a health-probe LLM call during warm-up
+                (default parameters.warm_pool.probe)
+        """
+        self.started_at = time.time()
+        self.coordinator = ACSCoordinator(config_path, eager=False)
+        config = self.coordinator.config
+        service_config = config.get('parameters', {}).get('service', {})
+
+        self.host = host or service_config.get('host', '127.0.0.1')
+        self.port = service_config.get('port', 8765) if port is None else port
+        self.max_pending = max_pending or service_config.get('max_pending_requests', 96)
+        self.max_request_bytes = service_config.get('max_request_bytes', 1_000_000)
+
+        if probe is None:
+            probe = config.get('parameters', {}).get('warm_pool', {}).get('probe', True)
+        self.coordinator.eager = True
+        self.coordinator.warm_up(probe=probe)
+
+        components = service_config.get('components', {})
+        self.memory, self.memory_error = self._load_memory(components.get('memory', {}))
+        self.literature, self.literature_error = self._load_literature(components.get('literature', {}))
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._draining = False
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Request bound
+    # ------------------------------------------------------------------
+
+    def begin_request(self) -> bool:
+        """Take a pending-request slot (False when max_pending are in progress)"""
+        with self._pending_lock:
+            if self._pending >= self.max_pending:
+                return False
+            self._pending += 1
+            return True
+
+    def end_request(self) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+    @property
+    def busy_message(self) -> str:
+        admission = self.coordinator.admission
+        return admission.busy_message if admission is not None else DEFAULT_BUSY_MESSAGE
+
+    # ------------------------------------------------------------------
+    # Components
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load_memory(memory_config: Dict) -> Tuple[Any, Optional[str]]:
+        """Warm Mem0 memory (optional: missing dependencies are reported, not fatal)"""
+        if not memory_config.get('enabled', True):
+            return None, "disabled"
+        try:
+            from memory.mem0_integration import ACSMentorMemory
+            return ACSMentorMemory(memory_config.get('config_path', '.acs_mentor/mem0_config.yaml')), None
+        except ImportError as e:
+            print(f"Warning: Memory component unavailable ({e})")
+            return None, f"not installed: {e}"
+        except Exception as e:
+            print(f"Warning: Memory component failed to start: {e}")
+            return None, str(e)
+
+    @staticmethod
+    def _load_literature(literature_config: Dict) -> Tuple[Any, Optional[str]]:
+        """Warm literature indexes (optional: missing dependencies are reported, not fatal)"""
+        if not literature_config.get('enabled', True):
+            return None, "disabled"
+        try:
+            from knowledge.llamaindex_integration import ACSLiteratureSearch
+            return ACSLiteratureSearch(literature_config.get('config_path', '.acs_mentor/literature_config.yaml')), None
+        except ImportError as e:
+            print(f"Warning: Literature component unavailable ({e})")
+            return None, f"not installed: {e}"
+        except Exception as e:
+            print(f"Warning: Literature component failed to start: {e}")
+            return None, str(e)
+
+    # ------------------------------------------------------------------
+    # Health
+    # ------------------------------------------------------------------
+
+    def liveness(self) -> Dict[str, Any]:
+        return {'status': 'alive', 'uptime_seconds': round(time.time() - self.started_at, 3)}
+
+    def readiness(self) -> Dict[str, Any]:
+        """
+        Ready when warm-up succeeded and the service is not draining;
+        memory and literature are optional and only reported
+        """
+        warm_status = self.coordinator.warm_status or {}
+        admission = self.coordinator.admission
+        return {
+            'ready': bool(warm_status.get('ready')) and not self._draining,
+            'draining': self._draining,
+            'warm_up': warm_status,
+            'components': {
+                'memory': {'ready': self.memory is not None, 'error': self.memory_error},
+                'literature': {'ready': self.literature is not None, 'error': self.literature_error}
+            },
+            'admission': admission.metrics() if admission is not None else None,
+            'specialists': self.coordinator.resilience.status(),
+            'requests': {'pending': self._pending, 'max_pending': self.max_pending}
+        }
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    def handle_coordinate(self, body: Dict) -> Dict[str, Any]:
+        """
+        POST /coordinate
+
+        Body: user_message, user_level, project_context, user_id, priority,
+        session_id. With warm memory and a user_id, remembered context is
+        added to project_context['memory'], the user profile to
+        project_context['user_profile'], and the answer is stored.
+        """
+        user_message = _require_message(body)
+        user_level = body.get('user_level', 'intermediate')
+        user_id = body.get('user_id')
+        project_context = body.get('project_context')
+
+        if self.memory is not None and user_id:
+            project_context = dict(project_context or {})
+            project_context['memory'] = self.memory.retrieve_context(user_message, user_id)
+            # response_depth_preference sizes the specialists' output budgets
+            project_context.setdefault('user_profile', self.memory.get_user_profile(user_id))
+
+        started = time.perf_counter()
+        output = self.coordinator.coordinate_admitted(
+            user_message, user_level, project_context,
+            user_id=user_id, priority=body.get('priority'), raise_on_reject=True
+        )
+        seconds = time.perf_counter() - started
+
+        if self.memory is not None and user_id:
+            self.memory.store_interaction(
+                user_message, output,
+                metadata={'mode': 'multi_agent', 'user_level': user_level},
+                user_id=user_id,
+                session_id=body.get('session_id', 'service')
+            )
+
+        return {'output': output, 'seconds': round(seconds, 3)}
+
+    def stream_events(self, body: Dict):
+        """
+        POST /stream: CoordinationEvents as dicts
+
+        Admission-controlled like /coordinate; the slot is held until the
+        stream ends or the client disconnects.
+        """
+        user_message = _require_message(body)
+        for event in self.coordinator.coordinate_stream_admitted(
+            user_message, body.get('user_level', 'intermediate'), body.get('project_context'),
+            user_id=body.get('user_id'), priority=body.get('priority')
+        ):
+            yield {'type': event.type, 'data': event.data}
+
+    def handle_batch(self, body: Dict) -> Dict[str, Any]:
+        """
+        POST /batch
+
+        Body: queries (strings or dicts), user_level, project_context,
+        max_workers, requests_per_second
+        """
+        queries = body.get('queries')
+        if not isinstance(queries, list) or not queries:
+            raise ValueError("'queries' must be a non-empty list")
+        results = self.coordinator.coordinate_many(
+            queries,
+            body.get('user_level', 'intermediate'),
+            body.get('project_context'),
+            max_workers=body.get('max_workers'),
+            requests_per_second=body.get('requests_per_second')
+        )
+        return {'results': [dataclasses.asdict(r) for r in results]}
+
+    # ------------------------------------------------------------------
+    # Server lifecycle
+    # ------------------------------------------------------------------
+
+    def _bind(self) -> ThreadingHTTPServer:
+        if self._server is None:
+            self._server = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+            self.port = self._server.server_address[1]
+            print(f"[Service] Listening on http://{self.host}:{self.port} "
+                  f"(at most {self.max_pending} pending requests)")
+        return self._server
+
+    def serve_forever(self) -> None:
+        """Serve until interrupted"""
+        server = self._bind()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def start(self) -> threading.Thread:
+        """Serve on a background thread (returns once listening)"""
+        server = self._bind()
+        self._thread = threading.Thread(target=server.serve_forever, name="acs-service", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        """Stop accepting requests and release pooled connections"""
+        self._draining = True
+        if self._server is not None:
+            if self._thread is not None:
+                self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self.coordinator.http_clients is not None:
+            self.coordinator.http_clients.close()
+        if self.coordinator.response_cache is not None:
+            self.coordinator.response_cache.flush()
+        print("[Service] Stopped")
+
+
+def _require_message(body: Dict) -> str:
+    user_message = body.get('user_message')
+    if not isinstance(user_message, str) or not user_message.strip():
+        raise ValueError("'user_message' is required")
+    return user_message
+
+
+def _make_handler(service: CoordinatorService):
+    """Request handler class bound to a service instance"""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "ACSMentorService/3.0"
+
+        def log_message(self, format, *args):
+            print(f"[Service] {self.address_string()} {format % args}")
+
+        def _send_json(self, status: int, payload: Dict, headers: Optional[Dict] = None) -> None:
+            data = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _read_body(self) -> Dict:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length > service.max_request_bytes:
+                raise ValueError(f"Request body exceeds {service.max_request_bytes} bytes")
+            body = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(body, dict):
+                raise ValueError("Request body must be a JSON object")
+            return body
+
+        def do_GET(self):
+            if self.path == '/healthz':
+                self._send_json(200, service.liveness())
+            elif self.path == '/readyz':
+                readiness = service.readiness()
+                self._send_json(200 if readiness['ready'] else 503, readiness)
+            else:
+                self._send_json(404, {'error': f"Unknown path {self.path}"})
+
+        def do_POST(self):
+            if self.path not in ('/coordinate', '/stream', '/batch'):
+                self._send_json(404, {'error': f"Unknown path {self.path}"})
+                return
+            if not service.begin_request():
+                self._send_json(503, {'error': "too many pending requests", 'output': service.busy_message},
+                                headers={'Retry-After': '1'})
+                return
+
+            try:
+                body = self._read_body()
+                if self.path == '/stream':
+                    self._stream(service.stream_events(body))
+                elif self.path == '/coordinate':
+                    self._send_json(200, service.handle_coordinate(body))
+                else:
+                    self._send_json(200, service.handle_batch(body))
+            except AdmissionRejected as e:
+                self._send_json(503, {'error': e.reason, 'output': e.busy_message},
+                                headers={'Retry-After': str(int(e.retry_after))})
+            except ValueError as e:  # includes malformed JSON
+                self._send_json(400, {'error': str(e)})
+            except Exception as e:
+                print(f"[Service] {self.path} failed: {type(e).__name__}: {e}")
+                self._send_json(500, {'error': f"{type(e).__name__}: {e}"})
+            finally:
+                service.end_request()
+
+        def _stream(self, events) -> None:
+            """Write events as NDJSON; the response ends when the connection closes"""
+            first = next(events)  # validation / routing errors still get a status code
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+            self.end_headers()
+            self.close_connection = True
+            try:
+                for event in _chain(first, events):
+                    self.wfile.write(json.dumps(event, ensure_ascii=False, default=str).encode('utf-8') + b"\n")
+                    self.wfile.flush()
+            except Exception as e:
+                events.close()
+                if not isinstance(e, (BrokenPipeError, ConnectionResetError)):
+                    error = {'type': 'error', 'data': {'error': f"{type(e).__name__}: {e}"}}
+                    self.wfile.write(json.dumps(error).encode('utf-8') + b"\n")
+
+    return Handler
+
+
+def _chain(first, rest):
+    yield first
+    yield from rest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ACS-Mentor coordinator service")
+    parser.add_argument('--config', default=".acs_mentor/multi_agent_config.yaml")
+    parser.add_argument('--host', default=None)
+    parser.add_argument('--port', type=int, default=None)
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help="POST requests in progress at once before answering 503")
+    parser.add_argument('--no-probe', action='store_true', help="Skip the warm-up LLM health probe")
+    args = parser.parse_args()
+
+    service = CoordinatorService(
+        args.config,
+        host=args.host,
+        port=args.port,
+        max_pending=args.max_pending,
+        probe=False if args.no_probe else None
+    )
+    service.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+ACS-Mentor V3.0 - Soul DNA Registry
+
+Loads the soul DNA files in .acs_mentor/souls (<key>_dna.yaml) and compiles
+their prompt-relevant parts into persona blocks for the specialists:
+
+    identity (name, codename, cognitive type, role) → worldview →
+    core beliefs → forbidden practices
+
+Souls are loaded lazily, one file per soul. Compiled souls are kept in a
+pickle snapshot keyed on each file's mtime and size, so a restarted worker
+only parses the YAML of souls that changed.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field, asdict
+import glob
+import os
+import pickle
+import threading
+
+import yaml
+
+
+SNAPSHOT_FORMAT = 1
+
+
+class SoulValidationError(ValueError):
+    """A soul DNA file is unreadable or misses required fields"""
+
+
+@dataclass
+class SoulProfile:
+    """Compiled soul DNA"""
+    key: str  # File stem without _dna (e.g. 'designer')
+    name: str
+    codename: str
+    cognitive_type: str
+    role: str
+    worldview: str
+    beliefs: List[str] = field(default_factory=list)
+    forbidden: List[str] = field(default_factory=list)
+    persona: str = ""  # Ready-to-use persona block (see PromptTemplate.set_persona)
+
+
+def _flatten(value) -> List[str]:
+    """Strings of a list, or of a mapping of lists, in document order"""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [item for nested in value.values() for item in _flatten(nested)]
+    if isinstance(value, list):
+        return [item for nested in value for item in _flatten(nested)]
+    return []
+
+
+def _first_line(value) -> str:
+    """First non-empty line of a text field"""
+    for line in _flatten(value):
+        for part in line.splitlines():
+            if part.strip():
+                return part.strip()
+    return ""
+
+
+def compile_soul(key: str, document: Dict, max_beliefs: int = 6, max_forbidden: int = 4) -> SoulProfile:
+    """
+    Validate a parsed soul DNA file and compile its persona
+
+    Args:
+        key: Soul key
+        document: Parsed YAML
+        max_beliefs: Core beliefs kept in the persona
+        max_forbidden: Forbidden practices kept in the persona
+
+    Returns:
+        SoulProfile
+
+    Raises:
+        SoulValidationError: Missing soul_identity.name or core_beliefs
+    """
+    if not isinstance(document, dict):
+        raise SoulValidationError(f"Soul '{key}' is not a mapping")
+    identity = document.get('soul_identity')
+    if not isinstance(identity, dict) or not identity.get('name'):
+        raise SoulValidationError(f"Soul '{key}' has no soul_identity.name")
+    beliefs = [b.strip() for b in _flatten(document.get('core_beliefs')) if b.strip()]
+    if not beliefs:
+        raise SoulValidationError(f"Soul '{key}' has no core_beliefs")
+
+    perspective = document.get('unique_perspective') or {}
+    forbidden = _flatten(document.get('forbidden_practices')) or \
+        _flatten((document.get('cognitive_characteristics') or {}).get('anti_pattern'))
+
+    soul = SoulProfile(
+        key=key,
+        name=str(identity['name']),
+        codename=str(identity.get('codename', '')),
+        cognitive_type=str(identity.get('cognitive_type') or document.get('cognitive_type') or ''),
+        role=_first_line(identity.get('role') or identity.get('cognitive_profile')),
+        worldview=_first_line(perspective.get('worldview') or perspective.get('core_metaphor')),
+        beliefs=beliefs[:max_beliefs],
+        forbidden=[f.lstrip("❌⚠️ ").strip() for f in forbidden[:max_forbidden]]
+    )
+
+    lines = [f"## Persona: {soul.name}" + (f" ({soul.codename})" if soul.codename else "")]
+    if soul.cognitive_type:
+        lines.append(f"Cognitive type: {soul.cognitive_type}")
+    if soul.role:
+        lines.append(f"Role: {soul.role}")
+    if soul.worldview:
+        lines.append(f"Worldview: {soul.worldview}")
+    lines.append("Core beliefs:")
+    lines.extend(f"- {belief}" for belief in soul.beliefs)
+    if soul.forbidden:
+        lines.append("Never:")
+        lines.extend(f"- {item}" for item in soul.forbidden)
+    soul.persona = "\n".join(lines)
+    return soul
+
+
+class SoulRegistry:
+    """
+    Lazily loaded, snapshot-cached soul DNA
+
+    Usage:
+        registry = SoulRegistry(".acs_mentor/souls", ".acs_mentor/cache/souls.pkl")
+        persona = registry.persona("designer")
+    """
+
+    def __init__(
+        self,
+        souls_dir: str,
+        snapshot_path: Optional[str] = None,
+        max_beliefs: int = 6,
+        max_forbidden: int = 4,
+        agents: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            souls_dir: Directory of <key>_dna.yaml files
+            snapshot_path: Pickle snapshot of compiled souls (None: no snapshot)
+            max_beliefs: Core beliefs kept per persona
+            max_forbidden: Forbidden practices kept per persona
+            agents: Config section key (e.g. 'design_specialist') → soul key
+        """
+        self.souls_dir = souls_dir
+        self.snapshot_path = snapshot_path
+        self.max_beliefs = max_beliefs
+        self.max_forbidden = max_forbidden
+        self.agents = dict(agents or {})
+        self._souls: Dict[str, Optional[SoulProfile]] = {}
+        self._snapshot: Optional[Dict] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["SoulRegistry"]:
+        """
+        Build from parameters.souls
+
+        Returns:
+            SoulRegistry, or None when disabled
+        """
+        souls_config = config.get('parameters', {}).get('souls', {})
+        if not souls_config.get('enabled', False):
+            return None
+
+        return cls(
+            souls_config.get('souls_dir', '.acs_mentor/souls'),
+            snapshot_path=souls_config.get('snapshot_path', '.acs_mentor/cache/souls.pkl'),
+            max_beliefs=souls_config.get('max_beliefs', 6),
+            max_forbidden=souls_config.get('max_forbidden', 4),
+            agents=souls_config.get('agents', {})
+        )
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.souls_dir, f"{key}_dna.yaml")
+
+    def keys(self) -> List[str]:
+        """Keys of the soul files on disk"""
+        pattern = os.path.join(self.souls_dir, "*_dna.yaml")
+        return sorted(os.path.basename(path)[:-len("_dna.yaml")] for path in glob.glob(pattern))
+
+    # ------------------------------------------------------------------
+    # Snapshot: {format, options, souls: {key: {mtime_ns, size, soul}}}
+    # ------------------------------------------------------------------
+
+    def _options(self) -> Dict:
+        return {'max_beliefs': self.max_beliefs, 'max_forbidden': self.max_forbidden}
+
+    def _load_snapshot(self) -> Dict:
+        """Snapshot entries (read once; empty if absent, unreadable or built with other options)"""
+        if self._snapshot is not None:
+            return self._snapshot
+
+        self._snapshot = {}
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, 'rb') as f:
+                    data = pickle.load(f)
+                if data.get('format') == SNAPSHOT_FORMAT and data.get('options') == self._options():
+                    self._snapshot = data.get('souls', {})
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError) as e:
+                print(f"Warning: Ignoring unreadable soul snapshot {self.snapshot_path}: {e}")
+        return self._snapshot
+
+    def _save_snapshot(self) -> None:
+        """Write the snapshot atomically"""
+        if not self.snapshot_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+            with open(self.snapshot_path + ".tmp", 'wb') as f:
+                pickle.dump(
+                    {'format': SNAPSHOT_FORMAT, 'options': self._options(), 'souls': self._snapshot},
+                    f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(self.snapshot_path + ".tmp", self.snapshot_path)
+        except OSError as e:
+            print(f"Warning: Could not write soul snapshot {self.snapshot_path}: {e}")
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _compile(self, key: str) -> SoulProfile:
+        """Parse and compile one soul file"""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                document = yaml.safe_load(f)
+        except (OSError, yaml.YAMLError) as e:
+            raise SoulValidationError(f"Soul '{key}' could not be read: {e}") from e
+        return compile_soul(key, document, self.max_beliefs, self.max_forbidden)
+
+    def get(self, key: str) -> Optional[SoulProfile]:
+        """
+        Compiled soul (from the snapshot when the file is unchanged)
+
+        Returns:
+            SoulProfile, or None if the file is missing or invalid
+        """
+        if key in self._souls:
+            return self._souls[key]
+
+        with self._lock:
+            if key in self._souls:
+                return self._souls[key]
+
+            soul = None
+            try:
+                stat = os.stat(self._path(key))
+            except OSError:
+                print(f"Warning: No soul DNA file for '{key}' in {self.souls_dir}")
+                self._souls[key] = None
+                return None
+
+            snapshot = self._load_snapshot()
+            entry = snapshot.get(key)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                soul = SoulProfile(**entry['soul'])
+            else:
+                try:
+                    soul = self._compile(key)
+                except SoulValidationError as e:
+                    print(f"Warning: {e}")
+                else:
+                    snapshot[key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'soul': asdict(soul)}
+                    self._save_snapshot()
+
+            self._souls[key] = soul
+            return soul
+
+    def persona(self, key: Optional[str]) -> Optional[str]:
+        """Persona block of a soul (None if unknown or invalid)"""
+        soul = self.get(key) if key else None
+        return soul.persona if soul else None
+
+    def persona_for(self, section_key: str) -> Optional[str]:
+        """Persona of the soul mapped to an agent section (parameters.souls.agents)"""
+        return self.persona(self.agents.get(section_key))
+
+    def validate_all(self) -> Dict[str, Optional[str]]:
+        """
+        Parse and validate every soul file (ignores the snapshot)
+
+        Returns:
+            Soul key → error message, or None if valid
+        """
+        results = {}
+        for key in self.keys():
+            try:
+                self._compile(key)
+                results[key] = None
+            except SoulValidationError as e:
+                results[key] = str(e)
+        return results
+
+
+_registries: Dict[tuple, Optional[SoulRegistry]] = {}
+
+
+def get_soul_registry(config: Optional[Dict] = None) -> Optional[SoulRegistry]:
+    """Shared SoulRegistry for a configuration (None when disabled)"""
+    souls_config = (config or {}).get('parameters', {}).get('souls', {})
+    key = repr(sorted(souls_config.items()))
+    if key not in _registries:
+        _registries[key] = SoulRegistry.from_config(config or {})
+    return _registries[key]
@@ -12,15 +12,25 @@ Version: 3.0.0
 Date: 2025-11-17
 """
 
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-
-try:
-    from langchain.chat_models import ChatOpenAI
-    from langchain.schema import HumanMessage, SystemMessage
-except ImportError:
-    print("Warning: LangChain not installed")
+from dataclasses import dataclass, field, asdict
+import asyncio
+import dataclasses
+import json
+import re
+import time
+
+from agents.async_utils import acall_llm, astream_llm, run_sync
+from agents.extraction import ExtractionResult, extract_plan_facts, get_extractor
+from agents.knowledge_index import KnowledgeExcerpt, get_knowledge_retriever
+from agents.llm_providers import HumanMessage, SystemMessage, create_chat_model
+from agents.output_budget import OutputBudget, get_output_budget_planner
+from agents.prompt_assembly import AssembledPrompt, compile_prompt
+from agents.soul_registry import get_soul_registry
+from agents.tokens import estimate_tokens
+from agents.model_tiers import ModelTier
+from agents.tracing import child_span, current_span
 
 
 @dataclass
@@ -31,33 +41,169 @@ class SpecialistOutput:
     output: str
     confidence: float
     references: List[str]
+    metadata: Dict = field(default_factory=dict)  # cache hits, model tier, etc.
+
+
+BATCH_INSTRUCTIONS = """Answer each of the {count} questions below independently, as if it were asked alone (about {answer_tokens} tokens each).
+Return only a JSON object of the form {{"answers": [{{"question": 1, "answer": "..."}}, ...]}} with one entry per question, in order."""
+
+
+def parse_batch_answers(text: str, count: int) -> List[Optional[str]]:
+    """
+    Split a packed answer back into per-question answers
+
+    Accepts the JSON object asked for in BATCH_INSTRUCTIONS, optionally in
+    a code fence or surrounded by prose.
+
+    Args:
+        text: Model response
+        count: Number of questions asked
+
+    Returns:
+        Answer text per question, None where missing or unparseable
+    """
+    answers: List[Optional[str]] = [None] * count
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    if match is None:
+        return answers
+    try:
+        data = json.loads(match.group())
+    except json.JSONDecodeError:
+        return answers
+
+    entries = data.get('answers') if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        return answers
+
+    for position, entry in enumerate(entries):
+        if isinstance(entry, dict):
+            number, answer = entry.get('question', position + 1), entry.get('answer')
+        else:
+            number, answer = position + 1, entry
+        if isinstance(number, str) and number.strip().isdigit():
+            number = int(number)
+        if isinstance(number, int) and 1 <= number <= count and isinstance(answer, str) and answer.strip():
+            answers[number - 1] = answer.strip()
+    return answers
 
 
 class BaseSpecialist(ABC):
     """Base class for all specialist agents"""
 
-    def __init__(self, config: Dict, specialist_key: str):
+    # Context fields a specialist's prompt depends on; cached answers are
+    # only reused when these match exactly
+    cache_context_keys: Tuple[str, ...] = ('user_level',)
+
+    # Key in v25_integration.knowledge.specialist_knowledge_base (None: no index)
+    knowledge_domain: Optional[str] = None
+
+    def __init__(self, config: Dict, specialist_key: str, response_cache=None, http_clients=None):
         """
         Initialize specialist
 
         Args:
             config: Full multi-agent configuration
             specialist_key: Key in config (e.g., 'design_specialist')
+            response_cache: Optional SemanticResponseCache shared across specialists
+            http_clients: Optional SharedHTTPClients pooling LLM connections
         """
         self.config = config
         self.specialist_config = config.get(specialist_key, {})
+        self.http_clients = http_clients
+        souls = get_soul_registry(config)
+        self.prompt = compile_prompt(  # Compiled once per specialist
+            config, specialist_key,
+            persona=souls.persona_for(specialist_key) if souls else None
+        )
+        self.extractor = get_extractor(config)  # Shared by all specialists
+        self.knowledge = get_knowledge_retriever(config) if self.knowledge_domain else None
+        self.budget_planner = get_output_budget_planner(config)  # Shared; None: fixed max_tokens
         self.llm = self._initialize_llm()
+        self.response_cache = response_cache
+        self._tier_llms = {}  # Tier name → LLM client
+
+    def _initialize_llm(self, tier=None):
+        """
+        Initialize LLM for this specialist
+
+        Args:
+            tier: Optional ModelTier overriding model / max_tokens / temperature
+        """
+        llm_config = self.specialist_config.get('llm_config', {})
+        temperature = llm_config.get('temperature', 0.2)
+        max_tokens = llm_config.get('max_tokens', 2000)
+        model = llm_config.get('model', 'gpt-4')
+        if tier is not None:
+            model = tier.model
+            temperature = temperature if tier.temperature is None else tier.temperature
+            max_tokens = max_tokens if tier.max_tokens is None else tier.max_tokens
+
+        return create_chat_model(
+            self.config,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **(self.http_clients.llm_kwargs() if self.http_clients else {})
+        )
+
+    def _select_llm(self, context: Optional[Dict] = None, budget: Optional[OutputBudget] = None):
+        """
+        LLM for a consultation: the tier the coordinator chose for this
+        specialist (context['model_tiers']), else the configured model,
+        with max_tokens set to the output budget if one is given
 
-    def _initialize_llm(self):
-        """Initialize LLM for this specialist"""
+        Returns:
+            (llm, ModelTier or None)
+        """
+        tier = ((context or {}).get('model_tiers') or {}).get(self.name)
+        if budget is not None:
+            tier = dataclasses.replace(self._base_tier(tier), max_tokens=budget.max_tokens)
+        if tier is None:
+            return self.llm, None
+        if tier not in self._tier_llms:
+            self._tier_llms[tier] = self._initialize_llm(tier)
+        return self._tier_llms[tier], tier
+
+    def _base_tier(self, tier: Optional[ModelTier]) -> ModelTier:
+        """The coordinator's tier, or the configured model and max_tokens as a tier"""
+        if tier is not None:
+            return tier
         llm_config = self.specialist_config.get('llm_config', {})
-        return ChatOpenAI(
+        return ModelTier(
+            name='configured',
             model=llm_config.get('model', 'gpt-4'),
-            temperature=llm_config.get('temperature', 0.2),
             max_tokens=llm_config.get('max_tokens', 2000)
         )
 
-    @abstractmethod
+    def _plan_output(self, context: Optional[Dict] = None) -> Optional[OutputBudget]:
+        """Completion budget and depth instruction for a consultation (None: fixed max_tokens)"""
+        if self.budget_planner is None:
+            return None
+        tier = ((context or {}).get('model_tiers') or {}).get(self.name)
+        ceiling = self._base_tier(tier).max_tokens or self.specialist_config.get('llm_config', {}).get('max_tokens', 2000)
+        budget = self.budget_planner.plan(self.name, context, ceiling)
+        current_span().set('output_budget_tokens', budget.max_tokens)
+        return budget
+
+    def _record_budget(self, output: SpecialistOutput, budget: Optional[OutputBudget], response=None) -> SpecialistOutput:
+        """Feed the answer length back to the planner and note the budget"""
+        if budget is None:
+            return output
+        usage = getattr(response, 'usage_metadata', None) or {}
+        completion_tokens = usage.get('output_tokens') or estimate_tokens(output.output)
+        self.budget_planner.record(self.name, completion_tokens, budget)
+        output.metadata['output_budget'] = dict(budget.stats(), completion_tokens=completion_tokens)
+        return output
+
+    @staticmethod
+    def _record_tier(output: SpecialistOutput, tier, prompt: Optional[AssembledPrompt] = None) -> SpecialistOutput:
+        """Note the model tier and prompt size that produced an output"""
+        if tier is not None:
+            output.metadata['model_tier'] = {'tier': tier.name, 'model': tier.model}
+        if prompt is not None:
+            output.metadata['prompt'] = prompt.stats()
+        return output
+
     def consult(self, user_message: str, context: Optional[Dict] = None) -> SpecialistOutput:
         """
         Provide specialist consultation
@@ -66,6 +212,456 @@ class BaseSpecialist(ABC):
             user_message: User's query
             context: Additional context
 
+        Returns:
+            SpecialistOutput
+        """
+        cached = self._lookup_cache(user_message, context)
+        if cached is not None:
+            return cached
+
+        budget = self._plan_output(context)
+        llm, tier = self._select_llm(context, budget)
+        excerpts = self._retrieve_knowledge(user_message, context)
+        messages, prompt = self._prepare_messages(user_message, context, excerpts, budget)
+        response = llm(messages)
+        output = self._record_tier(self._build_output(response.content, context), tier, prompt)
+        self._ground_references(output, excerpts)
+        self._record_budget(output, budget, response)
+        self._store_cache(user_message, context, output)
+        return output
+
+    async def aconsult(self, user_message: str, context: Optional[Dict] = None) -> SpecialistOutput:
+        """
+        Provide specialist consultation without blocking the event loop
+
+        Args:
+            user_message: User's query
+            context: Additional context
+
+        Returns:
+            SpecialistOutput
+        """
+        cached = self._lookup_cache(user_message, context)
+        if cached is not None:
+            return cached
+
+        budget = self._plan_output(context)
+        llm, tier = self._select_llm(context, budget)
+        excerpts = self._retrieve_knowledge(user_message, context)
+        messages, prompt = self._prepare_messages(user_message, context, excerpts, budget)
+        response = await acall_llm(llm, messages)
+        output = self._record_tier(self._build_output(response.content, context), tier, prompt)
+        self._ground_references(output, excerpts)
+        self._record_budget(output, budget, response)
+        self._store_cache(user_message, context, output)
+        return output
+
+    async def astream_consult(
+        self,
+        user_message: str,
+        context: Optional[Dict] = None
+    ) -> AsyncIterator[Union[str, SpecialistOutput]]:
+        """
+        Stream a consultation as it is generated
+
+        Args:
+            user_message: User's query
+            context: Additional context
+
+        Yields:
+            Text chunks, followed by the final SpecialistOutput
+        """
+        cached = self._lookup_cache(user_message, context)
+        if cached is not None:
+            yield cached.output
+            yield cached
+            return
+
+        budget = self._plan_output(context)
+        llm, tier = self._select_llm(context, budget)
+        excerpts = self._retrieve_knowledge(user_message, context)
+        messages, prompt = self._prepare_messages(user_message, context, excerpts, budget)
+        chunks = []
+        async for chunk in astream_llm(llm, messages):
+            chunks.append(chunk)
+            yield chunk
+
+        output = self._record_tier(self._build_output("".join(chunks), context), tier, prompt)
+        self._ground_references(output, excerpts)
+        self._record_budget(output, budget)
+        self._store_cache(user_message, context, output)
+        yield output
+
+    def consult_many(
+        self,
+        user_messages: List[str],
+        context: Optional[Dict] = None
+    ) -> List[SpecialistOutput]:
+        """
+        Answer several independent questions with as few LLM calls as possible
+
+        For offline workloads (re-grading, benchmark runs). Questions are
+        packed into structured requests up to the parameters.consult_batch
+        budgets and the answers are split back per question; questions
+        whose answer cannot be parsed are retried with single calls.
+
+        Args:
+            user_messages: Independent questions
+            context: Context shared by all questions
+
+        Returns:
+            One SpecialistOutput per question, in input order
+        """
+        return run_sync(self.aconsult_many(user_messages, context))
+
+    async def aconsult_many(
+        self,
+        user_messages: List[str],
+        context: Optional[Dict] = None
+    ) -> List[SpecialistOutput]:
+        """Async version of consult_many"""
+        results: List[Optional[SpecialistOutput]] = [None] * len(user_messages)
+        pending = []
+        for index, user_message in enumerate(user_messages):
+            results[index] = self._lookup_cache(user_message, context)
+            if results[index] is None:
+                pending.append(index)
+
+        # Handoffs are specific to one question; answer those one by one
+        batch_config = self.config.get('parameters', {}).get('consult_batch', {})
+        handoff = context and (context.get('previous_specialist_outputs') or context.get('iteration_feedback'))
+        if not batch_config.get('enabled', True) or handoff:
+            packs = [[index] for index in pending]
+        else:
+            packs = self._pack_questions(user_messages, pending, context, batch_config)
+
+        async def run_pack(pack: List[int]):
+            if len(pack) == 1:
+                results[pack[0]] = await self.aconsult(user_messages[pack[0]], context)
+                return
+
+            answers = await self._aconsult_pack([user_messages[i] for i in pack], context, batch_config)
+            retry = []
+            for index, output in zip(pack, answers):
+                if output is None:
+                    retry.append(index)
+                else:
+                    results[index] = output
+                    self._store_cache(user_messages[index], context, output)
+
+            if retry:
+                print(f"[{self.name}] Batch answers missing for {len(retry)} of {len(pack)} "
+                      f"questions, falling back to single calls")
+                singles = await asyncio.gather(*(self.aconsult(user_messages[i], context) for i in retry))
+                for index, output in zip(retry, singles):
+                    results[index] = output
+
+        await asyncio.gather(*(run_pack(pack) for pack in packs))
+        return results
+
+    def _pack_questions(
+        self,
+        user_messages: List[str],
+        indices: List[int],
+        context: Optional[Dict],
+        batch_config: Dict
+    ) -> List[List[int]]:
+        """Group questions greedily within the question, prompt and completion budgets"""
+        max_questions = max(1, batch_config.get('max_questions', 8))
+        max_prompt_tokens = batch_config.get('max_prompt_tokens', 6000)
+        answer_tokens = batch_config.get('answer_tokens', 700)
+        max_completion_tokens = batch_config.get('max_completion_tokens', 6000)
+        per_pack = max(1, min(max_questions, max_completion_tokens // max(1, answer_tokens)))
+
+        packs, current, current_tokens = [], [], self.prompt.prefix_tokens
+        for index in indices:
+            fields = self._prompt_fields(user_messages[index], context)
+            tokens = estimate_tokens(self.prompt.render_variable(fields))
+            if current and (len(current) >= per_pack or current_tokens + tokens > max_prompt_tokens):
+                packs.append(current)
+                current, current_tokens = [], self.prompt.prefix_tokens
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            packs.append(current)
+        return packs
+
+    async def _aconsult_pack(
+        self,
+        user_messages: List[str],
+        context: Optional[Dict],
+        batch_config: Dict
+    ) -> List[Optional[SpecialistOutput]]:
+        """
+        One LLM call answering several questions
+
+        Returns:
+            Output per question, None where no answer could be parsed
+        """
+        llm, tier = self._select_llm(context)
+        answer_tokens = batch_config.get('answer_tokens', 700)
+        # One client per tier: sized for the largest pack, not this one
+        pack_tier = self._pack_tier(tier, min(
+            batch_config.get('max_completion_tokens', 6000),
+            answer_tokens * max(1, batch_config.get('max_questions', 8))
+        ))
+        if pack_tier not in self._tier_llms:
+            self._tier_llms[pack_tier] = self._initialize_llm(pack_tier)
+        pack_llm = self._tier_llms[pack_tier]
+        if batch_config.get('json_mode', False) and hasattr(pack_llm, 'bind'):
+            pack_llm = pack_llm.bind(response_format={"type": "json_object"})
+
+        prompt = self.prompt.assemble_batch(
+            [self._prompt_fields(user_message, context) for user_message in user_messages],
+            BATCH_INSTRUCTIONS.format(count=len(user_messages), answer_tokens=answer_tokens)
+        )
+        messages = [SystemMessage(content=prompt.system), HumanMessage(content=prompt.user)]
+
+        with child_span('consult_batch', specialist=self.name, questions=len(user_messages)) as span:
+            try:
+                response = await acall_llm(pack_llm, messages)
+            except Exception as e:
+                print(f"[{self.name}] Batch call failed ({type(e).__name__}: {e})")
+                span.set('parsed', 0)
+                return [None] * len(user_messages)
+
+            answers = parse_batch_answers(response.content, len(user_messages))
+            span.set('parsed', sum(1 for a in answers if a))
+
+        outputs = []
+        for position, answer in enumerate(answers):
+            if not answer:
+                outputs.append(None)
+                continue
+            output = self._record_tier(self._build_output(answer, context), tier, prompt)
+            output.metadata['batch'] = {'size': len(user_messages), 'position': position}
+            outputs.append(output)
+        return outputs
+
+    def _pack_tier(self, tier: Optional[ModelTier], completion_tokens: int) -> ModelTier:
+        """Tier of a packed call: the question's model with room for every answer"""
+        tier = self._base_tier(tier)
+        return dataclasses.replace(tier, name=f"{tier.name}-batch", max_tokens=completion_tokens)
+
+    def _cache_signature(self, context: Optional[Dict] = None) -> Optional[str]:
+        """
+        Serialize the context fields that must match for a cache hit
+
+        Returns:
+            Signature string, or None if this consultation is not cacheable
+        """
+        if self.response_cache is None:
+            return None
+
+        # Handoff answers depend on other specialists; never reuse them
+        if context and (context.get('previous_specialist_outputs') or context.get('iteration_feedback')):
+            return None
+
+        fields = {key: (context or {}).get(key) for key in self.cache_context_keys}
+
+        # Brief and detailed answers to the same question differ
+        if self.budget_planner is not None:
+            fields['depth'] = self.budget_planner.depth_preference(context)
+
+        # Answers from a cheaper tier must not be served to a higher one
+        tier = ((context or {}).get('model_tiers') or {}).get(self.name)
+        if tier is not None:
+            fields['model_tier'] = tier.name
+        return json.dumps(fields, sort_keys=True, default=str)
+
+    def _lookup_cache(self, user_message: str, context: Optional[Dict] = None) -> Optional[SpecialistOutput]:
+        """Return a cached answer to a similar question, if any"""
+        signature = self._cache_signature(context)
+        if signature is None:
+            return None
+
+        hit = self.response_cache.lookup(self.name, user_message, signature)
+        if hit is None:
+            return None
+
+        payload, similarity = hit
+        output = SpecialistOutput(**payload)
+        output.metadata = dict(output.metadata, cache={'hit': True, 'similarity': round(similarity, 4)})
+        return output
+
+    def _store_cache(self, user_message: str, context: Optional[Dict], output: SpecialistOutput):
+        """Remember an answer for similar future questions"""
+        signature = self._cache_signature(context)
+        if signature is not None:
+            self.response_cache.store(self.name, user_message, signature, asdict(output))
+
+    def _prepare_messages(
+        self,
+        user_message: str,
+        context: Optional[Dict] = None,
+        excerpts: Optional[List[KnowledgeExcerpt]] = None,
+        budget: Optional[OutputBudget] = None
+    ) -> Tuple[List, AssembledPrompt]:
+        """
+        Specialist prompt plus retrieved guideline excerpts, any input
+        handed off by other specialists and the response-depth instruction
+
+        Static content comes first (see agents.prompt_assembly) and the
+        per-call blocks last, so provider prompt caches can reuse the
+        prefix; its size is recorded on the active span.
+
+        Returns:
+            (chat messages, AssembledPrompt)
+        """
+        prompt = self.prompt.assemble(**self._prompt_fields(user_message, context))
+
+        user_content = prompt.user
+        for block in (self._format_knowledge(excerpts), self._format_handoff(context), self._format_budget(budget)):
+            if block:
+                user_content = f"{user_content}\n\n{block}"
+                prompt.total_tokens += estimate_tokens(block)
+
+        span = current_span()
+        span.set('prompt_prefix_tokens', prompt.prefix_tokens)
+        span.set('prompt_total_tokens', prompt.total_tokens)
+
+        messages = [SystemMessage(content=prompt.system), HumanMessage(content=user_content)]
+        return messages, prompt
+
+    def _knowledge_query(self, user_message: str, context: Optional[Dict] = None) -> str:
+        """Retrieval query: the question plus the context fields the prompt depends on"""
+        parts = [user_message]
+        for key in self.cache_context_keys:
+            value = (context or {}).get(key)
+            if key != 'user_level' and isinstance(value, str) and value != 'Not specified':
+                parts.append(value)
+        return " ".join(parts)
+
+    def _retrieve_knowledge(self, user_message: str, context: Optional[Dict] = None) -> List[KnowledgeExcerpt]:
+        """
+        Guideline excerpts from this specialist's knowledge index
+
+        Local embedding lookup (no LLM call); its duration is recorded as
+        knowledge_ms on the active span.
+        """
+        if self.knowledge is None:
+            return []
+
+        started = time.perf_counter()
+        try:
+            excerpts = self.knowledge.retrieve(self.knowledge_domain, self._knowledge_query(user_message, context))
+        except Exception as e:
+            print(f"[{self.name}] Knowledge retrieval failed ({type(e).__name__}: {e})")
+            excerpts = []
+
+        span = current_span()
+        span.set('knowledge_ms', round((time.perf_counter() - started) * 1000, 3))
+        span.set('knowledge_hits', len(excerpts))
+        return excerpts
+
+    @staticmethod
+    def _format_knowledge(excerpts: Optional[List[KnowledgeExcerpt]]) -> str:
+        """Render retrieved excerpts for the prompt"""
+        if not excerpts:
+            return ""
+        lines = ["Relevant guideline items (cite the item numbers you rely on):"]
+        lines.extend(f"- [{e.citation}] {e.topic}: {e.text}" for e in excerpts)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _ground_references(output: SpecialistOutput, excerpts: Optional[List[KnowledgeExcerpt]]) -> SpecialistOutput:
+        """
+        Add the retrieved items of every guideline the answer draws on to
+        its references, and note all retrieved excerpts in the metadata
+        """
+        if not excerpts:
+            return output
+
+        cited = []
+        for excerpt in excerpts:
+            used = excerpt.acronym in output.output or any(excerpt.acronym in ref for ref in output.references)
+            if used and excerpt.citation not in output.references:
+                output.references.append(excerpt.citation)
+            cited.append({
+                'id': excerpt.id,
+                'citation': excerpt.citation,
+                'score': round(excerpt.score, 4),
+                'cited': used
+            })
+        output.metadata['knowledge'] = cited
+        return output
+
+    @staticmethod
+    def _format_budget(budget: Optional[OutputBudget]) -> str:
+        """Response-depth instruction sized to the completion budget"""
+        if budget is None:
+            return ""
+        # Aim below the hard cap so answers end before being cut off
+        words = int(budget.max_tokens * 0.8 * 0.75) // 10 * 10
+        return f"Response length: {budget.instruction} Stay within about {words} words."
+
+    @staticmethod
+    def _upstream_designs(context: Optional[Dict], specialist: str = 'Design-Specialist') -> set:
+        """
+        Study designs an upstream specialist decided on
+
+        Uses the 'designs' field of previous_specialist_outputs entries
+        (extracted from the full output), never the possibly compacted
+        prompt text; entries without it are extracted here.
+        """
+        designs = set()
+        for prev in (context.get('previous_specialist_outputs', []) if context else []):
+            if prev['specialist'] == specialist:
+                designs.update(prev['designs'] if 'designs' in prev else extract_plan_facts(prev['output']).designs)
+        return designs
+
+    def _format_handoff(self, context: Optional[Dict] = None) -> str:
+        """Render previous_specialist_outputs / iteration_feedback for the prompt"""
+        blocks = []
+
+        previous_outputs = context.get('previous_specialist_outputs', []) if context else []
+        if previous_outputs:
+            sections = [f"### {prev['specialist']}\n{prev['output']}" for prev in previous_outputs]
+            blocks.append("Input from other specialists (build on this):\n\n" + "\n\n".join(sections))
+
+        feedback = context.get('iteration_feedback') if context else None
+        if feedback:
+            lines = [
+                f"Iteration {feedback['iteration']}: changes from other specialists since your last answer.",
+                f"Your previous plan: {feedback['your_previous_plan']}"
+            ]
+            for update in feedback['updates']:
+                lines.append(f"### {update['specialist']}")
+                for field_name, change in update['changes'].items():
+                    label = field_name.replace('_', ' ')
+                    if change['added']:
+                        lines.append(f"- {label} now: {', '.join(str(v) for v in change['added'])}")
+                    if change['removed']:
+                        lines.append(f"- {label} dropped: {', '.join(str(v) for v in change['removed'])}")
+                lines.extend(f"> {excerpt}" for excerpt in update['excerpts'])
+            lines.append("Revise your plan only where needed to be consistent with these changes.")
+            blocks.append("\n".join(lines))
+
+        return "\n\n".join(blocks)
+
+    @abstractmethod
+    def _prompt_fields(self, user_message: str, context: Optional[Dict] = None) -> Dict:
+        """
+        Values for the task-prompt fields of a consultation
+
+        Args:
+            user_message: User's query
+            context: Additional context
+
+        Returns:
+            Field name → value
+        """
+        pass
+
+    @abstractmethod
+    def _build_output(self, output_text: str, context: Optional[Dict] = None) -> SpecialistOutput:
+        """
+        Turn the LLM's answer into a SpecialistOutput
+
+        Args:
+            output_text: LLM response text
+            context: Context the consultation was built from
+
         Returns:
             SpecialistOutput
         """
@@ -79,44 +675,39 @@ class BaseSpecialist(ABC):
 class DesignSpecialist(BaseSpecialist):
     """Research design and methodology expert"""
 
-    def __init__(self, config: Dict):
-        super().__init__(config, 'design_specialist')
+    cache_context_keys = ('user_level', 'research_question')
+    knowledge_domain = 'design'
+
+    def __init__(self, config: Dict, response_cache=None, http_clients=None):
+        super().__init__(config, 'design_specialist', response_cache, http_clients)
         self.name = "Design-Specialist"
         self.domain = "research_design"
 
-    def consult(self, user_message: str, context: Optional[Dict] = None) -> SpecialistOutput:
+    def _prompt_fields(self, user_message: str, context: Optional[Dict] = None) -> Dict:
         """
-        Provide research design consultation
+        Fields for the research design consultation prompt
 
         Args:
             user_message: User's design question
             context: User level, research question, etc.
 
         Returns:
-            Design guidance
+            Task-prompt field values
         """
         # Extract context
         user_level = context.get('user_level', 'intermediate') if context else 'intermediate'
         research_question = context.get('research_question', 'Not specified') if context else 'Not specified'
 
-        # Build task prompt
-        task_prompt = self.specialist_config['prompts']['task_prompt'].format(
-            user_message=user_message,
-            research_question=research_question,
-            user_level=user_level
-        )
-
-        messages = [
-            SystemMessage(content=self.specialist_config['prompts']['system_prompt']),
-            HumanMessage(content=task_prompt)
-        ]
-
-        # Get consultation
-        response = self.llm(messages)
-        output_text = response.content
+        return {
+            'user_message': user_message,
+            'research_question': research_question,
+            'user_level': user_level
+        }
 
+    def _build_output(self, output_text: str, context: Optional[Dict] = None) -> SpecialistOutput:
+        """Package design guidance"""
         # Extract references (simplified - in production, parse structured output)
-        references = self._extract_references(output_text)
+        references = self._extract_references(self.extractor.extract(output_text))
 
         return SpecialistOutput(
             specialist_name=self.name,
@@ -126,16 +717,9 @@ class DesignSpecialist(BaseSpecialist):
             references=references
         )
 
-    def _extract_references(self, text: str) -> List[str]:
-        """Extract guideline references from text"""
-        references = []
-        if "CONSORT" in text:
-            references.append("CONSORT 2010")
-        if "STROBE" in text:
-            references.append("STROBE 2007")
-        if "SPIRIT" in text:
-            references.append("SPIRIT 2013")
-        return references
+    def _extract_references(self, mentions: ExtractionResult) -> List[str]:
+        """Guideline references mentioned in the output"""
+        return mentions.labels("guideline")
 
 
 # ============================================================================
@@ -145,21 +729,24 @@ class DesignSpecialist(BaseSpecialist):
 class StatsSpecialist(BaseSpecialist):
     """Statistical analysis and inference expert"""
 
-    def __init__(self, config: Dict):
-        super().__init__(config, 'stats_specialist')
+    cache_context_keys = ('user_level', 'study_design', 'data_type', 'sample_size')
+    knowledge_domain = 'stats'
+
+    def __init__(self, config: Dict, response_cache=None, http_clients=None):
+        super().__init__(config, 'stats_specialist', response_cache, http_clients)
         self.name = "Stats-Specialist"
         self.domain = "statistics"
 
-    def consult(self, user_message: str, context: Optional[Dict] = None) -> SpecialistOutput:
+    def _prompt_fields(self, user_message: str, context: Optional[Dict] = None) -> Dict:
         """
-        Provide statistical consultation
+        Fields for the statistical consultation prompt
 
         Args:
             user_message: User's statistical question
             context: Study design, data type, sample size, etc.
 
         Returns:
-            Statistical guidance
+            Task-prompt field values
         """
         # Extract context
         user_level = context.get('user_level', 'intermediate') if context else 'intermediate'
@@ -167,34 +754,22 @@ class StatsSpecialist(BaseSpecialist):
         data_type = context.get('data_type', 'Not specified') if context else 'Not specified'
         sample_size = context.get('sample_size', 'Not specified') if context else 'Not specified'
 
-        # Check for previous specialist outputs (if sequential)
-        previous_outputs = context.get('previous_specialist_outputs', []) if context else []
-        if previous_outputs:
-            # Extract study design from Design-Specialist if available
-            for prev in previous_outputs:
-                if prev['specialist'] == 'Design-Specialist' and 'RCT' in prev['output']:
-                    study_design = "Randomized Controlled Trial"
-
-        # Build task prompt
-        task_prompt = self.specialist_config['prompts']['task_prompt'].format(
-            user_message=user_message,
-            study_design=study_design,
-            data_type=data_type,
-            sample_size=sample_size,
-            user_level=user_level
-        )
-
-        messages = [
-            SystemMessage(content=self.specialist_config['prompts']['system_prompt']),
-            HumanMessage(content=task_prompt)
-        ]
+        # Study design from Design-Specialist, if sequential
+        if "RCT" in self._upstream_designs(context):
+            study_design = "Randomized Controlled Trial"
 
-        # Get consultation
-        response = self.llm(messages)
-        output_text = response.content
+        return {
+            'user_message': user_message,
+            'study_design': study_design,
+            'data_type': data_type,
+            'sample_size': sample_size,
+            'user_level': user_level
+        }
 
+    def _build_output(self, output_text: str, context: Optional[Dict] = None) -> SpecialistOutput:
+        """Package statistical guidance"""
         # Extract references
-        references = self._extract_methods(output_text)
+        references = self._extract_methods(self.extractor.extract(output_text))
 
         return SpecialistOutput(
             specialist_name=self.name,
@@ -204,18 +779,9 @@ class StatsSpecialist(BaseSpecialist):
             references=references
         )
 
-    def _extract_methods(self, text: str) -> List[str]:
-        """Extract statistical methods from text"""
-        methods = []
-        if "t-test" in text.lower():
-            methods.append("t-test")
-        if "anova" in text.lower():
-            methods.append("ANOVA")
-        if "regression" in text.lower():
-            methods.append("Regression")
-        if "chi-square" in text.lower():
-            methods.append("Chi-square test")
-        return methods
+    def _extract_methods(self, mentions: ExtractionResult) -> List[str]:
+        """Statistical methods mentioned in the output"""
+        return mentions.labels("method")
 
 
 # ============================================================================
@@ -225,59 +791,46 @@ class StatsSpecialist(BaseSpecialist):
 class WritingSpecialist(BaseSpecialist):
     """Scientific writing and reporting expert"""
 
-    def __init__(self, config: Dict):
-        super().__init__(config, 'writing_specialist')
+    cache_context_keys = ('user_level', 'writing_task', 'study_type', 'target_journal')
+    knowledge_domain = 'writing'
+
+    def __init__(self, config: Dict, response_cache=None, http_clients=None):
+        super().__init__(config, 'writing_specialist', response_cache, http_clients)
         self.name = "Writing-Specialist"
         self.domain = "scientific_writing"
 
-    def consult(self, user_message: str, context: Optional[Dict] = None) -> SpecialistOutput:
+    def _prompt_fields(self, user_message: str, context: Optional[Dict] = None) -> Dict:
         """
-        Provide writing consultation
+        Fields for the writing consultation prompt
 
         Args:
             user_message: User's writing question
             context: Writing task, study type, target journal, etc.
 
         Returns:
-            Writing guidance
+            Task-prompt field values
         """
         # Extract context
         user_level = context.get('user_level', 'intermediate') if context else 'intermediate'
         writing_task = context.get('writing_task', 'methods') if context else 'methods'
-        study_type = context.get('study_type', 'Not specified') if context else 'Not specified'
+        study_type = self._resolve_study_type(context)
         target_journal = context.get('target_journal', 'General medical journal') if context else 'General medical journal'
 
-        # Check for previous outputs (if sequential)
-        previous_outputs = context.get('previous_specialist_outputs', []) if context else []
-        if previous_outputs:
-            # Incorporate design and stats info
-            for prev in previous_outputs:
-                if prev['specialist'] == 'Design-Specialist':
-                    if 'RCT' in prev['output']:
-                        study_type = "RCT"
-                    elif 'cohort' in prev['output'].lower():
-                        study_type = "Cohort study"
-
-        # Build task prompt
-        task_prompt = self.specialist_config['prompts']['task_prompt'].format(
-            user_message=user_message,
-            writing_task=writing_task,
-            study_type=study_type,
-            target_journal=target_journal,
-            user_level=user_level
-        )
-
-        messages = [
-            SystemMessage(content=self.specialist_config['prompts']['system_prompt']),
-            HumanMessage(content=task_prompt)
-        ]
-
-        # Get consultation
-        response = self.llm(messages)
-        output_text = response.content
+        return {
+            'user_message': user_message,
+            'writing_task': writing_task,
+            'study_type': study_type,
+            'target_journal': target_journal,
+            'user_level': user_level
+        }
 
+    def _build_output(self, output_text: str, context: Optional[Dict] = None) -> SpecialistOutput:
+        """Package writing guidance"""
         # Extract guidelines
-        guidelines = self._extract_guidelines(output_text, study_type)
+        guidelines = self._extract_guidelines(
+            self.extractor.extract(output_text),
+            self._resolve_study_type(context)
+        )
 
         return SpecialistOutput(
             specialist_name=self.name,
@@ -287,19 +840,33 @@ class WritingSpecialist(BaseSpecialist):
             references=guidelines
         )
 
-    def _extract_guidelines(self, text: str, study_type: str) -> List[str]:
-        """Extract reporting guidelines"""
+    def _resolve_study_type(self, context: Optional[Dict] = None) -> str:
+        """Study type from context, refined by Design-Specialist output (if sequential)"""
+        study_type = context.get('study_type', 'Not specified') if context else 'Not specified'
+
+        # Incorporate Design-Specialist's decision (if sequential)
+        designs = self._upstream_designs(context)
+        if "RCT" in designs:
+            study_type = "RCT"
+        elif "Cohort study" in designs:
+            study_type = "Cohort study"
+
+        return study_type
+
+    def _extract_guidelines(self, mentions: ExtractionResult, study_type: str) -> List[str]:
+        """Reporting guideline for the study type (or the study-type cues in the output)"""
         guidelines = []
+        cues = set(mentions.labels("study_type"))
 
         # Map study type to guideline
         guideline_map = self.specialist_config.get('reporting_guidelines', {})
-        if study_type == "RCT" or "RCT" in text:
+        if study_type == "RCT" or "RCT" in cues:
             guidelines.append(guideline_map.get('RCT', 'CONSORT'))
-        elif "cohort" in study_type.lower() or "observational" in text.lower():
+        elif "cohort" in study_type.lower() or "observational" in cues:
             guidelines.append(guideline_map.get('observational', 'STROBE'))
-        elif "systematic review" in text.lower():
+        elif "systematic_review" in cues:
             guidelines.append(guideline_map.get('systematic_review', 'PRISMA'))
-        elif "prediction" in text.lower() or "model" in text.lower():
+        elif "prediction_model" in cues:
             guidelines.append(guideline_map.get('prediction_model', 'TRIPOD'))
 
         return guidelines
@@ -312,21 +879,23 @@ class WritingSpecialist(BaseSpecialist):
 class StrategyAdvisor(BaseSpecialist):
     """Research strategy and career planning expert"""
 
-    def __init__(self, config: Dict):
-        super().__init__(config, 'strategy_advisor')
+    cache_context_keys = ('user_level', 'career_stage', 'research_interest', 'constraints')
+
+    def __init__(self, config: Dict, response_cache=None, http_clients=None):
+        super().__init__(config, 'strategy_advisor', response_cache, http_clients)
         self.name = "Strategy-Advisor"
         self.domain = "research_strategy"
 
-    def consult(self, user_message: str, context: Optional[Dict] = None) -> SpecialistOutput:
+    def _prompt_fields(self, user_message: str, context: Optional[Dict] = None) -> Dict:
         """
-        Provide strategic consultation
+        Fields for the strategic consultation prompt
 
         Args:
             user_message: User's strategic question
             context: Career stage, research interest, constraints, etc.
 
         Returns:
-            Strategic guidance
+            Task-prompt field values
         """
         # Extract context
         user_level = context.get('user_level', 'intermediate') if context else 'intermediate'
@@ -334,26 +903,18 @@ class StrategyAdvisor(BaseSpecialist):
         research_interest = context.get('research_interest', 'Not specified') if context else 'Not specified'
         constraints = context.get('constraints', 'Not specified') if context else 'Not specified'
 
-        # Build task prompt
-        task_prompt = self.specialist_config['prompts']['task_prompt'].format(
-            user_message=user_message,
-            career_stage=career_stage,
-            research_interest=research_interest,
-            constraints=constraints,
-            user_level=user_level
-        )
-
-        messages = [
-            SystemMessage(content=self.specialist_config['prompts']['system_prompt']),
-            HumanMessage(content=task_prompt)
-        ]
-
-        # Get consultation
-        response = self.llm(messages)
-        output_text = response.content
+        return {
+            'user_message': user_message,
+            'career_stage': career_stage,
+            'research_interest': research_interest,
+            'constraints': constraints,
+            'user_level': user_level
+        }
 
+    def _build_output(self, output_text: str, context: Optional[Dict] = None) -> SpecialistOutput:
+        """Package strategic guidance"""
         # Extract frameworks used
-        frameworks = self._extract_frameworks(output_text)
+        frameworks = self._extract_frameworks(self.extractor.extract(output_text))
 
         return SpecialistOutput(
             specialist_name=self.name,
@@ -363,41 +924,41 @@ class StrategyAdvisor(BaseSpecialist):
             references=frameworks
         )
 
-    def _extract_frameworks(self, text: str) -> List[str]:
-        """Extract strategic frameworks mentioned"""
-        frameworks = []
-        if "PICO" in text:
-            frameworks.append("PICO framework")
-        if "FINER" in text:
-            frameworks.append("FINER criteria")
-        if "SMART" in text.upper():
-            frameworks.append("SMART goals")
-        return frameworks
+    def _extract_frameworks(self, mentions: ExtractionResult) -> List[str]:
+        """Strategic frameworks mentioned in the output"""
+        return mentions.labels("framework")
 
 
 # ============================================================================
 # Factory function
 # ============================================================================
 
-def create_specialist(specialist_name: str, config: Dict) -> BaseSpecialist:
+def create_specialist(
+    specialist_name: str,
+    config: Dict,
+    response_cache=None,
+    http_clients=None
+) -> BaseSpecialist:
     """
     Factory function to create specialists
 
     Args:
         specialist_name: Name of specialist
         config: Configuration dict
+        response_cache: Optional shared SemanticResponseCache
+        http_clients: Optional shared SharedHTTPClients
 
     Returns:
         Specialist instance
     """
     if specialist_name == "Design-Specialist":
-        return DesignSpecialist(config)
+        return DesignSpecialist(config, response_cache, http_clients)
     elif specialist_name == "Stats-Specialist":
-        return StatsSpecialist(config)
+        return StatsSpecialist(config, response_cache, http_clients)
     elif specialist_name == "Writing-Specialist":
-        return WritingSpecialist(config)
+        return WritingSpecialist(config, response_cache, http_clients)
     elif specialist_name == "Strategy-Advisor":
-        return StrategyAdvisor(config)
+        return StrategyAdvisor(config, response_cache, http_clients)
     else:
         raise ValueError(f"Unknown specialist: {specialist_name}")
 
@@ -0,0 +1,64 @@
+"""
+ACS-Mentor V3.0 - Token Estimation
+
+Tokenizer-free token estimates for budgeting prompts and outputs.
+Roughly 4 characters per token for Latin text and 1 token per CJK
+character, which is close enough for limits and reporting.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import re
+
+
+_CJK = re.compile(r"[\u3000-\u303f\u4e00-\u9fff\uff00-\uffef]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a text
+
+    Args:
+        text: Any text
+
+    Returns:
+        Approximate number of tokens
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text to roughly max_tokens, preferring a sentence or line boundary
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token budget
+
+    Returns:
+        Text within the budget (unchanged if it already fits)
+    """
+    if max_tokens <= 0:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # Binary search for the longest prefix within budget
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    prefix = text[:low]
+
+    boundary = max(prefix.rfind(sep) for sep in (". ", "。", "\n", "; "))
+    if boundary > len(prefix) // 2:
+        prefix = prefix[:boundary + 1]
+    return prefix.rstrip() + " …"
@@ -0,0 +1,384 @@
+"""
+ACS-Mentor V3.0 - Coordination Tracing
+
+Structured timing spans for the coordination pipeline:
+
+    coordinate
+    ├── routing            (source, cache hit, pattern)
+    │   └── llm            (prompt / completion tokens)
+    ├── specialist × N     (queue wait, cache hit)
+    │   └── llm
+    └── synthesis          (local or llm)
+        └── llm
+
+Finished spans go to pluggable sinks: in-memory (with per-stage
+percentiles), JSONL files, or MLflow.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+
+from agents.tokens import estimate_tokens
+
+
+@dataclass
+class Span:
+    """One timed stage of a coordination"""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_time: float  # Unix time
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    duration_seconds: Optional[float] = None
+    status: str = "ok"  # ok, error, cancelled
+    error: Optional[str] = None
+
+    def set(self, key: str, value: Any) -> None:
+        """Set an attribute"""
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form"""
+        return asdict(self)
+
+
+class _NoopSpan:
+    """Stand-in when no trace is active"""
+    attributes: Dict[str, Any] = {}
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# (tracer, span) of the innermost active span
+_current: ContextVar[Optional[tuple]] = ContextVar('acs_current_span', default=None)
+
+
+# ============================================================================
+# Sinks
+# ============================================================================
+
+class SpanSink:
+    """Receives finished spans"""
+
+    def export(self, span: Span) -> None:
+        raise NotImplementedError
+
+
+class InMemorySpanSink(SpanSink):
+    """
+    Keeps the most recent spans in memory
+
+    Usage:
+        sink = InMemorySpanSink()
+        coordinator.tracer.add_sink(sink)
+        ...
+        print(sink.stage_summary())
+    """
+
+    def __init__(self, max_spans: int = 10000):
+        self.spans: deque = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def trace(self, trace_id: str) -> List[Span]:
+        """All recorded spans of one trace, in start order"""
+        with self._lock:
+            return sorted((s for s in self.spans if s.trace_id == trace_id), key=lambda s: s.start_time)
+
+    def stage_summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Latency percentiles per span name
+
+        Returns:
+            name → {'count', 'p50_ms', 'p95_ms', 'max_ms'}
+        """
+        with self._lock:
+            durations = defaultdict(list)
+            for span in self.spans:
+                if span.duration_seconds is not None:
+                    durations[span.name].append(span.duration_seconds * 1000)
+
+        summary = {}
+        for name, values in durations.items():
+            values.sort()
+            summary[name] = {
+                'count': len(values),
+                'p50_ms': values[int(0.50 * (len(values) - 1))],
+                'p95_ms': values[int(0.95 * (len(values) - 1))],
+                'max_ms': values[-1]
+            }
+        return summary
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class JSONLSpanSink(SpanSink):
+    """Appends one JSON object per span to a file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+
+
+class MLflowSpanSink(SpanSink):
+    """
+    Logs each finished trace as one MLflow run
+
+    Stage durations become metrics (<stage>_ms; specialist spans are named
+    after the specialist), token counts are summed, and the full span list
+    is attached as spans.json.
+
+    Usage:
+        from evaluation.mlflow_monitoring import ACSMentorMonitoring
+        ACSMentorMonitoring(experiment_name="ACS-Mentor-Coordinator")  # sets experiment
+        coordinator.tracer.add_sink(MLflowSpanSink())
+    """
+
+    def __init__(self, experiment_name: Optional[str] = None):
+        import mlflow
+        self._mlflow = mlflow
+        if experiment_name:
+            mlflow.set_experiment(experiment_name)
+        self._pending: Dict[str, List[Span]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._pending[span.trace_id].append(span)
+            if span.parent_id is not None:
+                return
+            spans = self._pending.pop(span.trace_id)
+
+        try:
+            with self._mlflow.start_run(run_name=f"{span.name}_{span.attributes.get('pattern', 'trace')}"):
+                for key, value in span.attributes.items():
+                    if isinstance(value, (str, int, float, bool)):
+                        self._mlflow.log_param(key, value)
+
+                prompt_tokens = completion_tokens = 0
+                for child in spans:
+                    stage = child.attributes.get('specialist', child.name) if child.name == 'specialist' else child.name
+                    if child.duration_seconds is not None and child.name != 'llm':
+                        self._mlflow.log_metric(f"{stage}_ms", child.duration_seconds * 1000)
+                    if 'queue_wait_seconds' in child.attributes:
+                        self._mlflow.log_metric(f"{stage}_queue_wait_ms", child.attributes['queue_wait_seconds'] * 1000)
+                    prompt_tokens += child.attributes.get('prompt_tokens', 0)
+                    completion_tokens += child.attributes.get('completion_tokens', 0)
+
+                self._mlflow.log_metric("prompt_tokens", prompt_tokens)
+                self._mlflow.log_metric("completion_tokens", completion_tokens)
+                self._mlflow.log_dict([s.to_dict() for s in spans], "spans.json")
+        except Exception as e:
+            print(f"Warning: Failed to log trace to MLflow: {e}")
+
+
+# ============================================================================
+# Tracer
+# ============================================================================
+
+class Tracer:
+    """
+    Creates spans and exports them to sinks
+
+    Usage:
+        tracer = Tracer([InMemorySpanSink()])
+        with tracer.span("coordinate", user_level="novice") as span:
+            with child_span("routing") as routing:
+                ...
+            span.set("pattern", "parallel")
+    """
+
+    def __init__(self, sinks: Optional[List[SpanSink]] = None, enabled: bool = True):
+        self.sinks: List[SpanSink] = list(sinks or [])
+        self.enabled = enabled
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "Tracer":
+        """
+        Build tracer from parameters.tracing
+
+        Args:
+            config: Full multi-agent configuration
+
+        Returns:
+            Tracer (disabled if tracing.enabled is false)
+        """
+        tracing_config = config.get('parameters', {}).get('tracing', {})
+        sinks = []
+        for sink_name in tracing_config.get('sinks', ['memory']):
+            if sink_name == 'memory':
+                sinks.append(InMemorySpanSink(tracing_config.get('max_spans', 10000)))
+            elif sink_name == 'jsonl':
+                sinks.append(JSONLSpanSink(tracing_config.get('jsonl_path', '.acs_mentor/traces/spans.jsonl')))
+            elif sink_name == 'mlflow':
+                try:
+                    sinks.append(MLflowSpanSink(tracing_config.get('mlflow_experiment')))
+                except ImportError:
+                    print("Warning: mlflow not installed, MLflow span sink disabled")
+            else:
+                print(f"Warning: Unknown span sink '{sink_name}'")
+        return cls(sinks, enabled=tracing_config.get('enabled', True))
+
+    def add_sink(self, sink: SpanSink) -> None:
+        """Attach another sink"""
+        self.sinks.append(sink)
+
+    def get_sink(self, sink_type: type) -> Optional[SpanSink]:
+        """First attached sink of the given type"""
+        return next((s for s in self.sinks if isinstance(s, sink_type)), None)
+
+    @contextmanager
+    def span(self, name: str, activate: bool = True, parent: Optional[Span] = None, **attributes) -> Iterator[Span]:
+        """
+        Time a block as a span (a new trace unless a span is active)
+
+        Works across await points: tasks created inside the block inherit
+        it as their parent span. Async generators must pass activate=False,
+        since their steps may run in different contexts; the span is then
+        recorded but does not become the parent of spans opened inside it
+        (see activate). parent overrides the active span as the parent.
+        """
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+
+        if parent is None or parent is _NOOP_SPAN:
+            active = _current.get()
+            parent = active[1] if active else None
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start_time=time.time(),
+            attributes=dict(attributes)
+        )
+
+        token = _current.set((self, span)) if activate else None
+        started = time.perf_counter()
+        try:
+            yield span
+        except asyncio.CancelledError:
+            span.status = "cancelled"
+            raise
+        except Exception as e:
+            span.status = "error"
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration_seconds = time.perf_counter() - started
+            if token is not None:
+                _current.reset(token)
+            self._export(span)
+
+    @contextmanager
+    def activate(self, span: Span) -> Iterator[Span]:
+        """
+        Make an existing span the parent of spans opened in the block
+
+        For async generators holding an activate=False span: wrap each
+        stretch of work between yields, never a yield itself.
+        """
+        if not self.enabled or span is _NOOP_SPAN:
+            yield span
+            return
+        token = _current.set((self, span))
+        try:
+            yield span
+        finally:
+            _current.reset(token)
+
+    def _export(self, span: Span) -> None:
+        for sink in self.sinks:
+            try:
+                sink.export(span)
+            except Exception as e:
+                print(f"Warning: Span sink {type(sink).__name__} failed: {e}")
+
+
+@contextmanager
+def child_span(name: str, activate: bool = True, **attributes) -> Iterator[Any]:
+    """
+    Span under the active span, or a no-op outside any trace
+
+    Lets shared helpers (LLM calls) be instrumented without a tracer handle.
+    """
+    active = _current.get()
+    if active is None:
+        yield _NOOP_SPAN
+        return
+    with active[0].span(name, activate=activate, **attributes) as span:
+        yield span
+
+
+def current_span():
+    """Innermost active span (a no-op span outside any trace)"""
+    active = _current.get()
+    return active[1] if active else _NOOP_SPAN
+
+
+def record_token_usage(span, messages: List, response: Any = None, completion_text: Optional[str] = None) -> None:
+    """
+    Attach prompt/completion token counts to a span
+
+    Uses provider-reported usage when the response carries it and falls
+    back to estimates otherwise.
+
+    Args:
+        span: Span to annotate
+        messages: Prompt messages
+        response: Model response (optional)
+        completion_text: Completion text when there is no response object
+    """
+    usage = getattr(response, 'usage_metadata', None) or {}
+    if not usage:
+        metadata = getattr(response, 'response_metadata', None) or {}
+        token_usage = metadata.get('token_usage') or {}
+        usage = {
+            'input_tokens': token_usage.get('prompt_tokens'),
+            'output_tokens': token_usage.get('completion_tokens')
+        }
+
+    prompt_tokens = usage.get('input_tokens')
+    completion_tokens = usage.get('output_tokens')
+    span.set('token_source', 'provider' if prompt_tokens is not None else 'estimate')
+
+    if prompt_tokens is None:
+        prompt_tokens = sum(estimate_tokens(str(getattr(m, 'content', m))) for m in messages)
+    if completion_tokens is None:
+        text = completion_text if completion_text is not None else getattr(response, 'content', '')
+        completion_tokens = estimate_tokens(text or '')
+
+    span.set('prompt_tokens', prompt_tokens)
+    span.set('completion_tokens', completion_tokens)
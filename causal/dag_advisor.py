@@ -18,11 +18,7 @@ import yaml
 import os
 import math
 
-try:
-    from langchain.chat_models import ChatOpenAI
-    from langchain.schema import HumanMessage, SystemMessage
-except ImportError:
-    print("Warning: LangChain not installed")
+from agents.llm_providers import HumanMessage, SystemMessage, create_chat_model
 
 
 @dataclass
@@ -162,7 +158,8 @@ class DAGAdvisor:
     def _initialize_llm(self):
         """Initialize LLM"""
         llm_config = self.config.get('llm_config', {})
-        return ChatOpenAI(
+        return create_chat_model(
+            self.config,
             model=llm_config.get('model', 'gpt-4'),
             temperature=llm_config.get('temperature', 0.2),
             max_tokens=2000
@@ -483,6 +483,7 @@ class ACSMentorMemory:
         """Fallback: Get user profile from SQLite"""
         try:
             conn = sqlite3.connect(self.fallback_db_path)
+            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -493,11 +494,9 @@ class ACSMentorMemory:
             conn.close()
 
             if row:
-                return {
-                    "user_id": row[0],
-                    "overall_level": row[1],
-                    # ... parse other fields from V2.1 schema
-                }
+                # All user_profiles columns (overall_level, skill scores,
+                # response_depth_preference, ...)
+                return dict(row)
             else:
                 return {"user_id": user_id, "overall_level": "intermediate"}
 
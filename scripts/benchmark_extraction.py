@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+ACS-Mentor V3.0 - Reference Extraction Benchmark
+
+Compares the shared single-pass ReferenceExtractor against the previous
+per-specialist scans (each lowercasing the output and running its own
+substring checks) on long synthetic specialist outputs, and checks that
+every label the old scans found is still found. The synthetic outputs only
+contain whole words, so the extractor's word-boundary rule for Latin forms
+(no "RCT" inside "infarction") causes no differences here.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+
+Usage:
+    python scripts/benchmark_extraction.py [--chars 20000] [--outputs 50] [--repeat 5]
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.extraction import DESIGN_TERMS, METHOD_TERMS, get_extractor
+
+
+# ============================================================================
+# Previous per-specialist scans (baseline)
+# ============================================================================
+
+def legacy_design(text):
+    references = []
+    if "CONSORT" in text:
+        references.append("CONSORT 2010")
+    if "STROBE" in text:
+        references.append("STROBE 2007")
+    if "SPIRIT" in text:
+        references.append("SPIRIT 2013")
+    return references
+
+
+def legacy_stats(text):
+    methods = []
+    if "t-test" in text.lower():
+        methods.append("t-test")
+    if "anova" in text.lower():
+        methods.append("ANOVA")
+    if "regression" in text.lower():
+        methods.append("Regression")
+    if "chi-square" in text.lower():
+        methods.append("Chi-square test")
+    return methods
+
+
+def legacy_writing_cues(text):
+    cues = []
+    if "RCT" in text:
+        cues.append("RCT")
+    if "observational" in text.lower():
+        cues.append("observational")
+    if "systematic review" in text.lower():
+        cues.append("systematic_review")
+    if "prediction" in text.lower() or "model" in text.lower():
+        cues.append("prediction_model")
+    return cues
+
+
+def legacy_strategy(text):
+    frameworks = []
+    if "PICO" in text:
+        frameworks.append("PICO framework")
+    if "FINER" in text:
+        frameworks.append("FINER criteria")
+    if "SMART" in text.upper():
+        frameworks.append("SMART goals")
+    return frameworks
+
+
+def legacy_plan_terms(text):
+    lowered = text.lower()
+    designs = {label for label, forms in DESIGN_TERMS.items() if any(f in lowered for f in forms)}
+    methods = {label for label, forms in METHOD_TERMS.items() if any(f in lowered for f in forms)}
+    return designs, methods
+
+
+def legacy_all(text):
+    return (legacy_design(text), legacy_stats(text), legacy_writing_cues(text),
+            legacy_strategy(text), legacy_plan_terms(text))
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+FILLER = ("the analysis should account for clustering and report effect sizes with confidence "
+          "intervals while describing how missing data were handled in each arm").split()
+TERMS = ["CONSORT", "STROBE", "t-test", "ANOVA", "logistic regression", "chi-square", "RCT",
+         "cohort", "mixed model", "PICO", "SMART", "observational", "propensity score",
+         "prediction", "Kruskal-Wallis", "随机对照", "回归"]
+
+
+def synthetic_output(rng, chars):
+    words = []
+    length = 0
+    while length < chars:
+        word = rng.choice(TERMS) if rng.random() < 0.02 else rng.choice(FILLER)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def time_per_output(func, outputs, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in outputs:
+            func(text)
+        best = min(best, time.perf_counter() - started)
+    return best / len(outputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass reference extraction")
+    parser.add_argument('--chars', type=int, default=20000, help="Characters per synthetic output")
+    parser.add_argument('--outputs', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    outputs = [synthetic_output(rng, args.chars) for _ in range(args.outputs)]
+    extractor = get_extractor()
+
+    # Coverage: everything the old scans found must still be found
+    missing = 0
+    for text in outputs:
+        result = extractor.extract(text)
+        design, stats, cues, strategy, (designs, methods) = legacy_all(text)
+        missing += len(set(design) - set(result.labels("guideline")))
+        missing += len(set(stats) | methods) - len((set(stats) | methods) & set(result.labels("method")))
+        missing += len(set(cues) - set(result.labels("study_type")))
+        missing += len(set(strategy) - set(result.labels("framework")))
+        missing += len(designs - set(result.labels("design")))
+
+    legacy = time_per_output(legacy_all, outputs, args.repeat)
+    single = time_per_output(extractor.extract, outputs, args.repeat)
+    mentions = sum(len(extractor.extract(t).matches) for t in outputs) / len(outputs)
+
+    print("=" * 70)
+    print(f"Reference extraction: {args.outputs} outputs × {args.chars} chars")
+    print("=" * 70)
+    print(f"Per-specialist scans:  {legacy * 1e6:10.1f} µs/output (labels only)")
+    print(f"Single-pass extractor: {single * 1e6:10.1f} µs/output "
+          f"({mentions:.0f} mentions with positions)")
+    print(f"Speed ratio:           {legacy / single:10.2f}×")
+    print(f"Labels missed vs old:  {missing}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+ACS-Mentor V3.0 - Orchestration Benchmark
+
+Runs the benchmark questions (benchmarks/test_cases.yaml) through the
+coordinator on the fake LLM backend, so routing, scheduling, caching and
+synthesis overhead can be measured offline and without API cost.
+
+Modes:
+- sequential: one coordinate() after another
+- concurrent: --concurrency acoordinate() sessions on one event loop
+- batch:      coordinate_many()
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+
+Usage:
+    python scripts/benchmark_orchestration.py [--mode concurrent] [--concurrency 8]
+        [--latency-ms 800] [--tokens-per-second 60] [--failure-rate 0.02]
+        [--repeat 2] [--disable-caches]
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import copy
+import tempfile
+import time
+
+import yaml
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.llm_providers import PROVIDER_ENV_VAR
+from agents.tracing import InMemorySpanSink
+
+
+def load_benchmark_queries(path: str):
+    """(user_message, user_level) of every case in the benchmark file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+
+    queries = []
+    for value in data.values():
+        if not isinstance(value, list):
+            continue
+        for case in value:
+            message = (case.get('input') or {}).get('user_message') if isinstance(case, dict) else None
+            if message:
+                queries.append((message, case.get('user_level', 'intermediate')))
+    return queries
+
+
+def write_benchmark_config(args) -> str:
+    """Copy of the multi-agent config with the fake backend settings from the command line"""
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config = copy.deepcopy(config)
+
+    parameters = config.setdefault('parameters', {})
+    fake = parameters.setdefault('llm_provider', {}).setdefault('fake', {})
+    fake['latency'] = {
+        'distribution': args.latency_distribution,
+        'seconds': args.latency_ms / 1000,
+        'median_seconds': args.latency_ms / 1000,
+        'sigma': 0.4,
+        'min_seconds': args.latency_ms / 2000,
+        'max_seconds': args.latency_ms * 1.5 / 1000
+    }
+    fake['tokens_per_second'] = args.tokens_per_second
+    fake['failure_rate'] = args.failure_rate
+    fake['seed'] = args.seed
+    parameters.setdefault('tracing', {})['sinks'] = ['memory']
+    parameters.setdefault('admission', {})['budget'] = {'enabled': False}
+
+    if args.disable_caches:
+        parameters.setdefault('routing', {}).setdefault('cache', {})['enabled'] = False
+        config.setdefault('cost_management', {}).setdefault('response_cache', {})['enabled'] = False
+
+    handle = tempfile.NamedTemporaryFile('w', suffix='.yaml', delete=False, encoding='utf-8')
+    with handle:
+        yaml.safe_dump(config, handle, allow_unicode=True, sort_keys=False)
+    return handle.name
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))] if ordered else 0.0
+
+
+def run(coordinator, queries, args):
+    """Run one mode; returns (per-query latencies, failures, wall seconds)"""
+    latencies, failures = [], 0
+    started = time.perf_counter()
+
+    if args.mode == 'sequential':
+        for message, level in queries:
+            t0 = time.perf_counter()
+            try:
+                coordinator.coordinate(message, user_level=level)
+            except Exception:
+                failures += 1
+            latencies.append(time.perf_counter() - t0)
+
+    elif args.mode == 'concurrent':
+        async def session(message, level, gate):
+            async with gate:
+                t0 = time.perf_counter()
+                try:
+                    await coordinator.acoordinate(message, user_level=level)
+                    return time.perf_counter() - t0, False
+                except Exception:
+                    return time.perf_counter() - t0, True
+
+        async def main():
+            gate = asyncio.Semaphore(args.concurrency)
+            return await asyncio.gather(*(session(m, l, gate) for m, l in queries))
+
+        from agents.async_utils import run_sync
+        for seconds, failed in run_sync(main()):
+            latencies.append(seconds)
+            failures += failed
+
+    else:
+        results = coordinator.coordinate_many(
+            [{'user_message': m, 'user_level': l} for m, l in queries],
+            max_workers=args.concurrency,
+            requests_per_second=0
+        )
+        latencies = [r.elapsed_seconds for r in results]
+        failures = sum(1 for r in results if not r.ok)
+
+    return latencies, failures, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-agent orchestration on the fake LLM backend")
+    parser.add_argument('--config', default=".acs_mentor/multi_agent_config.yaml")
+    parser.add_argument('--cases', default="benchmarks/test_cases.yaml")
+    parser.add_argument('--mode', choices=['sequential', 'concurrent', 'batch'], default='concurrent')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=1, help="Run the question set this many times")
+    parser.add_argument('--latency-ms', type=float, default=800, help="Time to first token")
+    parser.add_argument('--latency-distribution', choices=['fixed', 'uniform', 'lognormal'], default='lognormal')
+    parser.add_argument('--tokens-per-second', type=float, default=60)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--disable-caches', action='store_true', help="Turn off routing and response caches")
+    args = parser.parse_args()
+
+    os.environ[PROVIDER_ENV_VAR] = 'fake'
+    config_path = write_benchmark_config(args)
+
+    from agents.coordinator import ACSCoordinator
+    try:
+        coordinator = ACSCoordinator(config_path, eager=True)
+        sink = coordinator.tracer.get_sink(InMemorySpanSink)
+
+        queries = load_benchmark_queries(args.cases) * args.repeat
+        latencies, failures, wall = run(coordinator, queries, args)
+    finally:
+        os.unlink(config_path)
+
+    print("\n" + "=" * 70)
+    print(f"Orchestration benchmark: {args.mode}, {len(queries)} queries, concurrency {args.concurrency}")
+    print(f"Fake LLM: {args.latency_distribution} {args.latency_ms:.0f} ms to first token, "
+          f"{args.tokens_per_second:.0f} tokens/s, failure rate {args.failure_rate}")
+    print("=" * 70)
+    print(f"Wall time:   {wall:.2f} s")
+    print(f"Throughput:  {len(queries) / wall:.2f} queries/s")
+    print(f"Latency:     p50 {percentile(latencies, 0.5) * 1000:.0f} ms, "
+          f"p95 {percentile(latencies, 0.95) * 1000:.0f} ms")
+    print(f"Failures:    {failures}")
+
+    if sink is not None:
+        print("\nStage latencies (ms):")
+        for stage, stats in sorted(sink.stage_summary().items()):
+            print(f"  {stage:<16} n={stats['count']:<5} p50={stats['p50_ms']:>8.1f} "
+                  f"p95={stats['p95_ms']:>8.1f} max={stats['max_ms']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
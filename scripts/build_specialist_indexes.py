@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+ACS-Mentor V3.0 - Build Specialist Knowledge Indexes
+
+Precomputes the embeddings of the guideline excerpts for every index in
+v25_integration.knowledge.specialist_knowledge_base and writes them to
+parameters.knowledge_retrieval.index_dir, then times sample lookups.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+
+Usage:
+    python scripts/build_specialist_indexes.py [--config .acs_mentor/multi_agent_config.yaml]
+        [--query "How should I report missing data?"] [--repeat 200]
+"""
+
+import sys
+import os
+import argparse
+import time
+
+import yaml
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.knowledge_index import KnowledgeRetriever
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the specialists' guideline knowledge indexes")
+    parser.add_argument('--config', default=".acs_mentor/multi_agent_config.yaml")
+    parser.add_argument('--query', default="How should I handle missing data and confounding in a cohort study?")
+    parser.add_argument('--repeat', type=int, default=200, help="Lookups per index for the timing")
+    args = parser.parse_args()
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    config.setdefault('parameters', {}).setdefault('knowledge_retrieval', {})['enabled'] = True
+    retriever = KnowledgeRetriever.from_config(config)
+    if retriever is None:
+        print("No specialist_knowledge_base indexes configured")
+        return
+
+    started = time.perf_counter()
+    counts = retriever.rebuild()
+    print(f"Built {len(counts)} indexes in {(time.perf_counter() - started) * 1000:.1f} ms "
+          f"({retriever.embedder.name}) → {retriever.index_dir}")
+
+    print(f"\nQuery: {args.query}")
+    for domain, name in retriever.index_names.items():
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            excerpts = retriever.retrieve(domain, args.query)
+        per_lookup_ms = (time.perf_counter() - t0) * 1000 / max(1, args.repeat)
+
+        print(f"\n  {name}: {counts.get(name, 0)} excerpts, {per_lookup_ms:.3f} ms per lookup")
+        for excerpt in excerpts:
+            print(f"    {excerpt.score:.3f}  [{excerpt.citation}] {excerpt.topic}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+ACS-Mentor V3.0 - Validate Soul DNA
+
+Parses and validates every soul DNA file, refreshes the compiled-persona
+snapshot and reports persona sizes and load times (cold parse vs snapshot).
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+
+Usage:
+    python scripts/validate_souls.py [--config .acs_mentor/multi_agent_config.yaml] [--show designer]
+"""
+
+import sys
+import os
+import argparse
+import time
+
+import yaml
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.soul_registry import SoulRegistry
+from agents.tokens import estimate_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate soul DNA files and rebuild the persona snapshot")
+    parser.add_argument('--config', default=".acs_mentor/multi_agent_config.yaml")
+    parser.add_argument('--show', help="Print the compiled persona of this soul")
+    args = parser.parse_args()
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config.setdefault('parameters', {}).setdefault('souls', {})['enabled'] = True
+    registry = SoulRegistry.from_config(config)
+
+    started = time.perf_counter()
+    errors = registry.validate_all()
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    # Rebuild the snapshot from scratch
+    if registry.snapshot_path and os.path.exists(registry.snapshot_path):
+        os.unlink(registry.snapshot_path)
+    for key in registry.keys():
+        registry.get(key)
+
+    warm = SoulRegistry.from_config(config)
+    started = time.perf_counter()
+    souls = {key: warm.get(key) for key in warm.keys()}
+    warm_ms = (time.perf_counter() - started) * 1000
+
+    mapped = {soul: section for section, soul in registry.agents.items()}
+    print(f"{'Soul':<18} {'Status':<8} {'Persona tokens':>14}  Agent")
+    for key, error in errors.items():
+        soul = souls.get(key)
+        tokens = estimate_tokens(soul.persona) if soul else 0
+        print(f"{key:<18} {'invalid' if error else 'ok':<8} {tokens:>14}  {mapped.get(key, '')}")
+        if error:
+            print(f"    {error}")
+
+    print(f"\nParse + compile: {cold_ms:.1f} ms; from snapshot: {warm_ms:.2f} ms ({registry.snapshot_path})")
+
+    if args.show:
+        print("\n" + (warm.persona(args.show) or f"No valid soul '{args.show}'"))
+
+    sys.exit(1 if any(errors.values()) else 0)
+
+
+if __name__ == "__main__":
+    main()
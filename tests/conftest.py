@@ -0,0 +1,65 @@
+"""
+ACS-Mentor V3.0 - Shared Test Fixtures
+
+Coordinator tests run on the fake LLM backend (FakeChatModel) with a copy
+of the multi-agent configuration written to a temporary directory.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import copy
+import os
+import sys
+
+import pytest
+import yaml
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.llm_providers import PROVIDER_ENV_VAR
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(REPO_ROOT, ".acs_mentor", "multi_agent_config.yaml")
+
+
+@pytest.fixture
+def fake_config(tmp_path, monkeypatch):
+    """
+    Factory for config files on the fake backend
+
+    fake_config(latency_seconds=0.3, admission={'max_concurrent': 1},
+    fake={'failure_rate': 1.0}) returns the path of a config whose fake LLM
+    answers after a fixed latency, with tracing to memory only, no budget,
+    no pooled HTTP clients and no memory / literature components.
+    """
+    monkeypatch.setenv(PROVIDER_ENV_VAR, 'fake')
+    monkeypatch.chdir(REPO_ROOT)
+    written = []
+
+    def write(latency_seconds=0.0, admission=None, fake=None, parameters=None):
+        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+            config = copy.deepcopy(yaml.safe_load(f))
+        params = config['parameters']
+        params['llm_provider']['fake'].update({
+            'latency': {'distribution': 'fixed', 'seconds': latency_seconds},
+            'tokens_per_second': 1_000_000,
+            'response_tokens': 20
+        })
+        params['llm_provider']['fake'].update(fake or {})
+        params['tracing']['sinks'] = ['memory']
+        params['warm_pool']['http']['enabled'] = False
+        params['service']['components'] = {'memory': {'enabled': False}, 'literature': {'enabled': False}}
+        params['admission']['budget'] = {'enabled': False}
+        params['admission'].update(admission or {})
+        for section, values in (parameters or {}).items():
+            params.setdefault(section, {}).update(values)
+
+        path = tmp_path / f"multi_agent_config_{len(written)}.yaml"
+        path.write_text(yaml.safe_dump(config, allow_unicode=True, sort_keys=False), encoding='utf-8')
+        written.append(path)
+        return str(path)
+
+    return write
@@ -0,0 +1,162 @@
+"""
+ACS-Mentor V3.0 - Admission Control Tests
+
+Priority classification, priority-ordered admission, eviction of
+low-priority waiters, per-user caps, queue timeouts and the monthly
+budget guard.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.admission import AdmissionController, AdmissionRejected, BudgetTracker
+
+CLASSES = {
+    'critical': ["error", "flaw", "p-hacking"],
+    'high': ["deadline", "reviewer"],
+    'normal': [],
+    'low': ["polish", "grammar"],
+}
+
+
+def controller(**kwargs):
+    kwargs.setdefault('max_concurrent', 1)
+    kwargs.setdefault('queue_timeout_seconds', 5.0)
+    return AdmissionController(CLASSES, **kwargs)
+
+
+@pytest.mark.parametrize("query, priority", [
+    ("I found an error in my analysis", 'critical'),
+    ("Two errors in table 2", 'critical'),
+    ("The design looks flawless", 'normal'),
+    ("Terror management theory measures", 'normal'),
+    ("Is this p-hacking?", 'critical'),
+    ("Reviewer 2 wants a new model", 'high'),
+    ("Please polish the abstract", 'low'),
+    ("What sample size do I need?", 'normal'),
+])
+def test_classify_matches_whole_words(query, priority):
+    assert controller().classify(query) == priority
+
+
+def test_waiters_start_in_priority_order():
+    admission = controller(max_queue=10)
+    started = []
+
+    async def request(name, priority):
+        async with admission.admit(name, user_id=name, priority=priority):
+            started.append(name)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        first = await admission.acquire("running", user_id="running")
+        waiters = [asyncio.ensure_future(request(name, priority))
+                   for name, priority in [("low", 'low'), ("normal", 'normal'), ("critical", 'critical')]]
+        await asyncio.sleep(0)
+        assert admission.metrics()['queue_depth'] == 3
+        admission.release(first)
+        await asyncio.gather(*waiters)
+
+    asyncio.run(run())
+    assert started == ["critical", "normal", "low"]
+
+
+def test_full_queue_evicts_lower_priority_or_sheds():
+    admission = controller(max_queue=1)
+
+    async def run():
+        first = await admission.acquire("running")
+        low = asyncio.ensure_future(admission.acquire("polish this", user_id="a"))
+        await asyncio.sleep(0)
+
+        # A higher-priority arrival takes the low-priority waiter's place
+        high = asyncio.ensure_future(admission.acquire("reviewer deadline", user_id="b"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as evicted:
+            await low
+        assert evicted.value.reason == 'evicted'
+
+        # An equal-priority arrival is shed
+        with pytest.raises(AdmissionRejected) as shed:
+            await admission.acquire("reviewer comments", user_id="c")
+        assert shed.value.reason == 'queue_full'
+
+        admission.release(first)
+        admission.release(await high)
+
+    asyncio.run(run())
+    assert admission.shed == {'evicted': 1, 'queue_full': 1}
+    assert admission.metrics()['in_flight'] == 0
+
+
+def test_per_user_cap_lets_other_users_pass():
+    admission = controller(max_concurrent=3, per_user_max_concurrent=1)
+
+    async def run():
+        mine = await admission.acquire("q1", user_id="me")
+        second_mine = asyncio.ensure_future(admission.acquire("q2", user_id="me"))
+        await asyncio.sleep(0)
+        other = await admission.acquire("q3", user_id="other")  # passes the waiter held back by its user cap
+        assert not second_mine.done()
+        assert admission.metrics()['in_flight'] == 2
+
+        admission.release(mine)
+        admission.release(await second_mine)
+        admission.release(other)
+
+    asyncio.run(run())
+    assert admission.admitted == 3 and admission.completed == 3
+
+
+def test_queue_timeout_sheds_waiter():
+    admission = controller(queue_timeout_seconds=0.05)
+
+    async def run():
+        first = await admission.acquire("running")
+        with pytest.raises(AdmissionRejected) as rejected:
+            await admission.acquire("waiting")
+        admission.release(first)
+        return rejected.value
+
+    rejected = asyncio.run(run())
+    assert rejected.reason == 'queue_timeout' and rejected.retry_after == 0.05
+    assert admission.metrics()['queue_depth'] == 0
+
+
+def test_budget_floors_by_priority():
+    budget = BudgetTracker(monthly_budget_usd=1.0, alert_at_percentage=0.5, cost_per_unit_usd=0.3,
+                           units_per_query={'single_specialist': 1})
+    admission = controller(max_concurrent=4, budget=budget,
+                           alert_min_priority='normal', exhausted_min_priority='critical')
+
+    async def admitted(query):
+        try:
+            admission.release(await admission.acquire(query))
+            return True
+        except AdmissionRejected as e:
+            assert e.reason == 'budget'
+            return False
+
+    async def run():
+        results = {}
+        budget.record_query(1)
+        results['ok'] = [await admitted("polish the abstract")]
+        budget.record_query(1)  # 0.6 of 1.0: alert
+        results['alert'] = [await admitted("polish the abstract"), await admitted("what sample size?")]
+        budget.record_query(1)
+        budget.record_query(1)  # 1.2 of 1.0: exhausted
+        results['exhausted'] = [await admitted("what sample size?"), await admitted("an error in table 2")]
+        return results
+
+    assert asyncio.run(run()) == {'ok': [True], 'alert': [False, True], 'exhausted': [False, True]}
+    assert budget.status() == 'exhausted'
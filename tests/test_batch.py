@@ -0,0 +1,82 @@
+"""
+ACS-Mentor V3.0 - Batch Tests
+
+Packed-answer parsing (parse_batch_answers), request coalescing and
+coordinate_many on the fake LLM backend.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.batch import build_requests, coalesce
+from agents.coordinator import ACSCoordinator
+from agents.specialists import parse_batch_answers
+from agents.tracing import InMemorySpanSink
+
+
+# ============================================================================
+# parse_batch_answers
+# ============================================================================
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"answers": [{"question": 1, "answer": "A"}, {"question": 2, "answer": "B"}]}', ["A", "B"]),
+    ('Sure:\n```json\n{"answers": [{"question": 2, "answer": "B"}, {"question": 1, "answer": " A "}]}\n```',
+     ["A", "B"]),
+    ('{"answers": ["A", "B"]}', ["A", "B"]),
+    ('{"answers": [{"question": "2", "answer": "B"}]}', [None, "B"]),
+    ('{"answers": [{"question": 1, "answer": ""}, {"question": 3, "answer": "C"}]}', [None, None]),
+    ('{"answers": [{"question": 1, "answer": 42}]}', [None, None]),
+    ('{"answers": {"1": "A"}}', [None, None]),
+    ('{"answers": [', [None, None]),
+    ('No JSON here', [None, None]),
+])
+def test_parse_batch_answers(text, expected):
+    assert parse_batch_answers(text, 2) == expected
+
+
+# ============================================================================
+# Coalescing
+# ============================================================================
+
+def test_coalesce_groups_normalized_duplicates():
+    requests = build_requests(
+        [
+            "What sample size for an RCT?",
+            "what  sample size for an RCT",
+            {'user_message': "What sample size for an RCT?", 'user_level': 'expert'},
+            "Which test for two groups?",
+        ],
+        'novice', None
+    )
+    groups = coalesce(requests)
+    assert [[r.index for r in group] for group in groups.values()] == [[0, 1], [2], [3]]
+
+
+def test_coordinate_many_answers_duplicates_once(fake_config):
+    coordinator = ACSCoordinator(fake_config())
+    queries = [
+        "What sample size do I need for a two-arm RCT?",
+        "what sample size do I need for a two-arm RCT",
+        "Should I use a t-test or Mann-Whitney for skewed outcomes?",
+    ]
+
+    results = coordinator.coordinate_many(queries, max_workers=2, requests_per_second=0)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert all(r.ok and r.output for r in results)
+    assert results[1].duplicate_of == 0 and results[1].output == results[0].output
+    assert results[1].user_message == queries[1]
+    assert results[0].duplicate_of is None and results[2].duplicate_of is None
+
+    spans = coordinator.tracer.get_sink(InMemorySpanSink).spans
+    assert sorted(s.attributes['index'] for s in spans if s.name == 'batch_route') == [0, 2]
+    assert sorted(s.attributes['index'] for s in spans if s.name == 'batch_execute') == [0, 2]
@@ -0,0 +1,73 @@
+"""
+ACS-Mentor V3.0 - Reference Extraction Tests
+
+Regression tests for the shared ReferenceExtractor: short Latin forms
+(rct, cox, anova, ols, ...) must match whole words only.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.extraction import get_extractor, extract_plan_facts, plans_agree
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return get_extractor()
+
+
+def labels(extractor, text, kind):
+    return extractor.extract(text).labels(kind)
+
+
+@pytest.mark.parametrize("text, kind, label", [
+    ("Patients with myocardial infarction were enrolled.", 'design', "RCT"),
+    ("Patients with myocardial infarction were enrolled.", 'study_type', "RCT"),
+    ("Compare groups with the Wilcoxon signed-rank test.", 'method', "Cox model"),
+    ("Use Holm correction after the omnibus test.", 'method', "Regression"),
+    ("Report that test statistic.", 'method', "t-test"),
+    ("The subcohort was small.", 'design', "Cohort study"),
+    ("Track smartphone use.", 'framework', "SMART goals"),
+    ("Tools from the consortium.", 'guideline', "CONSORT 2010"),
+])
+def test_forms_inside_longer_words_do_not_match(extractor, text, kind, label):
+    assert label not in labels(extractor, text, kind)
+
+
+@pytest.mark.parametrize("text, kind, label", [
+    ("We plan an RCT with two arms.", 'design', "RCT"),
+    ("Pooled data from three RCTs.", 'design', "RCT"),
+    ("(RCT) design", 'design', "RCT"),
+    ("Fit a Cox model for survival.", 'method', "Cox model"),
+    ("Run a one-way ANOVA.", 'method', "ANOVA"),
+    ("Compare means with a t-test.", 'method', "t-test"),
+    ("Two cohorts were followed.", 'design', "Cohort study"),
+    ("Report per CONSORT-2010.", 'guideline', "CONSORT 2010"),
+    ("随机对照试验", 'design', "RCT"),
+])
+def test_whole_word_forms_match(extractor, text, kind, label):
+    assert label in labels(extractor, text, kind)
+
+
+def test_match_positions(extractor):
+    text = "An RCT, then a Cox model."
+    matches = {m.label: (m.start, m.end) for m in extractor.extract(text).matches}
+    assert text[slice(*matches["RCT"])] == "RCT"
+    assert text[slice(*matches["Cox model"])] == "Cox"
+
+
+def test_plans_agree_ignores_words_containing_forms():
+    a = extract_plan_facts("Cohort study of myocardial infarction; Wilcoxon for secondary outcomes.")
+    b = extract_plan_facts("Use a cohort design.")
+    assert a.designs == {"Cohort study"}
+    assert not a.methods
+    assert plans_agree([a, b])
@@ -0,0 +1,75 @@
+"""
+ACS-Mentor V3.0 - Handoff Graph Tests
+
+Compiling sequential_handoff input_from declarations: Kahn order with
+route-order tie breaking, undeclared specialists, cycles and the
+critical path.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import os
+import sys
+
+import yaml
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.handoff_graph import HandoffGraph
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           ".acs_mentor", "multi_agent_config.yaml")
+
+
+def plan(graph, route):
+    return [(step.specialist, step.depends_on) for step in graph.compile(route)]
+
+
+def test_configured_workflow():
+    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+        graph = HandoffGraph.from_config(yaml.safe_load(f))
+
+    assert plan(graph, ["Strategy-Advisor", "Design-Specialist", "Stats-Specialist", "Writing-Specialist"]) == [
+        ("Strategy-Advisor", []),
+        ("Design-Specialist", ["Strategy-Advisor"]),
+        ("Stats-Specialist", ["Design-Specialist"]),
+        ("Writing-Specialist", ["Design-Specialist", "Stats-Specialist"]),
+    ]
+    # Inputs outside the route are dropped
+    assert plan(graph, ["Stats-Specialist", "Writing-Specialist"]) == [
+        ("Stats-Specialist", []),
+        ("Writing-Specialist", ["Stats-Specialist"]),
+    ]
+
+
+def test_kahn_order_follows_dependencies_not_route_order():
+    graph = HandoffGraph({'A': ['B'], 'B': [], 'C': []})
+    assert plan(graph, ["A", "B", "C"]) == [("B", []), ("C", []), ("A", ["B"])]
+    assert graph.critical_path_length(["A", "B", "C"]) == 2
+
+
+def test_independent_specialists_share_a_level():
+    graph = HandoffGraph({'Design': [], 'Stats': [], 'Writing': ['Design', 'Stats']})
+    assert graph.critical_path_length(["Design", "Stats", "Writing"]) == 2
+    assert graph.critical_path_length(["Design", "Stats"]) == 1
+    assert graph.critical_path_length([]) == 0
+
+
+def test_undeclared_specialist_waits_for_everyone_before_it():
+    graph = HandoffGraph({'A': []})
+    assert plan(graph, ["A", "X", "A"]) == [("A", []), ("X", ["A"])]
+
+
+def test_cycle_falls_back_to_a_chain(capsys):
+    graph = HandoffGraph({'A': ['B'], 'B': ['A'], 'C': []})
+    assert plan(graph, ["A", "B", "C"]) == [("A", []), ("B", ["A"]), ("C", ["A", "B"])]
+    assert "Cyclic input_from" in capsys.readouterr().out
+    assert graph.critical_path_length(["A", "B", "C"]) == 3
+
+
+def test_self_dependency_is_ignored():
+    graph = HandoffGraph({'A': ['A']})
+    assert plan(graph, ["A"]) == [("A", [])]
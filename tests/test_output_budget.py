@@ -0,0 +1,83 @@
+"""
+ACS-Mentor V3.0 - Output Budget Tests
+
+Per-call completion budgets: user level, complexity, depth preference,
+rounding and ceiling, and the history cap / truncation boost.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.output_budget import OutputBudgetPlanner
+
+SPECIALIST = "Stats-Specialist"
+
+
+@pytest.fixture
+def planner():
+    return OutputBudgetPlanner(
+        base_tokens={'novice': 700, 'intermediate': 1000, 'expert': 1400},
+        complexity_weight=0.8,
+        min_tokens=300,
+        step_tokens=100,
+        history_min_samples=10
+    )
+
+
+def tokens(planner, ceiling=4000, **context):
+    return planner.plan(SPECIALIST, context, ceiling).max_tokens
+
+
+def test_base_budget_by_user_level(planner):
+    assert tokens(planner, user_level='novice') == 700
+    assert tokens(planner, user_level='expert') == 1400
+    assert tokens(planner, user_level='unknown') == 1000
+
+
+def test_complexity_scales_around_midpoint(planner):
+    assert tokens(planner, complexity_score=0.0) == 600
+    assert tokens(planner, complexity_score=0.5) == 1000
+    assert tokens(planner, complexity_score=1.0) == 1400
+    assert tokens(planner, complexity_score=7) == 1400  # clamped to [0, 1]
+
+
+def test_depth_preference_from_context_or_profile(planner):
+    brief = planner.plan(SPECIALIST, {'response_depth_preference': 'Brief'}, 4000)
+    assert brief.max_tokens == 600 and brief.depth == 'brief' and brief.instruction
+    profile = {'project_context': {'user_profile': {'response_depth_preference': 'detailed'}}}
+    assert tokens(planner, **profile) == 1500
+    assert planner.depth_preference({'response_depth_preference': 'verbose'}) == 'standard'
+
+
+def test_rounding_floor_and_ceiling(planner):
+    assert tokens(planner, user_level='novice', complexity_score=0.37) == 700  # 627 rounded up
+    assert tokens(planner, ceiling=800) == 800
+    assert tokens(planner, user_level='novice', complexity_score=0.0, response_depth_preference='brief') == 300
+
+
+def test_history_caps_budget_near_usual_length(planner):
+    for _ in range(9):
+        planner.record(SPECIALIST, 200, planner.plan(SPECIALIST, {}, 4000))
+    assert tokens(planner) == 1000  # not enough samples yet
+    planner.record(SPECIALIST, 200, planner.plan(SPECIALIST, {}, 4000))
+    assert tokens(planner) == 300  # 200 × 1.2 headroom, raised to min_tokens
+    assert tokens(planner, user_level='expert') == 1400  # history is per user level
+    assert planner.stats()[f"{SPECIALIST}/intermediate"]['samples'] == 10
+
+
+def test_truncated_answers_raise_the_budget(planner):
+    for _ in range(10):
+        budget = planner.plan(SPECIALIST, {}, 4000)
+        planner.record(SPECIALIST, budget.max_tokens, budget)  # every answer hit its budget
+    # Within the history cap (1000 × 1.2), then × 1.3 while answers keep getting cut off
+    assert tokens(planner) == 1300
+    assert planner.stats()[f"{SPECIALIST}/intermediate"]['truncated_share'] == 1.0
@@ -0,0 +1,215 @@
+"""
+ACS-Mentor V3.0 - Resilience Tests
+
+Circuit breaker states (half-open trial, release, trial deadline), hedged
+calls and hedge delays, and the coordinator's retry / speculation
+accounting on the fake LLM backend.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.coordinator import ACSCoordinator
+from agents.resilience import CircuitBreaker, ResiliencePolicy, SpecialistUnavailable, hedged
+from agents.tracing import InMemorySpanSink
+
+RESET = 0.05
+
+
+def opened_breaker(failure_threshold=2):
+    breaker = CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=RESET)
+    for _ in range(failure_threshold):
+        breaker.record_failure()
+    return breaker
+
+
+# ============================================================================
+# CircuitBreaker
+# ============================================================================
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    assert [breaker.record_failure() for _ in range(4)] == [False, False, True, False]
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.record_failure() is False and breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_lets_one_trial_through():
+    breaker = opened_breaker()
+    time.sleep(RESET * 1.2)
+    assert breaker.allow() is True
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow() is False  # the trial is still in flight
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+
+def test_failed_trial_reopens():
+    breaker = opened_breaker()
+    time.sleep(RESET * 1.2)
+    assert breaker.allow()
+    assert breaker.record_failure() is True
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+
+def test_released_trial_frees_the_slot():
+    breaker = opened_breaker()
+    time.sleep(RESET * 1.2)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN and breaker.allow()
+
+
+def test_abandoned_trial_is_replaced_after_deadline():
+    breaker = opened_breaker()
+    time.sleep(RESET * 1.2)
+    assert breaker.allow()
+    assert not breaker.allow()
+    time.sleep(RESET * 1.2)
+    assert breaker.allow()
+
+
+# ============================================================================
+# Hedging
+# ============================================================================
+
+def make_call(delays, errors=None):
+    """start() for hedged(): attempt i sleeps delays[i] and returns i (or raises errors[i])"""
+    started = []
+
+    async def start():
+        i = len(started)
+        started.append(i)
+        await asyncio.sleep(delays[i])
+        if errors and errors[i] is not None:
+            raise errors[i]
+        return i
+
+    return start, started
+
+
+def test_hedge_wins_when_first_attempt_is_slow():
+    start, started = make_call([1.0, 0.01])
+    result, attempts = asyncio.run(hedged(start, delay=0.05, max_hedges=1))
+    assert (result, attempts) == (1, 2)
+
+
+def test_no_hedge_without_delay():
+    start, started = make_call([0.05, 0.0])
+    assert asyncio.run(hedged(start, delay=None)) == (0, 1)
+    assert started == [0]
+
+
+def test_fast_first_attempt_is_not_hedged():
+    start, started = make_call([0.0, 0.0])
+    assert asyncio.run(hedged(start, delay=0.5)) == (0, 1)
+
+
+def test_hedged_raises_last_error_when_all_fail():
+    start, _ = make_call([0.1, 0.0], errors=[ValueError("first"), ValueError("second")])
+    with pytest.raises(ValueError, match="first"):
+        asyncio.run(hedged(start, delay=0.02, max_hedges=1))
+
+
+def test_hedge_delay_follows_latency_percentile():
+    policy = ResiliencePolicy(hedge_min_samples=5, hedge_min_delay=0.5, hedge_initial_delay=2.0)
+    assert policy.hedge_delay("Stats-Specialist") == 2.0
+    for seconds in (1.0, 1.2, 1.4, 1.6, 3.0):
+        policy.tracker("Stats-Specialist").record(seconds)
+    assert policy.hedge_delay("Stats-Specialist") == 1.6
+    assert ResiliencePolicy(hedging_enabled=False).hedge_delay("Stats-Specialist") is None
+
+
+# ============================================================================
+# Coordinator accounting (fake LLM backend)
+# ============================================================================
+
+QUERY = "Which statistical test should I use for two groups?"
+
+
+def test_failing_specialist_retries_then_opens_circuit(fake_config):
+    coordinator = ACSCoordinator(fake_config(
+        fake={'failure_rate': 1.0},
+        parameters={
+            'performance': {'retry_on_failure': 2},
+            'resilience': {'backoff': {'base_seconds': 0.0, 'max_seconds': 0.0},
+                           'circuit_breaker': {'failure_threshold': 3, 'reset_timeout_seconds': 60}}
+        }
+    ))
+    name = "Stats-Specialist"
+
+    async def consult():
+        with coordinator.tracer.span('test') as span:
+            with pytest.raises(SpecialistUnavailable):
+                await coordinator._aconsult_resilient(name, QUERY, {'user_level': 'intermediate'})
+        return span
+
+    span = asyncio.run(consult())
+    breaker = coordinator.resilience.breaker(name)
+    assert breaker.state == CircuitBreaker.OPEN and breaker.failures == 3
+    assert span.attributes['retries'] == {name: 2}
+    assert span.attributes['circuit_opened'] == [name]
+
+
+def test_claimed_speculation_is_accounted_once(fake_config):
+    coordinator = ACSCoordinator(fake_config(latency_seconds=0.2, parameters={
+        'routing': {'fast_path_enabled': False, 'cache': {'enabled': False}},
+        'speculation': {'enabled': True, 'max_specialists': 1, 'min_prepass_confidence': 0.0}
+    }))
+    context = {'user_level': 'intermediate', 'project_context': None}
+
+    async def run():
+        speculative = coordinator._start_speculation(QUERY, 'intermediate', None, context)
+        assert len(speculative) == 1
+        name = next(iter(speculative))
+        await asyncio.sleep(0.05)  # routing would be running here
+        output = await coordinator._aconsult_resilient(name, QUERY, context, speculative)
+        return name, output, speculative
+
+    name, output, speculative = asyncio.run(run())
+    assert output.specialist_name == name and speculative == {}
+    # The speculation's own call, then the routed call claiming it (no fresh LLM call)
+    spans = coordinator.tracer.get_sink(InMemorySpanSink).spans
+    assert [span.attributes['speculative'] for span in spans if span.name == 'specialist'] == [False, True]
+    breaker = coordinator.resilience.breaker(name)
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+    # One latency sample: the speculation's own run time, not the wait after the claim
+    samples = list(coordinator.resilience.tracker(name)._samples)
+    assert len(samples) == 1 and samples[0] >= 0.2
+
+
+def test_no_speculation_while_circuit_is_not_closed(fake_config):
+    coordinator = ACSCoordinator(fake_config(parameters={
+        'routing': {'fast_path_enabled': False, 'cache': {'enabled': False}},
+        'speculation': {'enabled': True, 'max_specialists': 4, 'min_prepass_confidence': 0.0}
+    }))
+    context = {'user_level': 'intermediate', 'project_context': None}
+
+    async def predicted():
+        return coordinator._start_speculation(QUERY, 'intermediate', None, context)
+
+    names = list(asyncio.run(predicted()))
+    assert names
+    for name in names:
+        breaker = coordinator.resilience.breaker(name)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+    assert asyncio.run(predicted()) == {}
@@ -0,0 +1,96 @@
+"""
+ACS-Mentor V3.0 - Routing Cache Tests
+
+Key normalization, TTL expiry and LRU eviction of cached routing
+decisions.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import agents.routing_cache as routing_cache
+from agents.coordinator import CollaborationPattern, RoutingDecision
+from agents.routing_cache import RoutingCache
+
+
+class Clock:
+    """Stand-in for time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(routing_cache, 'time', SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def decision(*specialists):
+    return RoutingDecision(
+        pattern=CollaborationPattern.SINGLE if len(specialists) == 1 else CollaborationPattern.PARALLEL,
+        specialists=list(specialists),
+        reasoning="test",
+        complexity_score=0.5,
+        domains=[]
+    )
+
+
+def test_key_ignores_case_whitespace_and_trailing_punctuation():
+    key = RoutingCache.make_key("What  sample size do I need?", "novice")
+    assert RoutingCache.make_key("what sample size do i need", "novice") == key
+    assert RoutingCache.make_key("What sample size do I need？", "novice") == key
+    assert RoutingCache.make_key("What sample size do I need?", "expert") != key
+    assert RoutingCache.make_key("What sample size do I need?", "novice", {'design': "RCT"}) != key
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = RoutingCache(max_entries=10, ttl_seconds=60)
+    cache.put("k", decision("Stats-Specialist"))
+    clock.now += 59
+    assert cache.peek("k") and cache.get("k").specialists == ["Stats-Specialist"]
+    clock.now += 1
+    assert not cache.peek("k") and cache.get("k") is None
+    assert cache.stats()['expirations'] == 1 and cache.stats()['size'] == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = RoutingCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", decision("Design-Specialist"))
+    cache.put("b", decision("Stats-Specialist"))
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", decision("Writing-Specialist"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_peek_does_not_refresh_lru_order(clock):
+    cache = RoutingCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", decision("Design-Specialist"))
+    cache.put("b", decision("Stats-Specialist"))
+    assert cache.peek("a")
+    cache.put("c", decision("Writing-Specialist"))
+    assert cache.get("a") is None
+
+
+def test_callers_get_copies(clock):
+    cache = RoutingCache()
+    cache.put("k", decision("Design-Specialist", "Stats-Specialist"))
+    cache.get("k").specialists.append("Writing-Specialist")
+    assert cache.get("k").specialists == ["Design-Specialist", "Stats-Specialist"]
+    assert cache.stats()['hits'] == 2 and cache.stats()['hit_rate'] == 1.0
@@ -0,0 +1,154 @@
+"""
+ACS-Mentor V3.0 - Coordinator Service Tests
+
+Endpoints of the resident service on the fake LLM backend, and its
+behaviour under more concurrent slow queries than admission control lets
+run: health checks still answer, and excess queries are queued or shed
+with 503.
+
+Author: ACS-Mentor Development Team
+Version: 3.0.0
+Date: 2025-11-17
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.service import CoordinatorService
+
+
+@pytest.fixture
+def make_service(fake_config):
+    services = []
+
+    def make(latency_seconds=0.0, admission=None, max_pending=None):
+        service = CoordinatorService(
+            fake_config(latency_seconds, admission),
+            host="127.0.0.1", port=0, max_pending=max_pending, probe=False
+        )
+        service.start()
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.stop()
+
+
+def request(service, path, body=None, timeout=30):
+    """(status, headers, raw body) of one HTTP request"""
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    req = urllib.request.Request(f"http://127.0.0.1:{service.port}{path}", data=data,
+                                 headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def concurrently(calls):
+    """Run calls on threads at once; results in call order"""
+    results = [None] * len(calls)
+
+    def run(i, call):
+        results[i] = call()
+
+    threads = [threading.Thread(target=run, args=(i, call)) for i, call in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(60)
+    return results
+
+
+QUESTIONS = [
+    "What sample size do I need for a two-arm RCT?",
+    "Should I use a t-test or Mann-Whitney for skewed outcomes?",
+    "How do I report a cohort study with STROBE?",
+    "Which confounders belong in my propensity score model?",
+]
+
+
+def test_health_endpoints(make_service):
+    service = make_service()
+    status, _, body = request(service, '/healthz')
+    assert status == 200 and json.loads(body)['status'] == 'alive'
+
+    status, _, body = request(service, '/readyz')
+    readiness = json.loads(body)
+    assert status == 200 and readiness['ready']
+    assert readiness['requests'] == {'pending': 0, 'max_pending': service.max_pending}
+
+
+def test_request_errors(make_service):
+    service = make_service()
+    assert request(service, '/nowhere')[0] == 404
+    assert request(service, '/coordinate', {'user_message': "  "})[0] == 400
+    assert request(service, '/batch', {'queries': []})[0] == 400
+
+
+def test_coordinate_stream_and_batch(make_service):
+    service = make_service()
+    status, _, body = request(service, '/coordinate', {'user_message': QUESTIONS[0], 'user_id': "u1"})
+    assert status == 200 and json.loads(body)['output']
+
+    status, headers, body = request(service, '/stream', {'user_message': QUESTIONS[1]})
+    events = [json.loads(line) for line in body.decode('utf-8').splitlines()]
+    assert status == 200 and headers['Content-Type'].startswith('application/x-ndjson')
+    assert events[0]['type'] == 'routing' and events[-1]['type'] == 'done'
+
+    status, _, body = request(service, '/batch', {'queries': QUESTIONS[:2] + QUESTIONS[:1]})
+    results = json.loads(body)['results']
+    assert status == 200 and len(results) == 3
+    assert all(result['output'] for result in results)
+
+
+def test_excess_queries_are_queued_or_shed_while_health_answers(make_service):
+    # One query runs, one waits in the admission queue, the rest are shed
+    service = make_service(latency_seconds=0.3, admission={
+        'max_concurrent': 1, 'per_user_max_concurrent': 4, 'max_queue': 1, 'queue_timeout_seconds': 20
+    })
+
+    def coordinate(question):
+        return lambda: request(service, '/coordinate', {'user_message': question})
+
+    def health():
+        time.sleep(0.1)  # while the queries are in progress
+        started = time.monotonic()
+        status = request(service, '/healthz')[0]
+        return status, time.monotonic() - started
+
+    *responses, (health_status, health_seconds) = concurrently(
+        [coordinate(question) for question in QUESTIONS] + [health]
+    )
+
+    statuses = sorted(status for status, _, _ in responses)
+    assert statuses == [200, 200, 503, 503]
+    for status, headers, body in responses:
+        if status == 503:
+            assert 'Retry-After' in headers
+            assert json.loads(body)['error'] == "queue_full"
+    assert health_status == 200 and health_seconds < 0.25
+    assert service.coordinator.admission.metrics()['shed']['queue_full'] == 2
+
+
+def test_pending_request_bound(make_service):
+    service = make_service(latency_seconds=0.3, max_pending=1)
+    responses = concurrently([
+        lambda: request(service, '/coordinate', {'user_message': QUESTIONS[0]}),
+        lambda: (time.sleep(0.1), request(service, '/coordinate', {'user_message': QUESTIONS[1]}))[1]
+    ])
+    assert [status for status, _, _ in responses] == [200, 503]
+    assert json.loads(responses[1][2])['error'] == "too many pending requests"
+    assert request(service, '/readyz')[0] == 200